@@ -5,41 +5,84 @@
 # modify it under the terms of the MIT License; see LICENSE file for more
 # details.
 #
-"""Support any workflows on Invenio record."""
+"""Support any workflows on Invenio record.
+
+The public names are imported lazily on first access, so importing the package
+(for example to get ``current_oarepo_workflows``) does not pull in the permission
+and request machinery with all its invenio dependencies.
+"""
 
 from __future__ import annotations
 
+import importlib
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
-from oarepo_workflows.services.permissions import (
-    FromRecordWorkflow,
-    IfInState,
-    WorkflowPermission,
-    WorkflowRecordPermissionPolicyMixin,
-)
+if TYPE_CHECKING:
+    from oarepo_workflows.services.permissions import (
+        FromRecordWorkflow,
+        IfInState,
+        WorkflowPermission,
+        WorkflowRecordPermissionPolicyMixin,
+    )
 
-from .base import Workflow
-from .proxies import current_oarepo_workflows
-from .requests import (
-    AutoApprove,
-    AutoRequest,
-    WorkflowRequest,
-    WorkflowRequestEscalation,
-    WorkflowRequestPolicy,
-    WorkflowTransitions,
-)
+    from .base import Workflow
+    from .notifiers import StateChangeSubscription, subscribe
+    from .proxies import current_oarepo_workflows
+    from .requests import (
+        AutoApprove,
+        AutoRequest,
+        WorkflowRequest,
+        WorkflowRequestEscalation,
+        WorkflowRequestPolicy,
+        WorkflowTransitions,
+    )
 
 try:
     __version__ = version("oarepo-workflows")
 except PackageNotFoundError:
     __version__ = "0.0.0dev0+unknown"
 
+_lazy_imports = {
+    "AutoApprove": "oarepo_workflows.requests",
+    "AutoRequest": "oarepo_workflows.requests",
+    "FromRecordWorkflow": "oarepo_workflows.services.permissions",
+    "IfInState": "oarepo_workflows.services.permissions",
+    "StateChangeSubscription": "oarepo_workflows.notifiers",
+    "Workflow": "oarepo_workflows.base",
+    "WorkflowPermission": "oarepo_workflows.services.permissions",
+    "WorkflowRecordPermissionPolicyMixin": "oarepo_workflows.services.permissions",
+    "WorkflowRequest": "oarepo_workflows.requests",
+    "WorkflowRequestEscalation": "oarepo_workflows.requests",
+    "WorkflowRequestPolicy": "oarepo_workflows.requests",
+    "WorkflowTransitions": "oarepo_workflows.requests",
+    "current_oarepo_workflows": "oarepo_workflows.proxies",
+    "subscribe": "oarepo_workflows.notifiers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public names on first access."""
+    try:
+        module_name = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the module attributes including the lazily imported ones."""
+    return sorted({*globals(), *_lazy_imports})
+
 
 __all__ = (
     "AutoApprove",
     "AutoRequest",
     "FromRecordWorkflow",
     "IfInState",
+    "StateChangeSubscription",
     "Workflow",
     "WorkflowPermission",
     "WorkflowRecordPermissionPolicyMixin",
@@ -48,4 +91,5 @@ __all__ = (
     "WorkflowRequestPolicy",
     "WorkflowTransitions",
     "current_oarepo_workflows",
+    "subscribe",
 )
@@ -12,9 +12,10 @@ from __future__ import annotations
 import dataclasses
 from typing import TYPE_CHECKING, Any, Protocol
 
-from . import WorkflowRecordPermissionPolicyMixin
+from flask import current_app, has_app_context
+
 from .requests import WorkflowRequestPolicy
-from .services.permissions import BaseWorkflowPermissionPolicy
+from .services.permissions import BaseWorkflowPermissionPolicy, WorkflowRecordPermissionPolicyMixin
 
 if TYPE_CHECKING:
     from flask_babel import LazyString
@@ -52,7 +53,18 @@ class Workflow:
 
     @property
     def permission_policy_with_requests_cls(self) -> type[BaseWorkflowPermissionPolicy]:
-        """Return a permission policy class merged with permissions for creating requests and events."""
+        """Return a permission policy class merged with permissions for creating requests and events.
+
+        The class is kept in the caches of the workflows extension, one per generation
+        of the workflow configuration, so that the compiled permissions are kept between calls.
+        """
+        ext = current_app.extensions.get("oarepo-workflows") if has_app_context() else None
+        if ext is None:
+            return self.create_permission_policy_with_requests_cls()
+        return ext.get_permission_policy_cls(self)  # type: ignore[no-any-return]
+
+    def create_permission_policy_with_requests_cls(self) -> type[BaseWorkflowPermissionPolicy]:
+        """Create a new permission policy class merged with permissions for creating requests and events."""
         extra_permissions = {}
         for r in self.requests().requests:
             extra_permissions[f"can_{r.request_type.type_id}_create"] = (r.requester_generator,)
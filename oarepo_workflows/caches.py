@@ -0,0 +1,136 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Lazily initialized, lock protected caches of the workflows extension.
+
+The extension is instantiated once per Flask application, so each application
+has its own :class:`CacheManager` and the cached values never leak between
+applications (for example in tests that create several apps).
+
+Example:
+    .. code-block:: python
+
+        class OARepoWorkflows:
+            def __init__(self):
+                self.caches = CacheManager()
+
+            @cached_in_manager
+            def workflow_by_code(self) -> dict[str, Workflow]:
+                return {w.code: w for w in self.app.config["WORKFLOWS"]}
+
+        # drop all cached values, they are recomputed on the next access
+        ext.invalidate()
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Protocol, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class CacheManager:
+    """Thread-safe store of lazily computed values."""
+
+    def __init__(self, generation: int = 0) -> None:
+        """Create an empty cache manager.
+
+        :param generation: generation of the workflow configuration the values are computed from
+        """
+        self.generation = generation
+        # reentrant, as a value might be computed from other cached values
+        self._lock = threading.RLock()
+        self._values: dict[str, Any] = {}
+        self._invalidation_callbacks: list[Callable[[], None]] = []
+
+    def get(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Return the cached value, computing it by the factory if it has not been computed yet.
+
+        The factory is called at most once per invalidation, even if the value is
+        requested from several threads at the same time.
+        """
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        with self._lock:
+            try:
+                return self._values[name]
+            except KeyError:
+                value = factory()
+                self._values[name] = value
+                return value
+
+    def set(self, name: str, value: Any) -> None:
+        """Store a value, replacing the cached one."""
+        with self._lock:
+            self._values[name] = value
+
+    def is_cached(self, name: str) -> bool:
+        """Return True if the value has been computed."""
+        return name in self._values
+
+    def invalidate(self, *names: str) -> None:
+        """Drop the cached values.
+
+        :param names: names of the values to drop, if not given, all the values are dropped
+                      and the invalidation callbacks are called
+        """
+        with self._lock:
+            if names:
+                for name in names:
+                    self._values.pop(name, None)
+                return
+            self._values.clear()
+            for callback in self._invalidation_callbacks:
+                callback()
+
+    def on_invalidate(self, callback: Callable[[], None]) -> None:
+        """Register a callback called when all the values are invalidated.
+
+        Use it to clear caches kept outside of the manager.
+        """
+        self._invalidation_callbacks.append(callback)
+
+    def successor(self) -> CacheManager:
+        """Return an empty cache manager of the next generation sharing the invalidation callbacks."""
+        ret = CacheManager(self.generation + 1)
+        ret._invalidation_callbacks = list(self._invalidation_callbacks)  # noqa: SLF001
+        return ret
+
+
+class _HasCacheManager(Protocol):
+    caches: CacheManager
+
+
+class cached_in_manager[T]:  # noqa: N801 - used as a decorator, named as functools.cached_property
+    """Replacement of ``functools.cached_property`` storing the value in the instance's cache manager."""
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        """Wrap the function computing the value."""
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Remember the attribute name, used as the key in the cache manager."""
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> cached_in_manager[T]: ...
+
+    @overload
+    def __get__(self, instance: _HasCacheManager, owner: type | None = None) -> T: ...
+
+    def __get__(self, instance: _HasCacheManager | None, owner: type | None = None) -> T | cached_in_manager[T]:
+        """Return the cached value."""
+        if instance is None:
+            return self
+        return instance.caches.get(self.name, lambda: self.func(instance))  # type: ignore[no-any-return]
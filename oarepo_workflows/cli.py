@@ -0,0 +1,165 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Command line interface of oarepo-workflows."""
+
+from __future__ import annotations
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from oarepo_workflows.proxies import current_oarepo_workflows
+
+
+@click.group()
+def workflows() -> None:
+    """Workflow management commands."""
+
+
+@workflows.command("reload")
+@with_appcontext
+def reload() -> None:
+    """Reload the workflow configuration returned by WORKFLOWS_LOADER.
+
+    The reload is announced through invenio-cache. Running web and Celery workers
+    with WORKFLOWS_RELOAD_CHECK_INTERVAL and WORKFLOWS_LOADER set call the loader
+    before their next request or task, without being restarted.
+    """
+    if current_app.config.get("WORKFLOWS_LOADER") is None:
+        raise click.UsageError(
+            "WORKFLOWS_LOADER is not set, running workers would re-read their own unchanged WORKFLOWS. "
+            "Restart the workers instead."
+        )
+    generation = current_oarepo_workflows.reload_workflows()
+    click.echo(f"Workflows reloaded, generation {generation}.")
+
+
+@workflows.command("backfill-state-columns")
+@click.option("--batch-size", default=1000, show_default=True, help="Number of rows updated in one transaction.")
+@with_appcontext
+def backfill_state_columns(batch_size: int) -> None:
+    """Fill the state and state_timestamp columns from the JSON of the records.
+
+    The columns are added by the opt-in workflows_state_columns_preset. Run the
+    command after the columns have been created and the records already exist.
+    """
+    from oarepo_workflows.records.backfill import (
+        STATE_COLUMNS,
+        backfill_columns,
+        models_with_columns,
+        state_column_values,
+    )
+
+    for model_cls in models_with_columns(*STATE_COLUMNS):
+        table_name = model_cls.__table__.name  # type: ignore[attr-defined]
+        updated = backfill_columns(
+            model_cls,
+            state_column_values,
+            batch_size=batch_size,
+            progress=lambda processed, updated, name=table_name: click.echo(
+                f"{name}: {processed} processed, {updated} updated"
+            ),
+        )
+        click.secho(f"{table_name}: {updated} rows updated", bold=True)
+
+
+@workflows.command("backfill-parent-workflow")
+@click.option("--workflow", "workflow_code", help="Workflow to set, defaults to WORKFLOWS_DEFAULT_WORKFLOW.")
+@click.option("--service", "service_id", help="Update only parents of this service.")
+@click.option("--batch-size", default=1000, show_default=True, help="Number of parents updated in one transaction.")
+@click.option("--resume-after", help="Id of the last parent processed by an interrupted run, requires --service.")
+@with_appcontext
+def backfill_parent_workflow(
+    workflow_code: str | None, service_id: str | None, batch_size: int, resume_after: str | None
+) -> None:
+    """Set the workflow of all parent records that do not have one.
+
+    The records and drafts of the updated parents are sent to the bulk indexing
+    queue, run "invenio index run" to process it. When the command finishes,
+    set WORKFLOWS_ALL_PARENTS_HAVE_WORKFLOW = True to simplify search filters.
+    """
+    from oarepo_workflows.records.backfill import backfill_parent_workflow, workflow_services
+
+    if resume_after is not None and service_id is None:
+        raise click.UsageError("--resume-after is an id of a parent of a single service, --service must be given.")
+    workflow_code = workflow_code or current_oarepo_workflows.default_workflow.code
+    if workflow_code not in current_oarepo_workflows.workflow_by_code:
+        raise click.BadParameter(f"Workflow {workflow_code} does not exist.", param_hint="--workflow")
+
+    services = [s for s in workflow_services() if service_id is None or s.config.service_id == service_id]
+    if not services:
+        raise click.BadParameter(f"Service {service_id} does not have workflows.", param_hint="--service")
+    for service in services:
+        service_id = service.config.service_id
+        updated = backfill_parent_workflow(
+            service,
+            workflow_code,
+            batch_size=batch_size,
+            resume_after=resume_after,
+            progress=lambda updated, queued, last_id, name=service_id: click.echo(
+                f"{name}: {updated} parents updated, {queued} records queued for indexing, last id {last_id}"
+            ),
+        )
+        click.secho(f"{service_id}: {updated} parents updated", bold=True)
+
+
+@workflows.command("change-workflow")
+@click.argument("target_workflow")
+@click.option("--from", "source_workflow", help="Change only records in this workflow.")
+@click.option("--parent-id", "parent_ids", multiple=True, help="Change only records of this parent, repeatable.")
+@click.option("--service", "service_id", help="Change only records of this service.")
+@click.option("--batch-size", default=1000, show_default=True, help="Number of parents updated in one transaction.")
+@click.option("--resume-after", help="Id of the last parent processed by an interrupted run, requires --service.")
+@with_appcontext
+def change_workflow(  # noqa: PLR0913
+    target_workflow: str,
+    source_workflow: str | None,
+    parent_ids: tuple[str, ...],
+    service_id: str | None,
+    batch_size: int,
+    resume_after: str | None,
+) -> None:
+    """Move records to TARGET_WORKFLOW.
+
+    The records and drafts of the changed parents are sent to the bulk indexing
+    queue, run "invenio index run" to process it.
+    """
+    from oarepo_workflows.errors import InvalidWorkflowError
+    from oarepo_workflows.records.backfill import workflow_services
+    from oarepo_workflows.services.workflow_change import WorkflowChangeProgress, change_workflow_many
+
+    if not source_workflow and not parent_ids:
+        raise click.UsageError("Either --from or --parent-id must be given.")
+    if resume_after is not None and service_id is None:
+        raise click.UsageError("--resume-after is an id of a parent of a single service, --service must be given.")
+
+    def report(name: str, progress: WorkflowChangeProgress) -> None:
+        click.echo(
+            f"{name}: {progress.processed} parents processed, {progress.changed} changed, "
+            f"{progress.queued} records queued for indexing, last id {progress.last_id}"
+        )
+
+    services = [s for s in workflow_services() if service_id is None or s.config.service_id == service_id]
+    if not services:
+        raise click.BadParameter(f"Service {service_id} does not have workflows.", param_hint="--service")
+    for service in services:
+        name = service.config.service_id
+        try:
+            result = change_workflow_many(
+                service,
+                target_workflow,
+                source_workflow=source_workflow,
+                parent_ids=parent_ids or None,
+                batch_size=batch_size,
+                resume_after=resume_after,
+                progress=lambda progress, name=name: report(name, progress),
+            )
+        except InvalidWorkflowError as e:
+            raise click.BadParameter(str(e), param_hint="TARGET_WORKFLOW") from e
+        click.secho(f"{name}: {result.changed} parents changed", bold=True)
@@ -114,3 +114,29 @@ class UnregisteredRequestTypeError(Exception):
     def description(self) -> str:
         """Exception's description."""
         return f"Request type {self.request_type} is not registered."
+
+
+class StateChangeConflictError(Exception):
+    """Exception raised when a compare-and-swap state change finds the record changed concurrently."""
+
+    def __init__(
+        self,
+        record: Record | dict,
+        expected_state: str | None,
+        expected_revision: int | None,
+        new_state: str,
+    ) -> None:
+        """Initialize the exception."""
+        self.record = record
+        self.expected_state = expected_state
+        self.expected_revision = expected_revision
+        self.new_state = new_state
+        super().__init__(self.description)
+
+    @property
+    def description(self) -> str:
+        """Exception's description."""
+        return (
+            f"State of {_format_record(self.record)} can not be changed to {self.new_state}, "
+            f"it is no longer in state {self.expected_state} at revision {self.expected_revision}."
+        )
@@ -9,18 +9,29 @@
 
 from __future__ import annotations
 
+import copy
 import importlib.metadata
-from functools import cached_property
+import logging
+import threading
+import time
+import uuid
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, cast
 
+from invenio_base.utils import obj_or_import_string
 from invenio_records_resources.services.uow import unit_of_work
+from invenio_search.engine import dsl
 
-from oarepo_workflows import current_oarepo_workflows
+from oarepo_workflows.caches import CacheManager, cached_in_manager
 from oarepo_workflows.errors import (
+    EventTypeNotInWorkflowError,
     InvalidWorkflowError,
     MissingWorkflowError,
+    RequestTypeNotInWorkflowError,
     UnregisteredRequestTypeError,
 )
+from oarepo_workflows.metrics import WorkflowMetrics
+from oarepo_workflows.proxies import current_oarepo_workflows
 from oarepo_workflows.services.action import (
     ActionNeedService,
     ActionNeedServiceConfig,
@@ -36,6 +47,8 @@ from oarepo_workflows.services.multiple_entities import (
 from oarepo_workflows.services.uow import StateChangeOperation
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from flask import Flask
     from flask_principal import Identity
     from invenio_db.uow import UnitOfWork
@@ -45,8 +58,22 @@ if TYPE_CHECKING:
         StateChangedNotifier,
         Workflow,
     )
+    from oarepo_workflows.notifiers import NotifierDispatch, NotifierGuard
     from oarepo_workflows.records.systemfields.workflow import WithWorkflow
+    from oarepo_workflows.requests import WorkflowRequest
+    from oarepo_workflows.requests.auto_request import AutoRequestIndex
     from oarepo_workflows.requests.events import WorkflowEvent
+    from oarepo_workflows.requests.state_graph import StateGraph
+    from oarepo_workflows.services.permissions import BaseWorkflowPermissionPolicy
+    from oarepo_workflows.services.permissions.compiler import DecisionTables
+    from oarepo_workflows.services.permissions.explain import PermissionExplanation
+
+log = logging.getLogger(__name__)
+
+RELOAD_TOKEN_CACHE_KEY = "oarepo_workflows:reload_token"
+"""Key in invenio-cache holding the token of the last workflow reload."""
+
+_UNSEEN = object()
 
 
 class OARepoWorkflows:
@@ -73,6 +100,25 @@ class OARepoWorkflows:
 
         app.config.setdefault("WORKFLOWS", ext_config.WORKFLOWS)
         app.config.setdefault("WORKFLOWS_DEFAULT_WORKFLOW", ext_config.WORKFLOWS_DEFAULT_WORKFLOW)
+        app.config.setdefault("WORKFLOWS_AUTO_REQUESTS_ENABLED", ext_config.WORKFLOWS_AUTO_REQUESTS_ENABLED)
+        app.config.setdefault("WORKFLOWS_METRICS_ENABLED", ext_config.WORKFLOWS_METRICS_ENABLED)
+        app.config.setdefault("WORKFLOWS_METRICS_TOKEN", ext_config.WORKFLOWS_METRICS_TOKEN)
+        app.config.setdefault("WORKFLOWS_WARMUP", ext_config.WORKFLOWS_WARMUP)
+        app.config.setdefault("WORKFLOWS_WARMUP_ROLES", ext_config.WORKFLOWS_WARMUP_ROLES)
+        app.config.setdefault("WORKFLOWS_ROLE_ID_CACHE_TTL", ext_config.WORKFLOWS_ROLE_ID_CACHE_TTL)
+        app.config.setdefault("WORKFLOWS_LOADER", ext_config.WORKFLOWS_LOADER)
+        app.config.setdefault("WORKFLOWS_ACCESS_DENORMALIZATION", ext_config.WORKFLOWS_ACCESS_DENORMALIZATION)
+        app.config.setdefault("WORKFLOWS_ALL_PARENTS_HAVE_WORKFLOW", ext_config.WORKFLOWS_ALL_PARENTS_HAVE_WORKFLOW)
+        app.config.setdefault(
+            "WORKFLOWS_STATE_CHANGE_COMPARE_AND_SWAP", ext_config.WORKFLOWS_STATE_CHANGE_COMPARE_AND_SWAP
+        )
+        app.config.setdefault("WORKFLOWS_RELOAD_CHECK_INTERVAL", ext_config.WORKFLOWS_RELOAD_CHECK_INTERVAL)
+        app.config.setdefault("WORKFLOWS_NOTIFIER_BUDGETS", ext_config.WORKFLOWS_NOTIFIER_BUDGETS)
+        app.config.setdefault("WORKFLOWS_NOTIFIER_DEFAULT_BUDGET", ext_config.WORKFLOWS_NOTIFIER_DEFAULT_BUDGET)
+        app.config.setdefault("WORKFLOWS_NOTIFIER_MAX_STRIKES", ext_config.WORKFLOWS_NOTIFIER_MAX_STRIKES)
+        app.config.setdefault("WORKFLOWS_NOTIFIER_OVERRUN_ACTION", ext_config.WORKFLOWS_NOTIFIER_OVERRUN_ACTION)
+        app.config.setdefault("WORKFLOWS_NOTIFIER_COOLDOWN", ext_config.WORKFLOWS_NOTIFIER_COOLDOWN)
+        app.config.setdefault("WORKFLOWS_NOTIFIER_ISOLATE_ERRORS", ext_config.WORKFLOWS_NOTIFIER_ISOLATE_ERRORS)
         app.config.setdefault("REQUESTS_ALLOWED_RECEIVERS", []).extend(ext_config.WORKFLOWS_ALLOWED_REQUEST_RECEIVERS)
         app.config.setdefault("NOTIFICATION_RECIPIENTS_RESOLVERS", {}).update(
             ext_config.NOTIFICATION_RECIPIENTS_RESOLVERS
@@ -82,7 +128,141 @@ class OARepoWorkflows:
         """Flask application initialization."""
         # noinspection PyAttributeOutsideInit
         self.app = app
+        # noinspection PyAttributeOutsideInit
+        self.caches = CacheManager()
+        # noinspection PyAttributeOutsideInit
+        self.metrics = WorkflowMetrics()
+        # noinspection PyAttributeOutsideInit
+        self.warmup_report: Mapping[str, float] = MappingProxyType({})
+        # noinspection PyAttributeOutsideInit
+        self._reload_lock = threading.Lock()
+        # noinspection PyAttributeOutsideInit
+        self._reload_token: str | None | object = _UNSEEN
+        # noinspection PyAttributeOutsideInit
+        self._last_reload_check = 0.0
         app.extensions["oarepo-workflows"] = self
+        if app.config.get("WORKFLOWS_RELOAD_CHECK_INTERVAL") is not None:
+            if app.config.get("WORKFLOWS_LOADER") is None:
+                log.warning(
+                    "WORKFLOWS_RELOAD_CHECK_INTERVAL is set without WORKFLOWS_LOADER, reloads announced "
+                    "by other processes would re-read the unchanged WORKFLOWS of this process and are ignored."
+                )
+            else:
+                app.before_request(self.check_reload)
+                self._connect_task_reload_check()
+        if app.config.get("WORKFLOWS_METRICS_ENABLED"):
+            from oarepo_workflows.services.permissions.instrumentation import (
+                describe_instrumentation_metrics,
+                install_instrumentation,
+            )
+
+            describe_instrumentation_metrics(self.metrics)
+            # the wrappers record to the metrics of the application serving the request
+            install_instrumentation()
+
+    def invalidate(self, *names: str) -> None:
+        """Drop cached workflow structures, they are rebuilt on the next access.
+
+        Call this after the workflows in the configuration have been changed.
+
+        :param names: names of the cached properties to drop (for example ``workflow_by_code``),
+                      if not given, all the caches including the compiled permissions are dropped
+        """
+        self.caches.invalidate(*names)
+
+    @property
+    def generation(self) -> int:
+        """Return generation of the workflow configuration, incremented by each reload."""
+        return self.caches.generation
+
+    def reload_workflows(self, workflows: list[Workflow] | None = None, publish: bool = True) -> int:
+        """Reload the workflow configuration without restarting the process.
+
+        A new generation of the caches (policies, compiled permissions, request indexes,
+        query filters) is built and warmed up aside and then swapped in atomically,
+        so the running requests see either the old or the new configuration, never a mix.
+
+        :param workflows:   new workflows. If not given, they are taken from ``WORKFLOWS_LOADER``
+                            or re-read from the ``WORKFLOWS`` configuration
+        :param publish:     announce the reload through invenio-cache, so that other processes
+                            checking ``WORKFLOWS_RELOAD_CHECK_INTERVAL`` reload as well. Requires
+                            ``WORKFLOWS_LOADER``, without it the other processes could only re-read
+                            their own unchanged ``WORKFLOWS``, so the reload is not announced
+        :return: generation of the new configuration
+        """
+        from oarepo_workflows.signals import workflows_reloaded
+
+        with self._reload_lock:
+            caches = self.caches.successor()
+            if workflows is not None:
+                caches.set("record_workflows", list(workflows))
+
+            staged = copy.copy(self)
+            staged.caches = caches
+            # the staged extension builds everything in the successor caches, the current
+            # generation keeps serving requests from its own policy classes and decision tables
+            staged.warm_up(roles=self.app.config["WORKFLOWS_WARMUP_ROLES"])
+
+            if workflows is not None:
+                self.app.config["WORKFLOWS"] = workflows
+            self.caches = caches
+            self.warmup_report = staged.warmup_report
+
+            if publish:
+                if self.app.config.get("WORKFLOWS_LOADER") is None:
+                    log.warning("WORKFLOWS_LOADER is not set, the reload is not announced to other processes.")
+                else:
+                    self._publish_reload()
+        log.info("Workflows reloaded, generation %s", caches.generation)
+        workflows_reloaded.send(self.app, generation=caches.generation)
+        return caches.generation
+
+    def _connect_task_reload_check(self) -> None:
+        """Check for announced reloads before each Celery task as well, tasks do not run ``before_request``."""
+        from celery.signals import task_prerun
+
+        # weak reference, the handler goes away with the extension
+        task_prerun.connect(self._check_reload_before_task)
+
+    def _check_reload_before_task(self, *args: Any, **kwargs: Any) -> None:
+        """Celery ``task_prerun`` handler, the application context of the task is not pushed yet."""
+        with self.app.app_context():
+            self.check_reload()
+
+    def check_reload(self) -> None:
+        """Reload the workflows if another process has announced a reload.
+
+        Registered as ``before_request`` handler and Celery ``task_prerun`` handler if both
+        ``WORKFLOWS_RELOAD_CHECK_INTERVAL`` and ``WORKFLOWS_LOADER`` are set,
+        the shared cache is consulted at most once per the interval.
+        """
+        now = time.monotonic()
+        if now - self._last_reload_check < (self.app.config.get("WORKFLOWS_RELOAD_CHECK_INTERVAL") or 0):
+            return
+        self._last_reload_check = now
+        shared_cache = self._shared_cache()
+        if shared_cache is None:
+            return
+        token = shared_cache.get(RELOAD_TOKEN_CACHE_KEY)
+        if self._reload_token is _UNSEEN:
+            # the configuration has just been loaded, so it is up to date with the announced reload
+            self._reload_token = token
+        elif token != self._reload_token:
+            self._reload_token = token
+            self.reload_workflows(publish=False)
+
+    def _publish_reload(self) -> None:
+        shared_cache = self._shared_cache()
+        if shared_cache is None:
+            return
+        token = uuid.uuid4().hex
+        shared_cache.set(RELOAD_TOKEN_CACHE_KEY, token, timeout=0)
+        self._reload_token = token
+
+    def _shared_cache(self) -> Any:
+        """Return cache shared by all processes or None if invenio-cache is not installed."""
+        cache_ext = self.app.extensions.get("invenio-cache")
+        return cache_ext.cache if cache_ext is not None else None
 
     def init_services(self) -> None:
         """Initialize workflow services."""
@@ -91,12 +271,248 @@ class OARepoWorkflows:
         self.multiple_recipients_service = MultipleEntitiesEntityService(MultipleEntitiesEntityServiceConfig())
         self.action_need_service = ActionNeedService(ActionNeedServiceConfig())
 
-    @cached_property
+    @cached_in_manager
     def workflow_by_code(self) -> dict[str, Workflow]:
         """Return workflow by workflow code."""
-        return {w.code: w for w in self.app.config["WORKFLOWS"]}
+        return {w.code: w for w in self.record_workflows}
+
+    @cached_in_manager
+    def workflow_requests_by_type(self) -> Mapping[str, Mapping[str, WorkflowRequest]]:
+        """Return an immutable index of workflow requests.
+
+        The index maps request type id to a mapping of workflow code -> WorkflowRequest,
+        so that it is possible to look up which workflows define a given request type.
+
+        :raises UnregisteredRequestTypeError: if a workflow uses a request type that is not registered
+        """
+        index: dict[str, dict[str, WorkflowRequest]] = {}
+        for workflow in self.record_workflows:
+            for workflow_request in workflow.requests().requests:
+                try:
+                    request_type_id = workflow_request.request_type.type_id
+                except KeyError as e:
+                    raise UnregisteredRequestTypeError(workflow_request._request_type) from e  # noqa SLF001
+                index.setdefault(request_type_id, {})[workflow.code] = workflow_request
+        return MappingProxyType(
+            {request_type_id: MappingProxyType(by_workflow) for request_type_id, by_workflow in index.items()}
+        )
+
+    @cached_in_manager
+    def workflow_allowed_events(self) -> Mapping[tuple[str, str], Mapping[str, WorkflowEvent]]:
+        """Return an immutable index of allowed events of workflow requests.
+
+        The index maps (workflow code, request type id) to the default workflow events
+        merged with the events of the workflow request. The merged mappings raise
+        EventTypeNotInWorkflowError on unknown keys.
+        """
+        from oarepo_workflows.requests.events import WorkflowEvents
+
+        default_events = self.default_workflow_events
+        return MappingProxyType(
+            {
+                (workflow_code, request_type_id): MappingProxyType(
+                    WorkflowEvents({**default_events, **workflow_request.events})
+                )
+                for request_type_id, by_workflow in self.workflow_requests_by_type.items()
+                for workflow_code, workflow_request in by_workflow.items()
+            }
+        )
+
+    def get_allowed_events(self, workflow_code: str, request_type_id: str) -> Mapping[str, WorkflowEvent]:
+        """Return the allowed events of the workflow request, including the default workflow events.
+
+        :param workflow_code:   code of the workflow
+        :param request_type_id: id of the request type
+        :raises RequestTypeNotInWorkflowError: if the workflow does not define the request type
+        """
+        try:
+            return self.workflow_allowed_events[(workflow_code, request_type_id)]
+        except KeyError as e:
+            raise RequestTypeNotInWorkflowError(request_type_id, workflow_code) from e
+
+    @cached_in_manager
+    def workflow_request_allowed_events(
+        self,
+    ) -> Mapping[int, tuple[WorkflowRequest, Mapping[str, WorkflowEvent]]]:
+        """Return the allowed events of the configured workflow requests.
+
+        The index maps id of the WorkflowRequest definition to the definition and its allowed events,
+        it is used by ``WorkflowRequest.allowed_events``.
+        """
+        return MappingProxyType(
+            {
+                id(workflow_request): (workflow_request, self.workflow_allowed_events[(workflow_code, request_type_id)])
+                for request_type_id, by_workflow in self.workflow_requests_by_type.items()
+                for workflow_code, workflow_request in by_workflow.items()
+            }
+        )
+
+    @cached_in_manager
+    def workflow_events_by_key(self) -> Mapping[tuple[str, str, str], WorkflowEvent]:
+        """Return an immutable index of workflow events.
+
+        The index maps (workflow code, request type id, event type id) to WorkflowEvent.
+        It contains the allowed events of the requests, that is including the default workflow events.
+        """
+        return MappingProxyType(
+            {
+                (workflow_code, request_type_id, event_type_id): event
+                for (workflow_code, request_type_id), events in self.workflow_allowed_events.items()
+                for event_type_id, event in events.items()
+            }
+        )
+
+    def get_workflow_request(self, workflow_code: str, request_type_id: str) -> WorkflowRequest:
+        """Return the workflow request for the given workflow code and request type id.
+
+        :param workflow_code:   code of the workflow
+        :param request_type_id: id of the request type
+        :raises RequestTypeNotInWorkflowError: if the workflow does not define the request type
+        """
+        try:
+            return self.workflow_requests_by_type[request_type_id][workflow_code]
+        except KeyError as e:
+            raise RequestTypeNotInWorkflowError(request_type_id, workflow_code) from e
+
+    def get_workflow_event(self, workflow_code: str, request_type_id: str, event_type_id: str) -> WorkflowEvent:
+        """Return the workflow event for the given workflow code, request type id and event type id.
+
+        :param workflow_code:   code of the workflow
+        :param request_type_id: id of the request type
+        :param event_type_id:   id of the event type
+        :raises EventTypeNotInWorkflowError: if the workflow request does not define the event type
+        """
+        try:
+            return self.workflow_events_by_key[(workflow_code, request_type_id, event_type_id)]
+        except KeyError as e:
+            raise EventTypeNotInWorkflowError(event_type_id) from e
+
+    @cached_in_manager
+    def workflow_query_filters(self) -> Mapping[str, dsl.query.Query]:
+        """Return queries matching records of each workflow, keyed by workflow code.
+
+        Records without a workflow are matched by the query of the default workflow,
+        unless ``WORKFLOWS_ALL_PARENTS_HAVE_WORKFLOW`` is set.
+        """
+        default_workflow_code = self.app.config.get("WORKFLOWS_DEFAULT_WORKFLOW")
+        all_parents_have_workflow = self.app.config.get("WORKFLOWS_ALL_PARENTS_HAVE_WORKFLOW")
+        queries = {}
+        for workflow in self.record_workflows:
+            query = dsl.Q("term", **{"parent.workflow": workflow.code})
+            if workflow.code == default_workflow_code and not all_parents_have_workflow:
+                query = query | ~dsl.Q("exists", field="parent.workflow")
+            queries[workflow.code] = query
+        return MappingProxyType(queries)
+
+    @cached_in_manager
+    def auto_request_index(self) -> AutoRequestIndex:
+        """Return the index of workflow requests that are created automatically on state change."""
+        from oarepo_workflows.requests.auto_request import AutoRequestIndex
+
+        return AutoRequestIndex.from_workflows(self.record_workflows)
+
+    @cached_in_manager
+    def state_graphs(self) -> Mapping[str, StateGraph]:
+        """Return the state graph of each workflow, keyed by workflow code."""
+        from oarepo_workflows.requests.state_graph import StateGraph
+
+        requests_by_workflow: dict[str, dict[str, WorkflowRequest]] = {}
+        for request_type_id, by_workflow in self.workflow_requests_by_type.items():
+            for workflow_code, workflow_request in by_workflow.items():
+                requests_by_workflow.setdefault(workflow_code, {})[request_type_id] = workflow_request
+        return MappingProxyType(
+            {
+                workflow.code: StateGraph.from_workflow(workflow, requests_by_workflow.get(workflow.code, {}))
+                for workflow in self.record_workflows
+            }
+        )
+
+    def get_state_graph(self, workflow_code: str) -> StateGraph:
+        """Return the state graph of the workflow.
+
+        :param workflow_code:   code of the workflow
+        :raises InvalidWorkflowError: if the workflow does not exist
+        """
+        try:
+            return self.state_graphs[workflow_code]
+        except KeyError as e:
+            raise InvalidWorkflowError(f"Workflow {workflow_code} doesn't exist in the configuration.") from e
+
+    @cached_in_manager
+    def permission_policy_classes(self) -> Mapping[str, type[BaseWorkflowPermissionPolicy]]:
+        """Return permission policy classes merged with permissions for requests, keyed by workflow code."""
+        return MappingProxyType(
+            {workflow.code: workflow.create_permission_policy_with_requests_cls() for workflow in self.record_workflows}
+        )
+
+    def get_permission_policy_cls(self, workflow: Workflow) -> type[BaseWorkflowPermissionPolicy]:
+        """Return the permission policy class of the workflow merged with permissions for requests.
+
+        Workflows of the configuration share one class per generation, so that their compiled
+        permissions are kept between calls. Other workflows get a new class on each call.
+        """
+        if self.workflow_by_code.get(workflow.code) is workflow:
+            return self.permission_policy_classes[workflow.code]
+        return workflow.create_permission_policy_with_requests_cls()
+
+    @cached_in_manager
+    def decision_tables(self) -> DecisionTables:
+        """Return compiled decision tables of the permission policies of this generation."""
+        from oarepo_workflows.services.permissions.compiler import DecisionTables
+
+        return DecisionTables()
+
+    def warm_up(self, roles: bool = False) -> Mapping[str, float]:
+        """Eagerly build all lazily initialized workflow structures.
+
+        Builds the request, event and auto-request indexes, state graphs, workflow query filters,
+        allowed events of workflow requests, per-workflow permission policy classes
+        and their compiled permissions in the caches of this extension, so that the first requests served
+        by a fresh worker do not pay for the initialization.
 
-    @cached_property
+        :param roles:   resolve ids of roles used in ``UserWithRole`` generators as well,
+                        requires the database to be available
+        :return: time in seconds spent warming up each workflow, keyed by workflow code.
+                 The report is also available as ``warmup_report``.
+        """
+        from oarepo_workflows.services.permissions.analysis import iter_generators
+        from oarepo_workflows.services.permissions.compiler import get_decision_table
+        from oarepo_workflows.services.permissions.generators import UserWithRole, get_role_id
+
+        self.workflow_requests_by_type  # noqa B018
+        self.workflow_allowed_events  # noqa B018
+        self.workflow_request_allowed_events  # noqa B018
+        self.workflow_events_by_key  # noqa B018
+        self.auto_request_index  # noqa B018
+        self.state_graphs  # noqa B018
+        self.workflow_query_filters  # noqa B018
+
+        report: dict[str, float] = {}
+        role_names: set[str] = set()
+        for workflow in self.record_workflows:
+            start = time.perf_counter()
+            policy_cls = self.get_permission_policy_cls(workflow)
+            for attr_name in dir(policy_cls):
+                if not attr_name.startswith("can_"):
+                    continue
+                get_decision_table(policy_cls, attr_name[len("can_") :], self.decision_tables)
+                role_names.update(
+                    g.role_name for g in iter_generators(getattr(policy_cls, attr_name)) if isinstance(g, UserWithRole)
+                )
+            report[workflow.code] = time.perf_counter() - start
+            log.info("Workflow %s warmed up in %.3f ms", workflow.code, report[workflow.code] * 1000)
+
+        if roles:
+            try:
+                for role_name in role_names:
+                    get_role_id(role_name)
+            except Exception:
+                log.exception("Could not warm up role ids, they will be resolved lazily.")
+
+        self.warmup_report = MappingProxyType(report)
+        return self.warmup_report
+
+    @cached_in_manager
     def state_changed_notifiers(self) -> list[StateChangedNotifier]:
         """Return a list of state changed notifiers.
 
@@ -108,6 +524,23 @@ class OARepoWorkflows:
         group_name = "oarepo_workflows.state_changed_notifiers"
         return [ep.load() for ep in importlib.metadata.entry_points(group=group_name)]
 
+    @cached_in_manager
+    def notifier_dispatch(self) -> NotifierDispatch:
+        """Return the index of state changed notifiers by the state changes they are subscribed to."""
+        from oarepo_workflows.notifiers import NotifierDispatch
+
+        return NotifierDispatch(self.state_changed_notifiers)
+
+    @cached_in_manager
+    def notifier_guard(self) -> NotifierGuard:
+        """Return the guard timing the state changed notifiers and tripping the slow or failing ones.
+
+        The breaker state of the notifiers is reset when the workflows are reloaded.
+        """
+        from oarepo_workflows.notifiers import NotifierGuard
+
+        return NotifierGuard.from_config(self.app, self.metrics)
+
     @unit_of_work()
     def set_state(  # noqa: PLR0913
         self,
@@ -118,6 +551,9 @@ class OARepoWorkflows:
         uow: UnitOfWork,
         commit: bool = True,
         notify_later: bool = True,
+        compare_and_swap: bool | None = None,
+        expected_state: str | None = None,
+        expected_revision: int | None = None,
         **kwargs: Any,
     ) -> None:
         """Set a new state on a record.
@@ -129,7 +565,13 @@ class OARepoWorkflows:
         :param uow:         unit of work
         :param commit:      whether to commit the change
         :param notify_later: run the notification in post commit hook, not immediately
+        :param compare_and_swap: check at commit time that the record has not been changed concurrently,
+                            defaults to ``WORKFLOWS_STATE_CHANGE_COMPARE_AND_SWAP``
+        :param expected_state: state the record must be in, implies compare_and_swap
+        :param expected_revision: revision the record must have, implies compare_and_swap
         :param kwargs:      additional keyword arguments
+        :raises StateChangeConflictError: in compare-and-swap mode, if the record is not in the expected
+                            state or revision or has been changed concurrently
         """
         uow.register(
             StateChangeOperation(
@@ -139,25 +581,38 @@ class OARepoWorkflows:
                 *args,
                 commit_record=commit,
                 notify_later=notify_later,
+                compare_and_swap=compare_and_swap,
+                expected_state=expected_state,
+                expected_revision=expected_revision,
                 extra_kwargs=kwargs,
             )
         )
 
-    @property
+    @cached_in_manager
     def record_workflows(self) -> list[Workflow]:
-        """Return a dictionary of available record workflows."""
-        return self.app.config["WORKFLOWS"]  # type: ignore[no-any-return]
+        """Return a list of available record workflows.
 
-    @property
-    def default_workflow_events(self) -> dict[str, WorkflowEvent]:
-        """Return a dictionary of default workflow events.
+        The workflows are returned by ``WORKFLOWS_LOADER`` if it is configured,
+        otherwise they are taken from the ``WORKFLOWS`` configuration.
+        """
+        loader = self.app.config.get("WORKFLOWS_LOADER")
+        if loader is not None:
+            return list(obj_or_import_string(loader)())
+        return list(self.app.config["WORKFLOWS"])
+
+    @cached_in_manager
+    def default_workflow_events(self) -> Mapping[str, WorkflowEvent]:
+        """Return an immutable mapping of default workflow events.
 
         Default workflow events are those that can be added to any request.
-        The dictionary is taken from the configuration key `DEFAULT_WORKFLOW_EVENTS`.
+        The mapping is taken from the configuration key `DEFAULT_WORKFLOW_EVENTS`
+        and is read only once.
         """
-        return cast(
-            "dict[str, WorkflowEvent]",
-            self.app.config.get("DEFAULT_WORKFLOW_EVENTS", {}),
+        return MappingProxyType(
+            cast(
+                "dict[str, WorkflowEvent]",
+                self.app.config.get("DEFAULT_WORKFLOW_EVENTS", {}),
+            )
         )
 
     @property
@@ -172,6 +627,33 @@ class OARepoWorkflows:
                 f"to the default workflow."
             ) from exc
 
+    def explain(
+        self,
+        identity: Identity,
+        action: str,
+        record: Record | dict[str, Any],
+        **context: Any,
+    ) -> PermissionExplanation:
+        """Explain how a permission is evaluated for a record.
+
+        The returned explanation contains the workflow and permission policy used,
+        needs and excludes of each generator, branches taken by conditional generators,
+        outcomes of RequireAll composites and time spent in each generator.
+
+        :param identity:  identity the permission is evaluated for
+        :param action:    action, for example "read"
+        :param record:    record (or its data) whose workflow is used
+        :param context:   additional context passed to the permission policy
+        """
+        from oarepo_workflows.services.permissions.explain import explain_permission
+
+        workflow = self.get_workflow(record)
+        if isinstance(record, dict):
+            context.setdefault("data", record)
+        else:
+            context.setdefault("record", record)
+        return explain_permission(workflow, identity, action, **context)
+
     def get_workflow(self, record: Record | dict[str, Any] | Any) -> Workflow:
         """Get the workflow for a record.
 
@@ -220,7 +702,9 @@ class OARepoWorkflows:
 def finalize_app(app: Flask) -> None:
     """Finalize the application.
 
-    This function registers the auto-approve service in the records resources registry.
+    This function registers the auto-approve service in the records resources registry,
+    builds the index of workflow requests and events and the state graphs and, if WORKFLOWS_WARMUP is set,
+    warms up the workflows.
     It is called from invenio_base.api_finalize_app entry point.
 
     :param app: Flask application
@@ -244,10 +728,11 @@ def finalize_app(app: Flask) -> None:
         service_id=ext.action_need_service.config.service_id,
     )
 
-    for workflow in ext.record_workflows:
-        for r in workflow.requests().requests:
-            try:
-                r.request_type  # noqa B018
-            # TODO: ugly; how to test?
-            except KeyError as e:
-                raise UnregisteredRequestTypeError(r._request_type) from e  # noqa SLF001
+    # building the index checks that all request types used in workflows are registered
+    ext.workflow_requests_by_type  # noqa B018
+    ext.workflow_events_by_key  # noqa B018
+    ext.auto_request_index  # noqa B018
+    ext.state_graphs  # noqa B018
+
+    if app.config["WORKFLOWS_WARMUP"]:
+        ext.warm_up(roles=app.config["WORKFLOWS_WARMUP_ROLES"])
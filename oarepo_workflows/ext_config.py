@@ -25,6 +25,94 @@ WORKFLOWS_ALLOWED_REQUEST_RECEIVERS = ["multiple", "action_need"]
 
 WORKFLOWS_DEFAULT_WORKFLOW = "individual"
 
+WORKFLOWS_AUTO_REQUESTS_ENABLED = False
+"""If True, requests whose requesters contain AutoRequest are created automatically when a record changes state."""
+
+WORKFLOWS_METRICS_ENABLED = False
+"""If True, permission generators are timed and the metrics are served at /workflows/metrics.
+
+When False, generators are not wrapped at all, so there is no runtime overhead.
+"""
+
+WORKFLOWS_METRICS_TOKEN = None
+"""Token that grants access to /workflows/metrics when sent as ``Authorization: Bearer <token>``.
+
+Without the token, the metrics can be read only by superusers.
+"""
+
+WORKFLOWS_WARMUP = True
+"""If True, permission policies, compiled permissions and indexes of all workflows are built at app finalization."""
+
+WORKFLOWS_WARMUP_ROLES = False
+"""If True, the warm-up also resolves ids of roles used in workflow permissions. Requires the database."""
+
+WORKFLOWS_ROLE_ID_CACHE_TTL = 60
+"""Seconds for which ids of roles used in ``UserWithRole`` generators are cached in invenio-cache.
+
+The cache is shared by all processes. Role changes made through the ORM clear the cached id
+immediately, bulk updates or changes made by other means are picked up when the id expires.
+"""
+
+WORKFLOWS_ALL_PARENTS_HAVE_WORKFLOW = False
+"""Set to True once all parent records have a workflow, see ``invenio workflows backfill-parent-workflow``.
+
+Search filters then do not need to match records without a workflow, which is an expensive
+negated ``exists`` query.
+"""
+
+WORKFLOWS_ACCESS_DENORMALIZATION = False
+"""If True, search filters of read actions use the permissions stored in the indexed documents.
+
+Requires ``workflows_access_preset`` in the model and all records to be reindexed.
+"""
+
+WORKFLOWS_STATE_CHANGE_COMPARE_AND_SWAP = False
+"""If True, state changes fail with ``StateChangeConflictError`` if the record has been changed concurrently.
+
+Can be overridden per call by the ``compare_and_swap`` argument of ``set_state``.
+"""
+
+WORKFLOWS_NOTIFIER_BUDGETS: dict[str, float] = {}
+"""Time budget in seconds of state changed notifiers, keyed by ``module:qualname`` of the notifier."""
+
+WORKFLOWS_NOTIFIER_DEFAULT_BUDGET = None
+"""Time budget in seconds of notifiers not listed in ``WORKFLOWS_NOTIFIER_BUDGETS``, None for no budget."""
+
+WORKFLOWS_NOTIFIER_MAX_STRIKES = 3
+"""Number of consecutive calls over the budget (or failed) after which the notifier is tripped.
+
+Failed calls count only if ``WORKFLOWS_NOTIFIER_ISOLATE_ERRORS`` is set, otherwise the error aborts the state change.
+"""
+
+WORKFLOWS_NOTIFIER_OVERRUN_ACTION = "defer"
+"""What happens to a tripped notifier.
+
+``defer`` runs it after the state change has been committed, in its own unit of work,
+``disable`` does not run it at all.
+"""
+
+WORKFLOWS_NOTIFIER_COOLDOWN = 300
+"""Seconds after which a tripped notifier is tried again inline, None to keep it tripped until reload."""
+
+WORKFLOWS_NOTIFIER_ISOLATE_ERRORS = False
+"""If True, errors of state changed notifiers are logged and do not abort the state change."""
+
+WORKFLOWS_LOADER = None
+"""Callable (or its import string) returning the list of workflows, used by ``reload_workflows``.
+
+If not set, the workflows are re-read from the ``WORKFLOWS`` configuration of the reloading process.
+Reloading other processes (``invenio workflows reload``, ``WORKFLOWS_RELOAD_CHECK_INTERVAL``) requires
+the loader, each process would otherwise re-read its own unchanged ``WORKFLOWS``.
+"""
+
+WORKFLOWS_RELOAD_CHECK_INTERVAL = None
+"""Interval in seconds between checks whether another process has reloaded the workflows.
+
+The reload is announced through invenio-cache, so that ``invenio workflows reload``
+reloads all running web and Celery workers, the check is done before each request and each task.
+Requires ``WORKFLOWS_LOADER``. If None, the check is disabled.
+"""
+
 NOTIFICATION_RECIPIENTS_RESOLVERS = {
     "action_need": lambda key, notification: ActionRecipient(key),  # noqa ARG005
 }
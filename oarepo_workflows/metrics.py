@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""In-process metrics of oarepo-workflows.
+
+Metrics are simple labelled counters kept in memory of the current process.
+They are rendered in the Prometheus text exposition format by the
+``/workflows/metrics`` endpoint and printed by ``invenio workflows metrics``.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+type Labels = tuple[tuple[str, str], ...]
+
+METRICS_PREFIX = "oarepo_workflows_"
+
+
+class WorkflowMetrics:
+    """Thread-safe collection of labelled counters."""
+
+    def __init__(self) -> None:
+        """Create an empty collection."""
+        self._lock = threading.Lock()
+        self._counters: defaultdict[str, dict[Labels, float]] = defaultdict(dict)
+        self._help: dict[str, str] = {}
+
+    def describe(self, name: str, help_text: str) -> None:
+        """Register a help text of a counter, shown in the Prometheus output."""
+        self._help[name] = help_text
+
+    def inc(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        """Increment a counter.
+
+        :param name:    name of the counter, without the ``oarepo_workflows_`` prefix
+        :param amount:  amount to add
+        :param labels:  labels of the counter
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            counter = self._counters[name]
+            counter[key] = counter.get(key, 0.0) + amount
+
+    def get(self, name: str, **labels: str) -> float:
+        """Return the value of a counter, 0 if it has not been incremented yet."""
+        return self._counters.get(name, {}).get(tuple(sorted(labels.items())), 0.0)
+
+    def samples(self, name: str) -> Mapping[Labels, float]:
+        """Return a snapshot of all samples of a counter."""
+        with self._lock:
+            return dict(self._counters.get(name, {}))
+
+    def names(self) -> list[str]:
+        """Return names of all counters that have at least one sample."""
+        with self._lock:
+            return sorted(self._counters)
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        with self._lock:
+            self._counters.clear()
+
+    def render_prometheus(self) -> str:
+        """Render the counters in the Prometheus text exposition format."""
+        return "".join(f"{line}\n" for line in self._prometheus_lines())
+
+    def _prometheus_lines(self) -> Iterator[str]:
+        for name in self.names():
+            full_name = f"{METRICS_PREFIX}{name}"
+            if name in self._help:
+                yield f"# HELP {full_name} {self._help[name]}"
+            yield f"# TYPE {full_name} counter"
+            for labels, value in sorted(self.samples(name).items()):
+                rendered_labels = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels)
+                yield f"{full_name}{{{rendered_labels}}} {_format_value(value)}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
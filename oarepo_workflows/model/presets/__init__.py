@@ -23,6 +23,11 @@ from oarepo_workflows.model.presets.records.parent_record_metadata import (
     WorkflowsParentRecordMetadataPreset,
 )
 from oarepo_workflows.model.presets.records.record import WorkflowsRecordPreset
+from oarepo_workflows.model.presets.records.state_columns import (
+    WorkflowsDraftMetadataStatePreset,
+    WorkflowsRecordMetadataStatePreset,
+)
+from oarepo_workflows.model.presets.records.workflow_access import WorkflowsAccessPreset
 from oarepo_workflows.model.presets.records.workflows_mapping import (
     WorkflowsMappingPreset,
 )
@@ -50,3 +55,14 @@ workflows_preset = [
     WorkflowsRecordSchemaPreset,
     WorkflowsServiceConfigPreset,
 ]
+
+workflows_state_columns_preset = [
+    WorkflowsRecordMetadataStatePreset,
+    WorkflowsDraftMetadataStatePreset,
+]
+"""Opt-in presets adding indexed ``state`` and ``state_timestamp`` columns to record and draft tables."""
+
+workflows_access_preset = [
+    WorkflowsAccessPreset,
+]
+"""Opt-in preset storing workflow read permissions in the indexed documents, see ``WORKFLOWS_ACCESS_DENORMALIZATION``."""
@@ -44,4 +44,4 @@ class WorkflowsParentRecordMetadataPreset(Preset):
         model: InvenioModel,
         dependencies: dict[str, Any],
     ) -> Generator[Customization]:
-        yield AddClassField("ParentRecordMetadata", "workflow", db.Column(String))
+        yield AddClassField("ParentRecordMetadata", "workflow", db.Column(String, index=True))
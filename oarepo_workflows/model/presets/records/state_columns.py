@@ -0,0 +1,67 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+
+"""Presets adding indexed state columns to record and draft metadata tables.
+
+The state and state timestamp are kept in the JSON of the record. With these
+presets they are also copied into dedicated, indexed columns by the state
+system fields, so that records can be selected by state in SQL. The presets
+are opt-in, add them to the model together with ``workflows_preset`` and fill
+the columns of existing records with ``invenio workflows backfill-state-columns``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+from invenio_db import db
+from oarepo_model.customizations import (
+    AddClassField,
+    Customization,
+)
+from oarepo_model.presets import Preset
+from sqlalchemy import DateTime, String
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from oarepo_model.builder import InvenioModelBuilder
+    from oarepo_model.model import InvenioModel
+
+
+class WorkflowsRecordMetadataStatePreset(Preset):
+    """Preset that adds state columns to the RecordMetadata class."""
+
+    modifies = ("RecordMetadata",)
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        yield AddClassField("RecordMetadata", "state", db.Column(String, index=True))
+        yield AddClassField("RecordMetadata", "state_timestamp", db.Column(DateTime, index=True))
+
+
+class WorkflowsDraftMetadataStatePreset(Preset):
+    """Preset that adds state columns to the DraftMetadata class."""
+
+    modifies = ("DraftMetadata",)
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        yield AddClassField("DraftMetadata", "state", db.Column(String, index=True))
+        yield AddClassField("DraftMetadata", "state_timestamp", db.Column(DateTime, index=True))
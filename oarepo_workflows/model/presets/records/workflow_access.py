@@ -0,0 +1,56 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+
+"""Preset adding denormalized workflow permissions to the indexed documents.
+
+The preset is opt-in. After the records have been reindexed, set
+``WORKFLOWS_ACCESS_DENORMALIZATION = True`` to use the indexed permissions
+in search filters.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+from oarepo_model.customizations import Customization, PatchJSONFile, PrependMixin
+from oarepo_model.presets import Preset
+
+from oarepo_workflows.records.systemfields.access import WorkflowAccessField
+from oarepo_workflows.services.permissions.access import access_mapping
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from oarepo_model.builder import InvenioModelBuilder
+    from oarepo_model.model import InvenioModel
+
+
+class WorkflowsAccessPreset(Preset):
+    """Preset adding the workflow access field to records and drafts."""
+
+    modifies = ("Record", "Draft", "record-mapping", "draft-mapping")
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        class WorkflowsAccessMixin:
+            """Mixin adding the workflow access field."""
+
+            workflow_access = WorkflowAccessField()
+
+        yield PrependMixin("Record", WorkflowsAccessMixin)
+        yield PrependMixin("Draft", WorkflowsAccessMixin)
+
+        mapping = {"mappings": {"properties": access_mapping()}}
+        yield PatchJSONFile("record-mapping", mapping)
+        yield PatchJSONFile("draft-mapping", mapping)
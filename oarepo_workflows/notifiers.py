@@ -0,0 +1,288 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Dispatch of state changes to the state changed notifiers.
+
+A notifier declares the transitions it is interested in by a ``subscriptions``
+attribute holding :class:`StateChangeSubscription` patterns. Each part of a pattern
+is either a value or None, which matches anything. Notifiers without the attribute
+are called for every state change.
+
+Example:
+    .. code-block:: python
+
+        @subscribe(StateChangeSubscription(to_state="published"))
+        def on_published(identity, record, previous_state, new_state, *args, uow, **kwargs):
+            ...
+
+The :class:`NotifierDispatch` indexes the subscriptions of all notifiers once,
+the notifiers matching a transition are then looked up by (workflow, previous state,
+new state) and the result is memoized.
+
+Each notifier call goes through the :class:`NotifierGuard` that records its latency
+and errors to the extension's metrics and checks it against the time budget of the notifier.
+A notifier exceeding its budget (or failing, if errors are isolated) too many times in a row is deferred
+after the commit of the state change or disabled for a while, see ``WORKFLOWS_NOTIFIER_*``
+configuration options.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+    from flask import Flask
+
+    from oarepo_workflows.base import StateChangedNotifier
+    from oarepo_workflows.metrics import WorkflowMetrics
+
+log = logging.getLogger(__name__)
+
+type OverrunAction = Literal["defer", "disable"]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StateChangeSubscription:
+    """Pattern of state changes a notifier is interested in, None matches anything."""
+
+    workflow: str | None = None
+    """Code of the workflow of the record."""
+
+    from_state: str | None = None
+    """State of the record before the change."""
+
+    to_state: str | None = None
+    """State of the record after the change."""
+
+    def matches(self, workflow: str | None, from_state: str | None, to_state: str | None) -> bool:
+        """Return True if the state change matches the pattern."""
+        return (
+            (self.workflow is None or self.workflow == workflow)
+            and (self.from_state is None or self.from_state == from_state)
+            and (self.to_state is None or self.to_state == to_state)
+        )
+
+
+def subscribe(
+    *subscriptions: StateChangeSubscription,
+) -> Callable[[StateChangedNotifier], StateChangedNotifier]:
+    """Decorate a notifier function or class with the state changes it is interested in."""
+
+    def wrapper(notifier: StateChangedNotifier) -> StateChangedNotifier:
+        notifier.subscriptions = (*getattr(notifier, "subscriptions", ()), *subscriptions)  # type: ignore[attr-defined]
+        return notifier
+
+    return wrapper
+
+
+def notifier_subscriptions(notifier: StateChangedNotifier) -> tuple[StateChangeSubscription, ...] | None:
+    """Return subscriptions of the notifier, None if it is interested in all state changes."""
+    subscriptions = getattr(notifier, "subscriptions", None)
+    if subscriptions is None:
+        return None
+    return tuple(subscriptions)
+
+
+class NotifierDispatch:
+    """Index of notifiers by the state changes they are subscribed to.
+
+    The notifiers matching a state change are always returned in the order
+    they have been registered in.
+    """
+
+    def __init__(self, notifiers: Iterable[StateChangedNotifier]) -> None:
+        """Index the subscriptions of the notifiers."""
+        self.notifiers: tuple[StateChangedNotifier, ...] = tuple(notifiers)
+        self._index: dict[tuple[str | None, str | None, str | None], set[int]] = {}
+        for position, notifier in enumerate(self.notifiers):
+            subscriptions = notifier_subscriptions(notifier)
+            if subscriptions is None:
+                subscriptions = (StateChangeSubscription(),)
+            for subscription in subscriptions:
+                key = (subscription.workflow, subscription.from_state, subscription.to_state)
+                self._index.setdefault(key, set()).add(position)
+        # the workflow of the record has to be looked up only if some notifier is subscribed to it
+        self.needs_workflow = any(workflow is not None for workflow, _, _ in self._index)
+        self._memo: dict[tuple[str | None, str | None, str | None], tuple[StateChangedNotifier, ...]] = {}
+
+    def notifiers_for(
+        self, workflow: str | None, from_state: str | None, to_state: str | None
+    ) -> Sequence[StateChangedNotifier]:
+        """Return the notifiers subscribed to the state change."""
+        key = (workflow, from_state, to_state)
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        positions: set[int] = set()
+        for index_key in itertools.product((workflow, None), (from_state, None), (to_state, None)):
+            positions |= self._index.get(index_key, set())
+        matching = tuple(self.notifiers[position] for position in sorted(positions))
+        # a lost race only computes the same tuple twice
+        self._memo[key] = matching
+        return matching
+
+
+def notifier_name(notifier: StateChangedNotifier) -> str:
+    """Return the name of the notifier used in metrics and budgets, ``module:qualname``."""
+    target = notifier if hasattr(notifier, "__qualname__") else type(notifier)
+    return f"{target.__module__}:{target.__qualname__}"
+
+
+@dataclasses.dataclass
+class NotifierHealth:
+    """Circuit breaker state of a notifier."""
+
+    strikes: int = 0
+    """Number of consecutive calls that exceeded the budget or failed with isolated errors."""
+
+    open_until: float | None = None
+    """Monotonic time until which the notifier is deferred or disabled, inf if disabled for good."""
+
+
+class NotifierGuard:
+    """Times the notifier calls, isolates their errors and trips the circuit breaker.
+
+    The budget can not interrupt a running notifier, it is checked after the call returns.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        metrics: WorkflowMetrics,
+        *,
+        budgets: Mapping[str, float] | None = None,
+        default_budget: float | None = None,
+        max_strikes: int = 3,
+        overrun_action: OverrunAction = "defer",
+        cooldown: float | None = 300.0,
+        isolate_errors: bool = False,
+    ) -> None:
+        """Create the guard.
+
+        :param metrics:         metrics the calls are recorded to
+        :param budgets:         time budget in seconds keyed by :func:`notifier_name`
+        :param default_budget:  budget of notifiers not listed in budgets, None for no budget
+        :param max_strikes:     number of consecutive over-budget or failed calls that trip the breaker,
+                                failures count only if errors are isolated
+        :param overrun_action:  ``defer`` runs the notifier after the commit of the state change,
+                                ``disable`` skips it
+        :param cooldown:        seconds after which a tripped notifier is tried again, None for never
+        :param isolate_errors:  log errors of notifiers instead of aborting the state change
+        """
+        if overrun_action not in ("defer", "disable"):
+            raise ValueError(f"Unknown notifier overrun action {overrun_action}.")
+        self.metrics = metrics
+        self.budgets = dict(budgets or {})
+        self.default_budget = default_budget
+        self.max_strikes = max_strikes
+        self.overrun_action = overrun_action
+        self.cooldown = cooldown
+        self.isolate_errors = isolate_errors
+        self._health: dict[str, NotifierHealth] = {}
+        self._lock = threading.Lock()
+
+        metrics.describe("notifier_calls_total", "Number of state changed notifier calls.")
+        metrics.describe("notifier_seconds_total", "Cumulative time spent in state changed notifiers.")
+        metrics.describe("notifier_errors_total", "Number of state changed notifier calls that raised an error.")
+        metrics.describe("notifier_over_budget_total", "Number of notifier calls that exceeded their time budget.")
+        metrics.describe("notifier_tripped_total", "Number of times a notifier has been deferred or disabled.")
+        metrics.describe("notifier_skipped_total", "Number of notifier calls skipped or deferred by the breaker.")
+
+    @classmethod
+    def from_config(cls, app: Flask, metrics: WorkflowMetrics) -> NotifierGuard:
+        """Create the guard from the ``WORKFLOWS_NOTIFIER_*`` configuration of the application."""
+        config = app.config
+        return cls(
+            metrics,
+            budgets=config.get("WORKFLOWS_NOTIFIER_BUDGETS"),
+            default_budget=config.get("WORKFLOWS_NOTIFIER_DEFAULT_BUDGET"),
+            max_strikes=config.get("WORKFLOWS_NOTIFIER_MAX_STRIKES", 3),
+            overrun_action=config.get("WORKFLOWS_NOTIFIER_OVERRUN_ACTION", "defer"),
+            cooldown=config.get("WORKFLOWS_NOTIFIER_COOLDOWN", 300.0),
+            isolate_errors=bool(config.get("WORKFLOWS_NOTIFIER_ISOLATE_ERRORS")),
+        )
+
+    def budget(self, name: str) -> float | None:
+        """Return the time budget of the notifier in seconds, None if it has no budget."""
+        return self.budgets.get(name, self.default_budget)
+
+    def health(self, name: str) -> NotifierHealth:
+        """Return a copy of the breaker state of the notifier."""
+        with self._lock:
+            return dataclasses.replace(self._health.get(name) or NotifierHealth())
+
+    def is_tripped(self, name: str) -> bool:
+        """Return True if calls of the notifier should be deferred or skipped now."""
+        health = self._health.get(name)
+        if health is None or health.open_until is None:
+            return False
+        if time.monotonic() < health.open_until:
+            return True
+        with self._lock:
+            # half-open: the next call is a trial, a single strike trips the breaker again
+            health.open_until = None
+            health.strikes = self.max_strikes - 1
+        return False
+
+    def skip(self, name: str) -> None:
+        """Record that a call of a tripped notifier has been deferred or skipped."""
+        self.metrics.inc("notifier_skipped_total", notifier=name, action=self.overrun_action)
+
+    def call(
+        self, notifier: StateChangedNotifier, *args: Any, isolate_errors: bool | None = None, **kwargs: Any
+    ) -> None:
+        """Call the notifier, recording its latency and errors.
+
+        :param isolate_errors: isolate the error of this call, None to use the configuration of the guard
+        :raises Exception: the error of the notifier unless errors are isolated
+        """
+        isolated = self.isolate_errors if isolate_errors is None else isolate_errors
+        name = notifier_name(notifier)
+        start = time.perf_counter()
+        try:
+            notifier(*args, **kwargs)
+        except Exception:
+            elapsed = time.perf_counter() - start
+            self._record(name, elapsed, failed=True, isolated=isolated)
+            if not isolated:
+                raise
+            log.exception("State changed notifier %s failed", name)
+        else:
+            self._record(name, time.perf_counter() - start, failed=False, isolated=isolated)
+
+    def _record(self, name: str, elapsed: float, *, failed: bool, isolated: bool) -> None:
+        self.metrics.inc("notifier_calls_total", notifier=name)
+        self.metrics.inc("notifier_seconds_total", elapsed, notifier=name)
+        if failed:
+            self.metrics.inc("notifier_errors_total", notifier=name)
+        budget = self.budget(name)
+        over_budget = budget is not None and elapsed > budget
+        if over_budget:
+            self.metrics.inc("notifier_over_budget_total", notifier=name)
+            log.warning("State changed notifier %s took %.3f s, budget is %.3f s", name, elapsed, budget)
+        if failed and not isolated:
+            # the error aborts the state change, deferring or disabling the notifier would bypass it
+            return
+        with self._lock:
+            health = self._health.setdefault(name, NotifierHealth())
+            if not (failed or over_budget):
+                health.strikes = 0
+                return
+            health.strikes += 1
+            if health.strikes < self.max_strikes or health.open_until is not None:
+                return
+            health.open_until = time.monotonic() + self.cooldown if self.cooldown is not None else float("inf")
+        self.metrics.inc("notifier_tripped_total", notifier=name, action=self.overrun_action)
+        log.warning("State changed notifier %s tripped, action %s", name, self.overrun_action)
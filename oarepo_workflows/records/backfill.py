@@ -0,0 +1,208 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Backfill of dedicated database columns.
+
+The columns are updated with plain SQL UPDATE statements, so the version
+(revision) of the records is not changed and no ETags are invalidated.
+Records affected by a change of their parents are reindexed through the bulk
+indexing queue of their service.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from invenio_db import db
+from invenio_records_resources.proxies import current_service_registry
+from sqlalchemy import select, update
+
+from oarepo_workflows.records.systemfields.state import parse_state_timestamp
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+STATE_COLUMNS = ("state", "state_timestamp")
+
+
+def models_with_columns(*columns: str) -> list[type]:
+    """Return record metadata models that have all the columns and a JSON column."""
+    ret = []
+    for mapper in db.Model.registry.mappers:
+        table = getattr(mapper.class_, "__table__", None)
+        if table is not None and "json" in table.columns and all(c in table.columns for c in columns):
+            ret.append(mapper.class_)
+    return sorted(ret, key=lambda m: m.__table__.name)
+
+
+def state_column_values(data: Mapping[str, Any]) -> dict[str, Any]:
+    """Return values of the state columns for the JSON of a record."""
+    return {
+        "state": data.get("state"),
+        "state_timestamp": parse_state_timestamp(data.get("state_timestamp")),
+    }
+
+
+def backfill_columns(
+    model_cls: type,
+    values: Callable[[Mapping[str, Any]], Mapping[str, Any]],
+    batch_size: int = 1000,
+    progress: Callable[[int, int], None] | None = None,
+) -> int:
+    """Fill dedicated columns of a record metadata table from the JSON of the records.
+
+    The table is processed in batches ordered by the primary key, each batch
+    is committed separately, so the backfill can be interrupted and run again.
+
+    :param model_cls:   record metadata model
+    :param values:      function returning column values for the JSON of a record
+    :param batch_size:  number of rows processed in one transaction
+    :param progress:    called after each batch with the number of processed and updated rows
+    :return: number of updated rows
+    """
+    table = model_cls.__table__  # type: ignore[attr-defined]
+    # the columns to select are the keys returned by the values function
+    columns = [table.c[name] for name in values({})]
+    processed = updated = 0
+    last_id = None
+    while True:
+        query = select(table.c.id, table.c.json, *columns).order_by(table.c.id).limit(batch_size)
+        if last_id is not None:
+            query = query.where(table.c.id > last_id)
+        rows = db.session.execute(query).all()
+        if not rows:
+            break
+        for row in rows:
+            if row.json is None:
+                # deleted record
+                continue
+            changed = {name: value for name, value in values(row.json).items() if getattr(row, name) != value}
+            if changed:
+                db.session.execute(update(table).where(table.c.id == row.id).values(**changed))
+                updated += 1
+        db.session.commit()
+        processed += len(rows)
+        last_id = rows[-1].id
+        if progress is not None:
+            progress(processed, updated)
+    return updated
+
+
+def workflow_services() -> list[Any]:
+    """Return record services whose parent records have the workflow column.
+
+    If several services share the same parent model, only the first one is returned.
+    """
+    ret = []
+    seen: set[type] = set()
+    for service in current_service_registry._services.values():  # noqa: SLF001
+        record_cls = getattr(getattr(service, "config", None), "record_cls", None)
+        parent_model = getattr(getattr(record_cls, "parent_record_cls", None), "model_cls", None)
+        table = getattr(parent_model, "__table__", None)
+        if table is None or "workflow" not in table.columns or parent_model in seen:
+            continue
+        seen.add(parent_model)  # type: ignore[arg-type]
+        ret.append(service)
+    return ret
+
+
+def reindex_children(service: Any, parent_ids: Iterable[Any]) -> int:
+    """Send records and drafts of the parents to the bulk indexing queue of the service.
+
+    :return: number of queued records and drafts
+    """
+    parent_ids = list(parent_ids)
+    queued = 0
+    children = [(service.config.record_cls, service.indexer)]
+    draft_cls = getattr(service.config, "draft_cls", None)
+    if draft_cls is not None:
+        children.append((draft_cls, service.draft_indexer))
+    for record_cls, indexer in children:
+        table = record_cls.model_cls.__table__
+        ids = (
+            db.session.execute(select(table.c.id).where(table.c.parent_id.in_(parent_ids), table.c.json.isnot(None)))
+            .scalars()
+            .all()
+        )
+        if ids:
+            indexer.bulk_index([str(record_id) for record_id in ids])
+            queued += len(ids)
+    return queued
+
+
+def interrupted_batch(table: Any, resume_after: Any, pending: Any, done: Any) -> list[Any]:
+    """Return ids of parents that an interrupted run might have committed but not queued for indexing.
+
+    The interrupted batch consisted of the first parents after ``resume_after`` matching ``pending``.
+    Once committed, they match ``done`` instead and all of them precede the first parent still
+    matching ``pending`` (if there is none, the batch was the last one). Parents matching ``done``
+    before the run are returned as well if they lie in that id range, so at most the span
+    of a single batch is reindexed again.
+
+    :param table:           parent table ordered by its ``id`` column
+    :param resume_after:    id of the last parent processed and queued by the interrupted run
+    :param pending:         criterion of parents still to be processed
+    :param done:            criterion of processed parents
+    """
+    next_pending = db.session.execute(
+        select(table.c.id).where(pending, table.c.id > resume_after).order_by(table.c.id).limit(1)
+    ).scalar()
+    query = select(table.c.id).where(done, table.c.id > resume_after)
+    if next_pending is not None:
+        query = query.where(table.c.id < next_pending)
+    return list(db.session.execute(query.order_by(table.c.id)).scalars().all())
+
+
+def backfill_parent_workflow(
+    service: Any,
+    workflow_code: str,
+    batch_size: int = 1000,
+    resume_after: Any = None,
+    progress: Callable[[int, int, Any], None] | None = None,
+) -> int:
+    """Set the workflow of parents without a workflow and reindex their records.
+
+    Each batch is committed before its records are queued for indexing, so that the indexer
+    sees the new workflow. If the run is interrupted between the commit and the queueing,
+    run it again with ``resume_after`` set to the last id reported by ``progress``: the parents
+    of the interrupted batch (see :func:`interrupted_batch`) are then queued for reindexing first.
+
+    :param service:         record service whose parents are updated
+    :param workflow_code:   workflow to set, usually the default workflow
+    :param batch_size:      number of parents updated in one transaction
+    :param resume_after:    id of the last parent processed by an interrupted run
+    :param progress:        called after each batch with the number of updated parents,
+                            queued records and the id of the last processed parent
+    :return: number of updated parents
+    """
+    table = service.config.record_cls.parent_record_cls.model_cls.__table__
+    missing = table.c.workflow.is_(None)
+    updated = queued = 0
+    if resume_after is not None:
+        requeue = interrupted_batch(table, resume_after, missing, table.c.workflow == workflow_code)
+        for start in range(0, len(requeue), batch_size):
+            queued += reindex_children(service, requeue[start : start + batch_size])
+        if requeue and progress is not None:
+            progress(updated, queued, resume_after)
+    last_id = resume_after
+    while True:
+        query = select(table.c.id).where(missing).order_by(table.c.id).limit(batch_size)
+        if last_id is not None:
+            query = query.where(table.c.id > last_id)
+        ids = db.session.execute(query).scalars().all()
+        if not ids:
+            break
+        updated += db.session.execute(
+            update(table).where(table.c.id.in_(ids), missing).values(workflow=workflow_code)
+        ).rowcount
+        db.session.commit()
+        queued += reindex_children(service, ids)
+        last_id = ids[-1]
+        if progress is not None:
+            progress(updated, queued, last_id)
+    return updated
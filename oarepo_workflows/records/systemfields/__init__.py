@@ -9,11 +9,13 @@
 
 from __future__ import annotations
 
+from .access import WorkflowAccessField
 from .state import RecordStateField, RecordStateTimestampField
 from .workflow import WorkflowField
 
 __all__ = (
     "RecordStateField",
     "RecordStateTimestampField",
+    "WorkflowAccessField",
     "WorkflowField",
 )
@@ -0,0 +1,64 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Workflow access system field."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Self, overload
+
+from invenio_records.systemfields import SystemField
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from invenio_records_resources.records.api import Record
+
+
+class WorkflowAccessField(SystemField):
+    """Adds permissions of the record's workflow to the indexed document.
+
+    The value is computed when the record is dumped and removed when the record
+    is loaded from the index, so it is never stored in the database.
+    """
+
+    def __init__(self, key: str = "_workflow_access", actions: Iterable[str] | None = None) -> None:
+        """Initialize the field.
+
+        :param key:     key of the field in the indexed document
+        :param actions: actions whose permissions are stored, defaults to the read actions
+                        used in search filters
+        """
+        self._actions = tuple(actions) if actions is not None else None
+        super().__init__(key=key)
+
+    def _access(self, record: Record) -> dict[str, dict[str, list[str]]]:
+        # imported here, as the permissions pull in the whole services layer
+        from oarepo_workflows.services.permissions.access import DENORMALIZED_ACTIONS, workflow_access
+
+        return workflow_access(record, self._actions or DENORMALIZED_ACTIONS)
+
+    def post_dump(self, record: Record, data: dict[str, Any], dumper: Any = None) -> None:
+        """Add the permissions to the dumped document."""
+        data[self.key] = self._access(record)
+
+    def post_load(self, record: Record, data: dict[str, Any], loader: Any = None) -> None:
+        """Remove the permissions from the record loaded from the index."""
+        record.pop(self.key, None)
+
+    @overload
+    def __get__(self, record: None, owner: type | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, record: Record, owner: type | None = None) -> dict[str, dict[str, list[str]]]: ...
+
+    def __get__(self, record: Record | None, owner: type | None = None) -> dict[str, dict[str, list[str]]] | Self:
+        """Return the permissions of the record in its current state."""
+        if record is None:
+            return self
+        return self._access(record)
@@ -27,6 +27,28 @@ if TYPE_CHECKING:
     from invenio_records.models import RecordMetadataBase
 
 
+def model_has_column(record: Record, column: str) -> bool:
+    """Return True if the database model of the record has a dedicated column.
+
+    The columns are added by the opt-in ``workflows_state_columns_preset``.
+    """
+    model = getattr(record, "model", None)
+    if model is None:
+        return False
+    table = getattr(type(model), "__table__", None)
+    return table is not None and column in table.columns
+
+
+def parse_state_timestamp(value: str | None) -> datetime | None:
+    """Convert the ISO timestamp stored in the record to a naive UTC datetime stored in the database."""
+    if not value:
+        return None
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(UTC).replace(tzinfo=None)
+    return timestamp
+
+
 class WithState(Protocol):
     """A protocol for a record containing a state field.
 
@@ -53,6 +75,17 @@ class RecordStateField(TypedSystemField[Record, str]):
     def post_create(self, record: Record) -> None:
         """Set the initial state when record is created."""
         self.set_dictkey(record, self._initial)
+        self._sync_model(record)
+
+    def pre_commit(self, record: Record, **kwargs: Any) -> None:
+        """Copy the state to the model's column, if the model has one."""
+        self._sync_model(record)
+
+    def _sync_model(self, record: Record) -> None:
+        if model_has_column(record, self.key):
+            state = self.get_dictkey(record)
+            if getattr(record.model, self.key) != state:
+                setattr(record.model, self.key, state)
 
     # field_data
     @override
@@ -106,6 +139,17 @@ class RecordStateTimestampField(TypedSystemField[Record, str]):
     def post_create(self, record: Record) -> None:
         """Set the initial state when record is created."""
         self.set_dictkey(record, datetime.now(tz=UTC).isoformat())
+        self._sync_model(record)
+
+    def pre_commit(self, record: Record, **kwargs: Any) -> None:
+        """Copy the timestamp to the model's column, if the model has one."""
+        self._sync_model(record)
+
+    def _sync_model(self, record: Record) -> None:
+        if model_has_column(record, self.key):
+            timestamp = parse_state_timestamp(self.get_dictkey(record))
+            if getattr(record.model, self.key) != timestamp:
+                setattr(record.model, self.key, timestamp)
 
     @override
     def post_init(
@@ -14,8 +14,8 @@ from typing import TYPE_CHECKING, Protocol
 from invenio_records.systemfields.model import ModelField
 from oarepo_runtime.records.systemfields import MappingSystemFieldMixin
 
-from oarepo_workflows import current_oarepo_workflows
 from oarepo_workflows.errors import InvalidWorkflowError
+from oarepo_workflows.proxies import current_oarepo_workflows
 
 if TYPE_CHECKING:
     from invenio_records.models import RecordMetadataBase
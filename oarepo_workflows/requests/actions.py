@@ -0,0 +1,113 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Request actions implementing the auto-approve pipeline.
+
+If a receiver of a submitted request resolves to the auto-approve entity,
+the request is accepted in the same unit of work as the submission and the
+``accepted`` transition of the workflow request is applied to the topic,
+unless the accept action has already applied it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+from invenio_access.permissions import system_identity
+from invenio_requests.customizations.actions import SubmitAction
+
+from oarepo_workflows.proxies import current_oarepo_workflows
+from oarepo_workflows.resolvers.auto_approve import AutoApprove
+from oarepo_workflows.services.uow import StateChangeOperation
+
+if TYPE_CHECKING:
+    from flask_principal import Identity
+    from invenio_db.uow import UnitOfWork
+    from invenio_requests.records.api import Request
+
+
+def is_auto_approved(request: Request) -> bool:
+    """Return True if the receiver of the request is the auto-approve entity.
+
+    Only the reference dictionary is inspected, the receiver is not resolved.
+    """
+    receiver = request.receiver
+    return receiver is not None and receiver.reference_dict == AutoApprove.ref_dict
+
+
+def auto_approve(identity: Identity, request: Request, uow: UnitOfWork) -> bool:
+    """Accept an auto-approved request within the given unit of work.
+
+    The accept action is executed directly, not through the requests service,
+    so the receiver is not resolved again and permission policies are not evaluated.
+    The request is committed by the caller (usually the requests service executing
+    the submit action), so the whole submission costs a single transaction.
+
+    The ``accepted`` transition of the workflow request is applied to the topic
+    as the system identity, unless the accept action has already registered a state
+    change of the topic in the unit of work.
+
+    :param identity: identity of the user who submitted the request
+    :param request:  the submitted request
+    :param uow:      unit of work of the submission
+    :return: True if the request has been accepted, False otherwise
+    """
+    if not is_auto_approved(request):
+        return False
+
+    accept_action = request.type.available_actions["accept"](request)
+    if not accept_action.can_execute():
+        return False
+    registered = len(uow._operations)  # noqa: SLF001
+    accept_action.execute(system_identity, uow)
+
+    topic = request.topic.resolve()
+    workflow = current_oarepo_workflows.get_workflow(topic)
+    workflow_request = current_oarepo_workflows.get_workflow_request(workflow.code, request.type.type_id)
+    accepted_state = workflow_request.transitions.accepted
+    # accept actions of oarepo-requests apply the transition themselves, the state must not be changed twice
+    if accepted_state and not _state_changed(uow, topic, since=registered):
+        current_oarepo_workflows.set_state(system_identity, topic, accepted_state, uow=uow)
+    return True
+
+
+def _state_changed(uow: UnitOfWork, topic: Any, since: int) -> bool:
+    """Return True if a state change of the topic has been registered in the unit of work.
+
+    Any instance of the topic record counts, it is compared by id.
+
+    :param since: index of the first operation of the unit of work to inspect
+    """
+    topic_id = getattr(topic, "id", None)
+    for operation in uow._operations[since:]:  # noqa: SLF001
+        if not isinstance(operation, StateChangeOperation):
+            continue
+        if operation.record is topic or (topic_id is not None and getattr(operation.record, "id", None) == topic_id):
+            return True
+    return False
+
+
+class AutoApproveSubmitAction(SubmitAction):
+    """Submit action that accepts the request right away if it is auto-approved.
+
+    Use it in ``available_actions`` of a request type:
+
+    .. code-block:: python
+
+        class MyRequestType(RequestType):
+            available_actions = {
+                **RequestType.available_actions,
+                "submit": AutoApproveSubmitAction,
+            }
+    """
+
+    @override
+    def execute(self, identity: Identity, uow: UnitOfWork) -> None:
+        """Submit the request and accept it if its receiver is auto-approve."""
+        super().execute(identity, uow)
+        auto_approve(identity, self.request, uow)
@@ -0,0 +1,262 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Automatic creation of requests whose requesters include AutoRequest.
+
+The requesters of all workflow requests are analysed once and an index
+of (workflow code, state) -> workflow requests is built. When a record enters
+a state, the index is consulted and the matching requests are created and submitted
+on behalf of the system. A request is created only on entry, that is if it was not
+auto-requested in the previous state as well, and only if the record does not already
+have an open request of the same type.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from flask import current_app
+from invenio_access.permissions import system_identity
+from invenio_db import db
+from invenio_records_resources.services.uow import IndexRefreshOp, RecordCommitOp
+from invenio_requests.customizations.actions import RequestActions
+from invenio_requests.customizations.states import RequestState
+from invenio_requests.errors import CannotExecuteActionError
+from invenio_requests.proxies import current_requests_service
+from invenio_requests.records.api import Request
+from invenio_requests.records.models import RequestMetadata
+from invenio_requests.resolvers.registry import ResolverRegistry
+
+from oarepo_workflows.errors import InvalidWorkflowError, MissingWorkflowError
+from oarepo_workflows.proxies import current_oarepo_workflows
+from oarepo_workflows.services.permissions.analysis import reachable_states
+
+from .generators.auto import AutoRequest, auto_request_need
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from flask_principal import Identity
+    from invenio_db.uow import UnitOfWork
+    from invenio_records_resources.records.api import Record
+
+    from oarepo_workflows.base import Workflow
+
+    from .requests import WorkflowRequest
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class AutoRequestIndex:
+    """Index of workflow requests that are created automatically."""
+
+    by_state: Mapping[tuple[str, str], tuple[WorkflowRequest, ...]]
+    """(workflow code, state) -> requests that are always auto-requested in that state."""
+
+    dynamic: Mapping[str, tuple[WorkflowRequest, ...]]
+    """workflow code -> requests whose AutoRequest placement can not be analysed statically."""
+
+    @classmethod
+    def from_workflows(cls, workflows: Iterable[Workflow]) -> AutoRequestIndex:
+        """Build the index from the workflow definitions."""
+        by_state: dict[tuple[str, str], list[WorkflowRequest]] = {}
+        dynamic: dict[str, list[WorkflowRequest]] = {}
+        for workflow in workflows:
+            for workflow_request in workflow.requests().requests:
+                states = reachable_states(workflow_request.requesters, lambda g: isinstance(g, AutoRequest))
+                if states is None:
+                    dynamic.setdefault(workflow.code, []).append(workflow_request)
+                    continue
+                for state in sorted(states):
+                    by_state.setdefault((workflow.code, state), []).append(workflow_request)
+        return cls(
+            by_state=MappingProxyType({k: tuple(v) for k, v in by_state.items()}),
+            dynamic=MappingProxyType({k: tuple(v) for k, v in dynamic.items()}),
+        )
+
+    def auto_requests(
+        self, workflow_code: str, state: str, record: Record, previous_state: str | None = None
+    ) -> list[WorkflowRequest]:
+        """Return workflow requests that should be created when the record enters the state.
+
+        Only the requests that can not be analysed statically have their requester
+        generators evaluated.
+
+        :param previous_state:  state the record is leaving. Requests that are auto-requested
+                                in the previous state as well are not returned, as the record
+                                does not enter their state. If None, the record is considered
+                                to enter the state.
+        """
+        if previous_state == state:
+            return []
+        requested_before = (
+            {id(r) for r in self.by_state.get((workflow_code, previous_state), ())}
+            if previous_state is not None
+            else set()
+        )
+        ret = [r for r in self.by_state.get((workflow_code, state), ()) if id(r) not in requested_before]
+        for workflow_request in self.dynamic.get(workflow_code, ()):
+            if not _is_auto_requested(workflow_request, record):
+                continue
+            if previous_state is not None and _is_auto_requested(
+                workflow_request, _RecordInState(record, previous_state)
+            ):
+                # unconditional AutoRequest or one in a branch taken in both states
+                continue
+            ret.append(workflow_request)
+        return ret
+
+
+def _is_auto_requested(workflow_request: WorkflowRequest, record: Any) -> bool:
+    try:
+        needs = workflow_request.requester_generator.needs(record=record, request_type=workflow_request.request_type)
+    except Exception:
+        log.exception("Error evaluating requesters of %s", workflow_request)
+        return False
+    return auto_request_need in needs
+
+
+class _RecordInState:
+    """Read-only view of a record that reports a different state.
+
+    Used to evaluate requester generators as they were evaluated before the state change.
+    The view pretends to be an instance of the record's class, so that type-based
+    conditions are evaluated the same way as for the record.
+    """
+
+    __slots__ = ("_record", "state")
+
+    def __init__(self, record: Record, state: str) -> None:
+        self._record = record
+        self.state = state
+
+    @property
+    def __class__(self) -> type:  # type: ignore[override]
+        return type(self._record)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._record, name)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._record[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._record
+
+
+def _open_statuses(request_type: Any) -> list[str]:
+    """Return statuses in which a request of the type is not closed yet."""
+    return [status for status, state in request_type.available_statuses.items() if state != RequestState.CLOSED]
+
+
+def existing_request_types(record: Record, workflow_requests: Sequence[WorkflowRequest]) -> set[str]:
+    """Return ids of the request types of the workflow requests that have a not yet closed request on the record.
+
+    A single query is made for all the workflow requests. Requests created earlier
+    in the same transaction are found as well, as they have been flushed on registration.
+    """
+    if not workflow_requests:
+        return set()
+    ((topic_type, topic_id),) = ResolverRegistry.reference_entity(record, raise_=True).items()
+    conditions = [
+        db.and_(
+            RequestMetadata.json["type"].as_string() == workflow_request.request_type.type_id,
+            RequestMetadata.json["status"].as_string().in_(_open_statuses(workflow_request.request_type)),
+        )
+        for workflow_request in workflow_requests
+    ]
+    rows = (
+        db.session.query(RequestMetadata.json["type"].as_string())
+        .filter(RequestMetadata.json["topic"][topic_type].as_string() == str(topic_id), db.or_(*conditions))
+        .distinct()
+    )
+    return {type_id for (type_id,) in rows}
+
+
+def _execute_action(request: Request, action_name: str, uow: UnitOfWork) -> None:
+    action = RequestActions.get_action(request, action_name)
+    if not action.can_execute():
+        raise CannotExecuteActionError(action_name)
+    action.execute(system_identity, uow)
+
+
+def create_auto_requests(record: Record, workflow_requests: Iterable[WorkflowRequest], uow: UnitOfWork) -> None:
+    """Create and submit the requests on behalf of the system within the unit of work.
+
+    Requests whose type already has an open request on the record are skipped.
+    The requests are created in a batch: the record and the system identity are referenced
+    only once, the permission checks of the requests service are skipped (the system
+    identity would pass them) and the created and submitted requests are registered
+    for commit and indexing in the same unit of work without being read back.
+    """
+    workflow_requests = list({id(r): r for r in workflow_requests}.values())
+    existing = existing_request_types(record, workflow_requests)
+    workflow_requests = [r for r in workflow_requests if r.request_type.type_id not in existing]
+    if not workflow_requests:
+        return
+
+    topic = ResolverRegistry.reference_entity(record, raise_=True)
+    creator = ResolverRegistry.reference_identity(system_identity)
+    for workflow_request in workflow_requests:
+        request_type = workflow_request.request_type
+        receiver = workflow_request.recipient_entity_reference(record=record, request_type=request_type)
+        request = Request.create({}, type=request_type)
+        current_requests_service.run_components(
+            "create",
+            system_identity,
+            data={},
+            record=request,
+            errors=[],
+            created_by=creator,
+            topic=topic,
+            receiver=receiver,
+            uow=uow,
+        )
+        _execute_action(request, request_type.create_action, uow)
+        if request.status != "submitted":
+            _execute_action(request, "submit", uow)
+        uow.register(RecordCommitOp(request, indexer=current_requests_service.indexer))
+    uow.register(IndexRefreshOp(indexer=current_requests_service.indexer))
+
+
+class AutoRequestStateChangedNotifier:
+    """State changed notifier that creates requests requested by AutoRequest generator.
+
+    Registered in the ``oarepo_workflows.state_changed_notifiers`` entry point group,
+    active only if ``WORKFLOWS_AUTO_REQUESTS_ENABLED`` is set.
+    """
+
+    def __call__(  # noqa: PLR0913
+        self,
+        identity: Identity,
+        record: Record,
+        previous_state: str,
+        new_state: str,
+        *args: Any,
+        uow: UnitOfWork,
+        **kwargs: Any,
+    ) -> None:
+        """Create auto requests for the new state of the record."""
+        if not current_app.config.get("WORKFLOWS_AUTO_REQUESTS_ENABLED"):
+            return
+        try:
+            workflow = current_oarepo_workflows.get_workflow(record)
+        except (MissingWorkflowError, InvalidWorkflowError):
+            return
+        workflow_requests = current_oarepo_workflows.auto_request_index.auto_requests(
+            workflow.code, new_state, record, previous_state=previous_state
+        )
+        if workflow_requests:
+            create_auto_requests(record, workflow_requests, uow)
+
+
+auto_request_notifier = AutoRequestStateChangedNotifier()
@@ -10,7 +10,6 @@
 from __future__ import annotations
 
 import dataclasses
-from functools import cached_property
 from typing import TYPE_CHECKING, NoReturn, cast
 
 from oarepo_workflows.errors import EventTypeNotInWorkflowError
@@ -24,9 +23,12 @@ if TYPE_CHECKING:
     from invenio_records_permissions.generators import Generator
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class WorkflowEvent:
-    """Class representing a workflow event."""
+    """Class representing a workflow event.
+
+    The event is immutable and has no instance dictionary, the submitters are stored as a tuple.
+    """
 
     submitters: Sequence[Generator]
     """List of submitters to be used for the event.
@@ -35,10 +37,13 @@ class WorkflowEvent:
        to be able to create a workflow event.
     """
 
-    @cached_property
-    def submitter_generator(self) -> Generator:
-        """Return the requesters as a single requester generator."""
-        return cast("Generator", MultipleEntitiesGenerator(self.submitters))
+    submitter_generator: Generator = dataclasses.field(init=False, repr=False, compare=False)
+    """The submitters as a single generator."""
+
+    def __post_init__(self) -> None:
+        """Freeze the submitters and combine them into the submitter generator."""
+        object.__setattr__(self, "submitters", tuple(self.submitters))
+        object.__setattr__(self, "submitter_generator", cast("Generator", MultipleEntitiesGenerator(self.submitters)))
 
 
 class WorkflowEvents(dict[str, WorkflowEvent]):
@@ -25,13 +25,20 @@ if TYPE_CHECKING:
     from invenio_requests.customizations.request_types import RequestType
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class MultipleEntitiesGenerator(RecipientGeneratorMixin, CompositeGenerator):
-    """A generator that combines multiple generators with 'or' operation."""
+    """A generator that combines multiple generators with 'or' operation.
+
+    The generator is immutable, the combined generators are stored as a tuple.
+    """
 
     generators: Sequence[InvenioGenerator]
     """List of generators to be combined."""
 
+    def __post_init__(self) -> None:
+        """Freeze the generators."""
+        object.__setattr__(self, "generators", tuple(self.generators))
+
     @override
     def _generators(self, **context: Any) -> Sequence[InvenioGenerator]:
         """Return the generators."""
@@ -9,19 +9,137 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, override
 
 from invenio_communities.communities.records.api import Community
 from invenio_records_permissions.generators import AnyUser, SystemProcess
+from invenio_search.engine import dsl
 from invenio_requests.customizations.event_types import CommentEventType, LogEventType
 from invenio_requests.services.generators import Creator, Receiver
 from invenio_requests.services.permissions import (
     PermissionPolicy as InvenioRequestsPermissionPolicy,
 )
 
-from oarepo_workflows import FromRecordWorkflow
+from oarepo_workflows.proxies import current_oarepo_workflows
 from oarepo_workflows.requests.generators.conditionals import IfEventType
 from oarepo_workflows.services.permissions.composite import BooleanPermissionPolicyMixin
+from oarepo_workflows.services.permissions.generators import FromRecordWorkflow
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from flask_principal import Need
+    from invenio_records_permissions.generators import Generator
+    from invenio_records_resources.records import Record
+
+
+class _FromWorkflowIndex(FromRecordWorkflow):
+    """Delegates to a generator looked up in the request indexes of the extension.
+
+    The workflow is taken from the record (topic of the request) as in :class:`FromRecordWorkflow`,
+    but instead of instantiating the workflow's permission policy, the generator
+    is found by the ``lookup`` callable, a dictionary lookup keyed by the workflow code.
+    """
+
+    def __init__(
+        self,
+        lookup: Callable[..., Generator | None],
+        action: str | Callable[..., str],
+        record_getter: Callable[..., Record] | None = None,
+    ) -> None:
+        """Initialize the generator.
+
+        :param lookup: Callable receiving the workflow code and the context, returns the generator
+                       or None if the workflow does not define it.
+        :param action: Action the generator stands for.
+        :param record_getter: Callable to get the record from the context.
+        """
+        super().__init__(action=action, record_getter=record_getter)
+        self._lookup = lookup
+
+    def _generator(self, record: Record | None = None, **context: Any) -> tuple[Generator | None, dict[str, Any]]:
+        if self._record_getter:
+            record = self._record_getter(**context)
+            if not record:
+                return None, context
+        workflow = self._get_workflow(record, **context)
+        if workflow is None:
+            return None, context
+        return self._lookup(workflow.code, **context), context | {"record": record}
+
+    @override
+    def needs(self, **context: Any) -> Sequence[Need]:
+        generator, context = self._generator(**context)
+        return list(generator.needs(**context)) if generator is not None else []
+
+    @override
+    def excludes(self, **context: Any) -> Sequence[Need]:
+        generator, context = self._generator(**context)
+        return list(generator.excludes(**context)) if generator is not None else []
+
+    @override
+    def query_filter(self, **context: Any) -> dsl.query.Query:
+        generator, context = self._generator(**context)
+        query = generator.query_filter(**context) if generator is not None else None
+        return query if query else dsl.Q("match_none")
+
+
+def _request_creators(
+    workflow_code: str,
+    *,
+    request_type: Any = None,
+    **context: Any,  # noqa: ARG001
+) -> Generator | None:
+    """Return requesters of the workflow request of the request type, None if the workflow does not define it."""
+    if request_type is None:
+        return None
+    workflow_request = current_oarepo_workflows.workflow_requests_by_type.get(request_type.type_id, {}).get(
+        workflow_code
+    )
+    return workflow_request.requester_generator if workflow_request is not None else None
+
+
+def _event_creators(
+    workflow_code: str,
+    *,
+    request: Any,
+    event_type: Any = CommentEventType,
+    **context: Any,  # noqa: ARG001
+) -> Generator | None:
+    """Return submitters of the event of the request, None if the workflow request does not define it."""
+    event = current_oarepo_workflows.workflow_events_by_key.get(
+        (workflow_code, request.type.type_id, event_type.type_id)
+    )
+    return event.submitter_generator if event is not None else None
+
+
+class RequestCreatorsFromWorkflow(_FromWorkflowIndex):
+    """Requesters of the workflow request of the given ``request_type`` in the workflow of the topic."""
+
+    def __init__(self, record_getter: Callable[..., Record] | None = None) -> None:
+        """Initialize the generator.
+
+        :param record_getter: Callable to get the topic from the context, defaults to the ``record`` argument
+        """
+        super().__init__(
+            lookup=_request_creators,
+            action=lambda *, request_type, **kwargs: f"{request_type.type_id}_create",  # noqa: ARG005
+            record_getter=record_getter,
+        )
+
+
+class EventCreatorsFromWorkflow(_FromWorkflowIndex):
+    """Submitters of the ``event_type`` of the workflow request of the ``request`` in the workflow of its topic."""
+
+    def __init__(self) -> None:
+        """Initialize the generator."""
+        super().__init__(
+            lookup=_event_creators,
+            action=lambda *, request, event_type=CommentEventType, **kwargs: (  # noqa: ARG005
+                f"{request.type.type_id}_{event_type.type_id}_create"
+            ),
+            record_getter=lambda *, request, **kwargs: request.topic.resolve(),  # noqa: ARG005
+        )
 
 
 class CreatorsFromWorkflowRequestsPermissionPolicy(BooleanPermissionPolicyMixin, InvenioRequestsPermissionPolicy):  # type: ignore[reportIncompatibleMethodOverride]
@@ -29,7 +147,8 @@ class CreatorsFromWorkflowRequestsPermissionPolicy(BooleanPermissionPolicyMixin,
 
     This permission adds a special generator RequestCreatorsFromWorkflow() to the default permissions.
     This generator takes a topic, gets the workflow from the topic and returns the generator for
-    creators defined on the WorkflowRequest.
+    creators defined on the WorkflowRequest. The WorkflowRequest (and WorkflowEvent for event
+    permissions) is looked up in the indexes of the extension.
     """
 
     def __init__(self, action: str, **kwargs: Any):
@@ -45,21 +164,14 @@ class CreatorsFromWorkflowRequestsPermissionPolicy(BooleanPermissionPolicyMixin,
 
     can_create = (
         SystemProcess(),
-        FromRecordWorkflow(
-            action=lambda *, request_type, **kwargs: f"{request_type.type_id}_create"  # noqa: ARG005
-        ),
+        RequestCreatorsFromWorkflow(),
     )
 
     can_create_comment = (
         SystemProcess(),
         IfEventType(CommentEventType, [Creator(), Receiver()]),
         IfEventType(LogEventType, [Creator(), Receiver()]),
-        FromRecordWorkflow(
-            action=lambda *, request, event_type=CommentEventType, **kwargs: (  # noqa: ARG005
-                f"{request.type.type_id}_{event_type.type_id}_create"
-            ),
-            record_getter=lambda *, request, **kwargs: request.topic.resolve(),  # noqa: ARG005
-        ),
+        EventCreatorsFromWorkflow(),
     )
 
     # any user can search for requests, but non-authenticated will not get a hit
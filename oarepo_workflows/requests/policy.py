@@ -12,7 +12,10 @@ from __future__ import annotations
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
+from invenio_access.permissions import superuser_access, system_process
+
 from ..errors import RequestTypeNotInWorkflowError
+from ..proxies import current_oarepo_workflows
 from .requests import (
     WorkflowRequest,
 )
@@ -20,9 +23,25 @@ from .requests import (
 if TYPE_CHECKING:
     from flask_principal import Identity
     from invenio_records_resources.records.api import Record
+    from invenio_requests.customizations.request_types import RequestType
 
     from .. import Workflow
 
+BASE_APPLICABILITY_CHECK = ("oarepo_requests.types.generic", "OARepoRequestType")
+"""Module and name of the class with the base ``is_applicable_to``, which only checks the create permission."""
+
+
+def decides_applicability(request_type: RequestType) -> bool:
+    """Return True if the request type decides its applicability by itself.
+
+    That is the case if it implements ``is_applicable_to`` other than the base one from
+    oarepo-requests, which only checks the create permission and thus follows the requesters.
+    """
+    for cls in type(request_type).__mro__:
+        if "is_applicable_to" in vars(cls):
+            return (cls.__module__, cls.__qualname__) != BASE_APPLICABILITY_CHECK
+    return False
+
 
 class WorkflowRequestPolicy:
     """Base class for workflow request policies.
@@ -95,13 +114,32 @@ class WorkflowRequestPolicy:
         # TODO: perhaps scrap later if this isn't the best approach to use in requests
         """Return a list of applicable requests for the identity and context.
 
+        Requests whose requesters can not match in the state of the record (according
+        to the state graph of the workflow) are skipped without being evaluated, unless
+        their request type decides the applicability by itself, overriding the base
+        ``is_applicable_to`` of oarepo-requests (see :func:`decides_applicability`).
+
         :param identity: Identity of the requester.
         :param context: Context of the request that is passed to the requester generators.
         :return: List of tuples (request_type_id, request) that are applicable for the identity and context.
         """
         ret = []
+        available = self._available_request_types(identity, record)
 
         for name, request in self.requests_by_id.items():
+            if available is not None and name not in available and not decides_applicability(request.request_type):
+                continue
             if request.is_applicable(identity, record=record, **context):
                 ret.append((name, request))
         return ret
+
+    def _available_request_types(self, identity: Identity, record: Record) -> frozenset[str] | None:
+        """Return request types that might be applicable in the state of the record, None if all might be."""
+        state = getattr(record, "state", None)
+        if not isinstance(state, str) or system_process in identity.provides or superuser_access in identity.provides:
+            # system identity and superusers are allowed to create all requests regardless of the requesters
+            return None
+        graph = current_oarepo_workflows.state_graphs.get(self.workflow.code)
+        if graph is None:
+            return None
+        return graph.available_request_types(state)
@@ -12,6 +12,7 @@ from __future__ import annotations
 import dataclasses
 from functools import cached_property
 from logging import getLogger
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, cast
 
 from invenio_requests.proxies import (
@@ -104,9 +105,17 @@ class WorkflowRequest:
             return False
 
     @property
-    def allowed_events(self) -> dict[str, WorkflowEvent]:
-        """Return the allowed events for the workflow request."""
-        return current_oarepo_workflows.default_workflow_events | self.events
+    def allowed_events(self) -> Mapping[str, WorkflowEvent]:
+        """Return the allowed events for the workflow request.
+
+        The default workflow events of the current application are merged with the events
+        of this request, the result is an immutable mapping raising EventTypeNotInWorkflowError
+        on unknown keys. The merged events of configured workflow requests are cached by the extension.
+        """
+        cached = current_oarepo_workflows.workflow_request_allowed_events.get(id(self))
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        return MappingProxyType(WorkflowEvents({**current_oarepo_workflows.default_workflow_events, **self.events}))
 
     def __get__(self, instance: Any, owner: Any) -> WorkflowRequest:
         """Get the workflow request."""
@@ -130,7 +139,7 @@ class WorkflowRequest:
             return current_request_type_registry.lookup(self._request_type.replace("-", "_"))  # pragma: no cover
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class WorkflowTransitions:
     """Transitions for a workflow request.
 
@@ -138,6 +147,8 @@ class WorkflowTransitions:
     the record (topic) of the request will be moved to state defined in submitted.
     If the request is approved, the record will be moved to state defined in approved.
     If the request is rejected, the record will be moved to state defined in rejected.
+
+    The transitions are immutable and have no instance dictionary.
     """
 
     submitted: str | None = None
@@ -152,18 +163,24 @@ class WorkflowTransitions:
         return getattr(self, transition_name)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class WorkflowRequestEscalation:
     """Escalation of the request.
 
     If the request is not approved/declined/cancelled in time, it might be passed to another recipient
     (such as a supervisor, administrator, ...). The escalation is defined by the time after which the
     request is escalated and the recipients of the escalation.
+
+    The escalation is immutable, the recipients are stored as a tuple.
     """
 
     after: timedelta
     recipients: Sequence[Generator]
 
+    def __post_init__(self) -> None:
+        """Freeze the recipients."""
+        object.__setattr__(self, "recipients", tuple(self.recipients))
+
     def recipient_entity_reference(self, **context: Any) -> Mapping[str, str] | None:
         """Return the reference receiver of the workflow escalation with the given context.
 
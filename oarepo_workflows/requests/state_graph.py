@@ -0,0 +1,255 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Precomputed graph of record states of a workflow.
+
+The requesters and transitions of all requests of a workflow are analysed once
+(without evaluating the generators) and a graph of record states is built.
+Each edge is labelled by the request type and the transition kind
+(``submitted``, ``accepted``, ``declined``, ``cancelled``) and says whether
+the request is created automatically when the record enters the source state.
+
+Requests whose requesters can not be analysed statically can be created
+in any state, their edges have ``None`` as the source state.
+
+Example:
+    .. code-block:: python
+
+        graph = current_oarepo_workflows.get_state_graph("default")
+        graph.request_types_leaving("draft")     # frozenset({"publish_draft"})
+        graph.available_request_types("draft")   # request types worth evaluating in "draft"
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from oarepo_workflows.services.permissions.analysis import iter_generators, reachable_states
+from oarepo_workflows.services.permissions.generators import IfInState
+
+from .generators.auto import AutoRequest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from invenio_records_permissions.generators import Generator
+
+    from oarepo_workflows.base import Workflow
+
+    from .requests import WorkflowRequest
+
+TRANSITION_KINDS = ("submitted", "accepted", "declined", "cancelled")
+"""Kinds of the transitions, in the order they happen during the life of a request."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StateTransition:
+    """Edge of the state graph."""
+
+    request_type: str
+    """Id of the request type causing the transition."""
+
+    kind: str
+    """Kind of the transition, one of :data:`TRANSITION_KINDS`."""
+
+    source: str | None
+    """State the record is in before the transition, None if the request can be created in any state."""
+
+    target: str
+    """State the record is in after the transition."""
+
+    auto: bool = False
+    """True if the request is created automatically when the record enters the state the request starts in."""
+
+
+@dataclasses.dataclass(frozen=True)
+class StateGraph:
+    """State graph of a single workflow.
+
+    All the queries are dictionary lookups, the graph is immutable.
+    """
+
+    workflow_code: str
+    """Code of the workflow."""
+
+    states: frozenset[str]
+    """All the states mentioned in the requests and ``IfInState`` generators of the workflow."""
+
+    transitions: tuple[StateTransition, ...]
+    """All the edges of the graph."""
+
+    anywhere: frozenset[str]
+    """Request types whose requesters can not be analysed statically, they are available in all states."""
+
+    dynamic_auto_requests: frozenset[str]
+    """Request types whose ``AutoRequest`` placement can not be analysed statically."""
+
+    available_by_state: Mapping[str, frozenset[str]] = dataclasses.field(repr=False)
+    outgoing_by_state: Mapping[str | None, tuple[StateTransition, ...]] = dataclasses.field(repr=False)
+    incoming_by_state: Mapping[str, tuple[StateTransition, ...]] = dataclasses.field(repr=False)
+    leaving_by_state: Mapping[str | None, frozenset[str]] = dataclasses.field(repr=False)
+    successors_by_state: Mapping[str | None, frozenset[str]] = dataclasses.field(repr=False)
+    auto_by_state: Mapping[str, frozenset[str]] = dataclasses.field(repr=False)
+
+    @classmethod
+    def from_workflow(cls, workflow: Workflow, requests: Mapping[str, WorkflowRequest]) -> StateGraph:
+        """Build the graph of the workflow.
+
+        :param workflow: the workflow, states of its permission policy are added to the graph
+        :param requests: workflow requests of the workflow keyed by request type id
+        """
+        states: set[str] = set(_policy_states(workflow))
+        transitions: list[StateTransition] = []
+        available: dict[str, set[str]] = {}
+        anywhere: set[str] = set()
+        auto_by_state: dict[str, set[str]] = {}
+        dynamic_auto: set[str] = set()
+
+        for request_type_id, workflow_request in requests.items():
+            sources = reachable_states(workflow_request.requesters, _is_leaf)
+            auto_states = reachable_states(workflow_request.requesters, lambda g: isinstance(g, AutoRequest))
+            if auto_states is None:
+                dynamic_auto.add(request_type_id)
+                auto_states = frozenset()
+            for state in auto_states:
+                auto_by_state.setdefault(state, set()).add(request_type_id)
+
+            if sources is None:
+                anywhere.add(request_type_id)
+            else:
+                states.update(sources)
+                for state in sources:
+                    available.setdefault(state, set()).add(request_type_id)
+
+            for source in sorted(sources) if sources is not None else (None,):
+                transitions.extend(
+                    _request_transitions(request_type_id, workflow_request, source, source in auto_states)
+                )
+
+        states.update(t.target for t in transitions)
+        states.update(auto_by_state)
+        return cls._from_transitions(
+            workflow.code,
+            frozenset(states),
+            tuple(transitions),
+            frozenset(anywhere),
+            {state: frozenset(request_types) for state, request_types in available.items()},
+            {state: frozenset(request_types) for state, request_types in auto_by_state.items()},
+            frozenset(dynamic_auto),
+        )
+
+    @classmethod
+    def _from_transitions(  # noqa: PLR0913
+        cls,
+        workflow_code: str,
+        states: frozenset[str],
+        transitions: tuple[StateTransition, ...],
+        anywhere: frozenset[str],
+        available: Mapping[str, frozenset[str]],
+        auto_by_state: Mapping[str, frozenset[str]],
+        dynamic_auto: frozenset[str],
+    ) -> StateGraph:
+        wildcard = tuple(t for t in transitions if t.source is None)
+        outgoing: dict[str | None, tuple[StateTransition, ...]] = {None: wildcard}
+        incoming: dict[str, list[StateTransition]] = {}
+        for transition in transitions:
+            incoming.setdefault(transition.target, []).append(transition)
+        for state in states:
+            outgoing[state] = (
+                *(t for t in transitions if t.source == state),
+                *(t for t in wildcard if t.target != state),
+            )
+        return cls(
+            workflow_code=workflow_code,
+            states=states,
+            transitions=transitions,
+            anywhere=anywhere,
+            dynamic_auto_requests=dynamic_auto,
+            available_by_state=MappingProxyType(
+                {state: available.get(state, frozenset()) | anywhere for state in states}
+            ),
+            outgoing_by_state=MappingProxyType(outgoing),
+            incoming_by_state=MappingProxyType({state: tuple(edges) for state, edges in incoming.items()}),
+            leaving_by_state=MappingProxyType(
+                {state: frozenset(t.request_type for t in edges) for state, edges in outgoing.items()}
+            ),
+            successors_by_state=MappingProxyType(
+                {state: frozenset(t.target for t in edges) for state, edges in outgoing.items()}
+            ),
+            auto_by_state=MappingProxyType(dict(auto_by_state)),
+        )
+
+    def available_request_types(self, state: str) -> frozenset[str]:
+        """Return request types whose requesters might match in the state.
+
+        Requests not returned can be created in the state only by the system identity.
+        """
+        return self.available_by_state.get(state, self.anywhere)
+
+    def outgoing(self, state: str) -> tuple[StateTransition, ...]:
+        """Return transitions moving a record out of the state."""
+        return self.outgoing_by_state.get(state, self.outgoing_by_state[None])
+
+    def incoming(self, state: str) -> tuple[StateTransition, ...]:
+        """Return transitions moving a record into the state.
+
+        Transitions of requests that can be created in any state are included.
+        """
+        return self.incoming_by_state.get(state, ())
+
+    def request_types_leaving(self, state: str) -> frozenset[str]:
+        """Return request types that can move a record out of the state."""
+        return self.leaving_by_state.get(state, self.leaving_by_state[None])
+
+    def successors(self, state: str) -> frozenset[str]:
+        """Return states a record in the state can move to by a single transition."""
+        return self.successors_by_state.get(state, self.successors_by_state[None])
+
+    def auto_requests(self, state: str) -> frozenset[str]:
+        """Return request types created automatically when a record enters the state.
+
+        Request types listed in :attr:`dynamic_auto_requests` might be created as well.
+        """
+        return self.auto_by_state.get(state, frozenset())
+
+
+def _is_leaf(generator: Generator) -> bool:
+    """Return True for generators that are neither conditional nor composite."""
+    return not any(hasattr(generator, attr) for attr in ("then_", "else_", "generators"))
+
+
+def _policy_states(workflow: Workflow) -> Iterable[str]:
+    """Return states used in ``IfInState`` generators of the permission policy of the workflow."""
+    policy_cls = workflow.permission_policy_cls
+    for attr_name in dir(policy_cls):
+        if not attr_name.startswith("can_"):
+            continue
+        for generator in iter_generators(getattr(policy_cls, attr_name)):
+            if isinstance(generator, IfInState):
+                yield from generator.states
+
+
+def _request_transitions(
+    request_type_id: str, workflow_request: WorkflowRequest, source: str | None, auto: bool
+) -> Iterable[StateTransition]:
+    """Return transitions of a request created in the source state.
+
+    Accepted, declined and cancelled transitions start in the submitted state
+    or in the source state if the request does not change the state when submitted.
+    Transitions that do not change the state are left out.
+    """
+    transitions = workflow_request.transitions
+    submitted = transitions.submitted or source
+    if transitions.submitted and transitions.submitted != source:
+        yield StateTransition(request_type_id, "submitted", source, transitions.submitted, auto)
+    for kind in TRANSITION_KINDS[1:]:
+        target = transitions[kind]
+        if target and target != submitted:
+            yield StateTransition(request_type_id, kind, submitted, target, auto)
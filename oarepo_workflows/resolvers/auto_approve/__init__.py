@@ -9,6 +9,7 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, override
 
 from invenio_records_resources.references.entity_resolvers import EntityProxy
@@ -37,13 +38,20 @@ class AutoApprove:
 
     ref_dict: Mapping[str, str] = {"auto_approve": "true"}
 
+    serialized: Mapping[str, str] = MappingProxyType({"id": "true", "type": "auto_approve"})
+    """Precomputed serialization of the entity. Auto approve is a constant, so it never changes."""
+
+
+auto_approve_entity = AutoApprove()
+"""The auto approve entity, it is stateless so a single instance is shared."""
+
 
 class AutoApproveProxy(EntityProxy):
     """Proxy for auto approve entity."""
 
     def _resolve(self) -> AutoApprove:
         """Resolve the entity reference into entity."""
-        return AutoApprove()
+        return auto_approve_entity
 
     @override
     def get_needs(self, ctx: dict | None = None) -> list[Need | ItemNeed]:
@@ -64,6 +72,8 @@ class AutoApproveResolver(EntityResolver):
     def __init__(self) -> None:
         """Initialize the resolver."""
         super().__init__("auto_approve")
+        # auto approve is a constant entity, so the proxy can be shared by all references
+        self._proxy = AutoApproveProxy(self, {**AutoApprove.ref_dict})
 
     @override
     def matches_reference_dict(self, ref_dict: dict) -> bool:
@@ -84,7 +94,7 @@ class AutoApproveResolver(EntityResolver):
     def _get_entity_proxy(self, ref_dict: dict) -> AutoApproveProxy:
         """Get the entity proxy for the reference dictionary.
 
-        Note: the proxy is returned to ensure the entity is loaded lazily, when needed.
+        Note: auto approve is a constant entity, so a precomputed proxy is returned.
         :param ref_dict: Reference dictionary.
         """
-        return AutoApproveProxy(self, ref_dict)
+        return self._proxy
@@ -25,10 +25,12 @@ from invenio_records_resources.services.records.results import (
 from invenio_records_resources.services.records.service import RecordService
 from oarepo_runtime.services.config import EveryonePermissionPolicy
 
-from oarepo_workflows.resolvers.auto_approve import AutoApprove
+from oarepo_workflows.resolvers.auto_approve import AutoApprove, auto_approve_entity
 from oarepo_workflows.services.results import InMemoryResultList
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from flask_principal import Identity
     from invenio_db.uow import UnitOfWork
 
@@ -45,14 +47,39 @@ class AutoApproveSchema(ma.Schema):
     type = ma.fields.String(dump_only=True)
 
 
+class AutoApproveItem(RecordItem):
+    """Service result item for auto-approve.
+
+    Auto approve is a constant entity, so its precomputed serialization
+    is returned instead of dumping it through the schema.
+    """
+
+    @property
+    @override
+    def data(self) -> dict[str, Any]:
+        """Return a copy of the precomputed serialization."""
+        return dict(AutoApprove.serialized)
+
+
+class AutoApproveResultList(InMemoryResultList):
+    """Service result list for auto-approve using the precomputed serialization."""
+
+    @property
+    @override
+    def hits(self) -> Generator[dict[str, Any]]:
+        """Iterator over the hits."""
+        for _ in self._results:
+            yield dict(AutoApprove.serialized)
+
+
 class AutoApproveServiceConfig(RecordServiceConfig):
     """Service configuration."""
 
     service_id = "auto_approve"
     permission_policy_cls = EveryonePermissionPolicy
 
-    result_item_cls = RecordItem
-    result_list_cls = InMemoryResultList
+    result_item_cls = AutoApproveItem
+    result_list_cls = AutoApproveResultList
     record_cls = AutoApprove
     schema = AutoApproveSchema
 
@@ -86,7 +113,7 @@ class AutoApproveService(RecordService):
             ServiceItemResult: The auto-approve record.
 
         """
-        return self.result_item(self, identity, AutoApprove(), schema=self.schema)
+        return self.result_item(self, identity, auto_approve_entity, schema=self.schema)
 
     @override
     def read_many(
@@ -108,7 +135,7 @@ class AutoApproveService(RecordService):
             RecordList: list of auto-approve records.
 
         """
-        return self.result_list(identity, [AutoApprove()], self.schema)
+        return self.result_list(identity, [auto_approve_entity], self.schema)
 
     #
     # High-level API
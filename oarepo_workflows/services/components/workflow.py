@@ -14,8 +14,8 @@ from typing import TYPE_CHECKING, Any, override
 from invenio_records_resources.services.records.components.base import ServiceComponent
 from oarepo_runtime.typing import require_kwargs
 
-from oarepo_workflows import current_oarepo_workflows
 from oarepo_workflows.errors import InvalidWorkflowError
+from oarepo_workflows.proxies import current_oarepo_workflows
 
 if TYPE_CHECKING:
     from flask_principal import Identity
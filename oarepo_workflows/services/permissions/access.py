@@ -0,0 +1,117 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Index-time denormalization of workflow read permissions.
+
+When a record is indexed, the needs and excludes of its workflow's read
+permissions are stored in the ``_workflow_access`` field of the document
+as flat need tokens:
+
+.. code-block:: json
+
+    {
+        "_workflow_access": {
+            "read": {"grant": ["id:1", "role:3", "system_role:system_process"], "deny": []},
+            "read_draft": {"grant": ["id:1"], "deny": []}
+        }
+    }
+
+The search filter is then a single ``terms`` query of the identity's tokens
+instead of the query built from the permission generators of all workflows.
+
+The needs of a record must depend only on the record, which holds for all
+generators in this package. Composite needs (``RequireAll``) can not be
+flattened, they are left out, so records permitted only by them are not found.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from invenio_search.engine import dsl
+
+from oarepo_workflows.errors import InvalidWorkflowError, MissingWorkflowError
+from oarepo_workflows.proxies import current_oarepo_workflows
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from flask_principal import Identity, Need
+    from invenio_records_resources.records import Record
+
+log = logging.getLogger(__name__)
+
+ACCESS_FIELD = "_workflow_access"
+
+DENORMALIZED_ACTIONS = ("read", "read_draft", "read_deleted", "read_all_records")
+"""Actions whose permissions are stored in the index."""
+
+
+def need_token(need: Need) -> str | None:
+    """Return the index token of a need, None for needs that can not be flattened."""
+    if need.method == "composite":
+        return None
+    return ":".join(str(part) for part in need)
+
+
+def need_tokens(needs: Iterable[Need]) -> list[str]:
+    """Return sorted unique index tokens of the needs."""
+    return sorted({token for need in needs if (token := need_token(need)) is not None})
+
+
+def workflow_access(record: Record, actions: Iterable[str] = DENORMALIZED_ACTIONS) -> dict[str, dict[str, list[str]]]:
+    """Return the need tokens granting and denying the actions on the record in its current state."""
+    try:
+        workflow = current_oarepo_workflows.get_workflow(record)
+    except (MissingWorkflowError, InvalidWorkflowError):
+        return {}
+    ret = {}
+    for action in actions:
+        policy = workflow.permissions(action, record=record)
+        if not hasattr(policy, f"can_{action}"):
+            continue
+        ret[action] = {
+            "grant": need_tokens(policy.needs),
+            "deny": need_tokens(policy.excludes),
+        }
+    return ret
+
+
+def workflow_access_query_filter(action: str, identity: Identity | None) -> dsl.query.Query:
+    """Return query matching documents whose denormalized permissions grant the action to the identity."""
+    if identity is None:
+        return dsl.Q("match_none")
+    tokens = need_tokens(identity.provides)
+    field = f"{ACCESS_FIELD}.{action}"
+    return dsl.Q(
+        "bool",
+        filter=[dsl.Q("terms", **{f"{field}.grant": tokens})],
+        must_not=[dsl.Q("terms", **{f"{field}.deny": tokens})],
+    )
+
+
+def is_access_denormalized(action: str) -> bool:
+    """Return True if the search filter of the action uses the denormalized permissions."""
+    from flask import current_app
+
+    return bool(current_app.config.get("WORKFLOWS_ACCESS_DENORMALIZATION")) and action in DENORMALIZED_ACTIONS
+
+
+def access_mapping() -> dict[str, Any]:
+    """Return the search mapping of the ``_workflow_access`` field."""
+    tokens = {"type": "keyword", "ignore_above": 1024}
+    return {
+        ACCESS_FIELD: {
+            "type": "object",
+            "properties": {
+                action: {"type": "object", "properties": {"grant": tokens, "deny": tokens}}
+                for action in DENORMALIZED_ACTIONS
+            },
+        }
+    }
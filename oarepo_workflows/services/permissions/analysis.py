@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Static analysis of permission generator trees with respect to record states."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from oarepo_workflows.requests.generators.multiple_entities import MultipleEntitiesGenerator
+
+from .generators import IfInState
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from invenio_records_permissions.generators import Generator
+
+
+def reachable_states(
+    generators: Iterable[Generator],
+    predicate: Callable[[Generator], bool],
+) -> frozenset[str] | None:
+    """Return the record states in which a generator matching the predicate is reachable.
+
+    The generator tree is walked without evaluating it. Only ``IfInState`` then-branches
+    restrict the states, all other constructs are treated conservatively.
+
+    :param generators: generators to analyse, usually the content of a ``can_*`` permission
+                       or requesters of a workflow request
+    :param predicate:  returns True for the generators we are looking for
+    :return: an empty frozenset if no matching generator is reachable, a frozenset of states
+             if the matching generators are reachable only in these states, or None if the
+             states can not be determined statically (unconditional occurrence, an else-branch
+             or an unknown composite generator)
+    """
+    ret: frozenset[str] | None = frozenset()
+    for generator in generators:
+        states = _generator_reachable_states(generator, predicate)
+        if states is None:
+            return None
+        ret = ret | states
+    return ret
+
+
+def _generator_reachable_states(
+    generator: Generator,
+    predicate: Callable[[Generator], bool],
+) -> frozenset[str] | None:
+    if predicate(generator):
+        return None
+
+    # subclasses might override the condition, so only the exact class is analysed
+    if type(generator) is IfInState:
+        then_states = reachable_states(generator.then_, predicate)
+        if reachable_states(generator.else_, predicate) != frozenset():
+            # else branch is taken in all the other (not enumerable) states
+            return None
+        if then_states is None:
+            return generator.states
+        return then_states & generator.states
+
+    if isinstance(generator, MultipleEntitiesGenerator):
+        return reachable_states(generator.generators, predicate)
+
+    children: list[Generator] = [
+        *getattr(generator, "then_", ()),
+        *getattr(generator, "else_", ()),
+        *getattr(generator, "generators", ()),
+    ]
+    if reachable_states(children, predicate) != frozenset():
+        # other conditional/composite generators can not be analysed statically
+        return None
+    return frozenset()
+
+
+def iter_generators(generators: Iterable[Generator]) -> Iterator[Generator]:
+    """Iterate over the generators and all the generators nested in them.
+
+    Branches of conditional generators and children of composite generators are
+    visited, delegating generators (``SameAs``, ``FromRecordWorkflow``) are not followed.
+    """
+    for generator in generators:
+        yield generator
+        yield from iter_generators(
+            [
+                *getattr(generator, "then_", ()),
+                *getattr(generator, "else_", ()),
+                *getattr(generator, "generators", ()),
+            ]
+        )
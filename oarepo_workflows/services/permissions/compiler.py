@@ -0,0 +1,275 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Compilation of workflow permission policies into decision tables.
+
+Most workflow policies are trees of ``IfInState`` generators with leaves that
+do not depend on the record at all (``AnyUser``, ``SystemProcess``, ``HasActionNeed``, ...).
+For such policies the needs and excludes depend only on the state of the record,
+so they can be computed once per (policy class, action, state):
+
+.. code-block:: text
+
+    state -> (static needs, static excludes, dynamic generators)
+
+At runtime the entry for the record's state is looked up and only the dynamic
+generators (record owners, community roles, custom generators, ...) are evaluated.
+
+Only exact instances of the known generators are compiled, subclasses might
+override their behaviour and are always evaluated at runtime.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import weakref
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, override
+
+from flask import current_app, has_app_context
+from invenio_records_permissions.generators import (
+    AnyUser,
+    AuthenticatedUser,
+    Disable,
+    Generator,
+    SystemProcess,
+)
+from invenio_records_permissions.generators import SameAs as InvenioSameAs
+
+from .generators import HasActionNeed, IfInState, SameAs
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from flask_principal import Need
+
+STATIC_GENERATORS: frozenset[type] = frozenset({AnyUser, AuthenticatedUser, SystemProcess, Disable, HasActionNeed})
+"""Generators whose needs and excludes do not depend on the context."""
+
+SAME_AS_GENERATORS: frozenset[type] = frozenset({InvenioSameAs, SameAs})
+
+
+class StaticNeedsGenerator(Generator):
+    """Generator returning precomputed needs and excludes."""
+
+    def __init__(self, needs: frozenset[Need], excludes: frozenset[Need]) -> None:
+        """Initialize the generator."""
+        self._needs = needs
+        self._excludes = excludes
+
+    @override
+    def needs(self, **context: Any) -> Sequence[Need]:
+        return list(self._needs)
+
+    @override
+    def excludes(self, **context: Any) -> Sequence[Need]:
+        return list(self._excludes)
+
+    def __repr__(self) -> str:
+        """Return representation of the generator."""
+        return f"StaticNeedsGenerator(needs={set(self._needs)!r}, excludes={set(self._excludes)!r})"
+
+
+@dataclasses.dataclass(frozen=True)
+class DecisionTableEntry:
+    """Needs of a policy action for a single state."""
+
+    needs: frozenset[Need]
+    excludes: frozenset[Need]
+    dynamic: tuple[Generator, ...]
+    """Generators that must be evaluated at runtime."""
+
+    generators: tuple[Generator, ...]
+    """Generators to be used instead of the original ones - static needs followed by the dynamic generators."""
+
+
+@dataclasses.dataclass(frozen=True)
+class DecisionTable:
+    """Compiled permission of a policy action."""
+
+    by_state: Mapping[str, DecisionTableEntry]
+    default: DecisionTableEntry
+    """Entry for records in states not mentioned in the policy and for calls without a record."""
+
+    def lookup(self, record: Any) -> DecisionTableEntry:
+        """Return the entry for the state of the record."""
+        state = getattr(record, "state", None)
+        if state is None:
+            return self.default
+        return self.by_state.get(state, self.default)
+
+
+class DecisionTables:
+    """Compiled decision tables keyed by policy class and action.
+
+    The workflows extension keeps one instance in its cache manager, so each generation
+    of the workflow configuration has its own tables and a reload never mixes them.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty store, the tables are compiled on the first use."""
+        self._tables: weakref.WeakKeyDictionary[type, dict[str, DecisionTable | None]] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, policy_cls: type, action: str) -> DecisionTable | None:
+        """Return the decision table of the policy class and action, compiling it on the first call.
+
+        :return: the table or None if the permission can not be compiled
+        """
+        try:
+            return self._tables[policy_cls][action]
+        except KeyError:
+            pass
+        table = compile_permission(policy_cls, action)
+        with self._lock:
+            self._tables.setdefault(policy_cls, {})[action] = table
+        return table
+
+    def __contains__(self, policy_cls: object) -> bool:
+        """Return True if any permission of the policy class has been compiled."""
+        return policy_cls in self._tables
+
+    def __getitem__(self, policy_cls: type) -> Mapping[str, DecisionTable | None]:
+        """Return the compiled tables of the policy class keyed by action."""
+        return MappingProxyType(self._tables[policy_cls])
+
+    def clear(self) -> None:
+        """Drop all compiled tables."""
+        with self._lock:
+            self._tables.clear()
+
+
+_decision_tables = DecisionTables()
+"""Tables of policies evaluated outside of an application with the workflows extension."""
+
+
+def current_decision_tables() -> DecisionTables:
+    """Return the decision tables of the current generation of the workflow configuration."""
+    if has_app_context():
+        ext = current_app.extensions.get("oarepo-workflows")
+        if ext is not None:
+            return ext.decision_tables  # type: ignore[no-any-return]
+    return _decision_tables
+
+
+def get_decision_table(policy_cls: type, action: str, tables: DecisionTables | None = None) -> DecisionTable | None:
+    """Return the decision table of the policy class and action, compiling it on the first call.
+
+    :param tables: store of the compiled tables, the current one if not given
+    :return: the table or None if the permission can not be compiled
+    """
+    if tables is None:
+        tables = current_decision_tables()
+    return tables.get(policy_cls, action)
+
+
+def clear_decision_tables() -> None:
+    """Drop the compiled decision tables of the current generation, they are compiled again on the next use."""
+    current_decision_tables().clear()
+
+
+def compile_permission(policy_cls: type, action: str) -> DecisionTable | None:
+    """Compile ``can_<action>`` of the policy class into a decision table.
+
+    :return: the table or None if there is nothing to precompute, that is the permission
+             does not contain any static generator, ``IfInState`` or ``SameAs``
+    """
+    generators = getattr(policy_cls, f"can_{action}", None)
+    if generators is None:
+        return None
+    compiler = _Compiler(policy_cls)
+    states = compiler.collect_states(generators, frozenset())
+    if not compiler.compilable:
+        return None
+    return DecisionTable(
+        by_state={state: compiler.compile(generators, state) for state in sorted(states)},
+        default=compiler.compile(generators, None),
+    )
+
+
+class _Compiler:
+    def __init__(self, policy_cls: type) -> None:
+        self.policy_cls = policy_cls
+        self.compilable = False
+
+    def _same_as_generators(self, generator: Generator, seen: frozenset[str]) -> Sequence[Generator] | None:
+        """Return generators of the referenced permission or None if they can not be inlined."""
+        permission_name = getattr(generator, "permission_name", None)
+        if not isinstance(permission_name, str) or permission_name in seen:
+            return None
+        referenced = getattr(self.policy_cls, permission_name, None)
+        if not isinstance(referenced, list | tuple):
+            return None
+        return referenced
+
+    def collect_states(self, generators: Iterable[Generator], seen: frozenset[str]) -> set[str]:
+        """Collect all states mentioned in IfInState generators of the tree."""
+        states: set[str] = set()
+        for generator in generators:
+            generator_type = type(generator)
+            if generator_type in STATIC_GENERATORS:
+                self.compilable = True
+            elif generator_type is IfInState:
+                self.compilable = True
+                states.update(generator.states)  # type: ignore[attr-defined]
+                states |= self.collect_states(generator.then_, seen)  # type: ignore[attr-defined]
+                states |= self.collect_states(generator.else_, seen)  # type: ignore[attr-defined]
+            elif generator_type in SAME_AS_GENERATORS:
+                referenced = self._same_as_generators(generator, seen)
+                if referenced is not None:
+                    self.compilable = True
+                    states |= self.collect_states(referenced, seen | {generator.permission_name})  # type: ignore[attr-defined]
+        return states
+
+    def compile(self, generators: Iterable[Generator], state: str | None) -> DecisionTableEntry:
+        needs: set[Need] = set()
+        excludes: set[Need] = set()
+        dynamic: list[Generator] = []
+        self._compile(generators, state, frozenset(), needs, excludes, dynamic)
+        frozen_needs, frozen_excludes = frozenset(needs), frozenset(excludes)
+        static: tuple[Generator, ...] = (
+            (StaticNeedsGenerator(frozen_needs, frozen_excludes),) if frozen_needs or frozen_excludes else ()
+        )
+        return DecisionTableEntry(
+            needs=frozen_needs,
+            excludes=frozen_excludes,
+            dynamic=tuple(dynamic),
+            generators=(*static, *dynamic),
+        )
+
+    def _compile(  # noqa: PLR0913
+        self,
+        generators: Iterable[Generator],
+        state: str | None,
+        seen: frozenset[str],
+        needs: set[Need],
+        excludes: set[Need],
+        dynamic: list[Generator],
+    ) -> None:
+        for generator in generators:
+            generator_type = type(generator)
+            if generator_type in STATIC_GENERATORS:
+                needs.update(generator.needs())
+                excludes.update(generator.excludes())
+            elif generator_type is IfInState:
+                branch = generator.then_ if state in generator.states else generator.else_  # type: ignore[attr-defined]
+                self._compile(branch, state, seen, needs, excludes, dynamic)
+            elif generator_type in SAME_AS_GENERATORS and (
+                referenced := self._same_as_generators(generator, seen)
+            ) is not None:
+                self._compile(
+                    referenced,
+                    state,
+                    seen | {generator.permission_name},  # type: ignore[attr-defined]
+                    needs,
+                    excludes,
+                    dynamic,
+                )
+            else:
+                dynamic.append(generator)
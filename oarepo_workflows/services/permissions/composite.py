@@ -22,8 +22,10 @@ from invenio_records_permissions.generators import (
 
 from oarepo_workflows.requests import RecipientGeneratorMixin
 
+from .interning import identity_fingerprint, need_interner
+
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterable, Mapping, Sequence
 
     from invenio_records_permissions import RecordPermissionPolicy as RecordPermissionPolicyTypeCheckingBase
     from invenio_records_resources.records import Record
@@ -210,6 +212,16 @@ class RequireAll(RecipientGeneratorMixin, Generator):
         return [{"user": user_id} for user_id in intersected_users]
 
 
+def _provides_any(identity: Identity, needs: Iterable[Need]) -> bool:
+    """Return True if the identity provides any of the needs."""
+    mask, generation = need_interner.intern(needs)
+    fingerprint = identity_fingerprint(identity)
+    if generation != fingerprint.generation:
+        # the interner has started a new generation in the meantime
+        return not identity.provides.isdisjoint(needs)
+    return bool(mask & fingerprint.mask)
+
+
 class BooleanPermissionPolicyMixin(RecordPermissionPolicyTypeCheckingBase):
     """Permission-policy mixin that evaluates :class:`RequireAll` needs.
 
@@ -219,9 +231,12 @@ class BooleanPermissionPolicyMixin(RecordPermissionPolicyTypeCheckingBase):
     semantics that cannot be expressed in that flat model, so this mixin
     overrides ``allows()`` with a two-phase check:
 
-    1. **Regular phase** — delegates to ``super().allows(identity)``.  If the
-       identity is already allowed by a non-composite generator (or is a
-       superuser), return ``True`` immediately.
+    1. **Regular phase** — the same check as ``Permission.allows``, performed
+       on bitsets of interned needs (see :mod:`.interning`): the bitsets of
+       the policy are computed once per policy instance and the bitset of the
+       identity's provides once per identity.  If the identity is already
+       allowed by a non-composite generator (or is a superuser), return
+       ``True`` immediately.
 
     2. **Composite phase** — iterates over all composite ``Need`` objects in
        ``self.needs`` (those with ``method == "composite"``).  For each one it
@@ -257,28 +272,36 @@ class BooleanPermissionPolicyMixin(RecordPermissionPolicyTypeCheckingBase):
         :param identity: The Flask-Principal identity to check.
         :returns: ``True`` if access is granted, ``False`` otherwise.
         """
-        ret = super().allows(identity)
-        if ret:
+        needs, excludes = self.needs, self.excludes
+        needs_mask, excludes_mask, generation = self._interned_needs
+        fingerprint = identity_fingerprint(identity)
+        if generation == fingerprint.generation:
+            matches_needs = not needs or bool(needs_mask & fingerprint.mask)
+            matches_excludes = bool(excludes) and bool(excludes_mask & fingerprint.mask)
+        else:
+            # the interner has started a new generation in the meantime
+            matches_needs = not needs or not needs.isdisjoint(identity.provides)
+            matches_excludes = bool(excludes) and not excludes.isdisjoint(identity.provides)
+
+        if matches_needs and not matches_excludes:
             return True
 
-        if self.excludes and set(self.excludes).intersection(identity.provides):
+        if matches_excludes:
             # Regular explicit excludes must remain authoritative and must not
             # be bypassed by a matching composite alternative.
             return False
 
-        for need in self.needs:
+        for need in needs:
             if need.method != "composite":
                 continue
             generators = need.value
             for generator in generators:
-                generator_needs = set(generator.needs(**self.over))
-                generator_excludes = set(generator.excludes(**self.over))
-                if generator_excludes and generator_excludes.intersection(identity.provides):
+                if _provides_any(identity, generator.excludes(**self.over)):
                     # An explicit exclusion applies.  Deny immediately and
                     # conservatively — do not check further composites.
                     return False
 
-                if not generator_needs or not generator_needs.intersection(identity.provides):
+                if not _provides_any(identity, generator.needs(**self.over)):
                     # This inner generator's needs are not met — the whole
                     # composite is unsatisfied; move on to the next composite.
                     break
@@ -291,6 +314,15 @@ class BooleanPermissionPolicyMixin(RecordPermissionPolicyTypeCheckingBase):
         # fully satisfied by this identity.
         return False
 
+    @cached_property
+    def _interned_needs(self) -> tuple[int, int, int]:
+        """Return bitsets of needs and excludes and the interner generation they belong to."""
+        while True:
+            needs_mask, generation = need_interner.intern(self.needs)
+            excludes_mask, excludes_generation = need_interner.intern(self.excludes)
+            if generation == excludes_generation:
+                return needs_mask, excludes_mask, generation
+
     @cached_property
     def needs(self) -> frozenset[Need]:  # type: ignore[reportIncompatibleMethodOverride]
         """Return the set of needs for this permission policy.
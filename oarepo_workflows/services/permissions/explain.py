@@ -0,0 +1,236 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Explanation of a permission evaluation.
+
+The generators of the workflow policy are walked in the same way as they
+are evaluated, recording needs, excludes, the branch taken by conditional
+generators, outcome of ``RequireAll`` composites and the time spent
+in each generator.
+
+Example:
+    .. code-block:: python
+
+        explanation = current_oarepo_workflows.explain(identity, "read", record)
+        print(explanation.format())
+
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+from typing import TYPE_CHECKING, Any
+
+from .composite import RequireAll
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from flask_principal import Identity, Need
+    from invenio_records_permissions.generators import Generator
+
+    from oarepo_workflows.base import Workflow
+
+
+@dataclasses.dataclass
+class ExplainNode:
+    """Evaluation of a single generator."""
+
+    generator: str
+    """Representation of the generator."""
+
+    needs: list[Need] = dataclasses.field(default_factory=list)
+    excludes: list[Need] = dataclasses.field(default_factory=list)
+
+    matched: bool = False
+    """True if the identity provides any of the needs."""
+
+    excluded: bool = False
+    """True if the identity provides any of the excludes."""
+
+    duration: float = 0.0
+    """Time in seconds spent in needs() and excludes() of the generator, including its children."""
+
+    branch: str | None = None
+    """For conditional generators "then" or "else", depending on the branch taken."""
+
+    satisfied: bool | None = None
+    """For RequireAll, whether all the inner generators matched the identity."""
+
+    error: str | None = None
+    """Error raised when the generator was evaluated."""
+
+    children: list[ExplainNode] = dataclasses.field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of the node."""
+        ret: dict[str, Any] = {
+            "generator": self.generator,
+            "needs": [_need_to_str(n) for n in self.needs],
+            "excludes": [_need_to_str(n) for n in self.excludes],
+            "matched": self.matched,
+            "excluded": self.excluded,
+            "duration": self.duration,
+        }
+        for key in ("branch", "satisfied", "error"):
+            if getattr(self, key) is not None:
+                ret[key] = getattr(self, key)
+        if self.children:
+            ret["children"] = [c.to_dict() for c in self.children]
+        return ret
+
+
+@dataclasses.dataclass
+class PermissionExplanation:
+    """Explanation of a permission evaluation for a single action."""
+
+    action: str
+    workflow: str
+    policy: str
+    """Name of the permission policy class."""
+
+    allowed: bool
+    duration: float
+    """Time in seconds spent in allows() of the policy."""
+
+    generators: list[ExplainNode]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of the explanation."""
+        return {
+            "action": self.action,
+            "workflow": self.workflow,
+            "policy": self.policy,
+            "allowed": self.allowed,
+            "duration": self.duration,
+            "generators": [g.to_dict() for g in self.generators],
+        }
+
+    def format(self) -> str:
+        """Return a human-readable tree of the evaluation."""
+        lines = [
+            f"can_{self.action} in workflow {self.workflow} ({self.policy}): "
+            f"{'allowed' if self.allowed else 'denied'} in {self.duration * 1000:.3f} ms"
+        ]
+        for node in self.generators:
+            lines.extend(_format_node(node, 1))
+        return "\n".join(lines)
+
+
+def explain_permission(
+    workflow: Workflow,
+    identity: Identity,
+    action: str,
+    **context: Any,
+) -> PermissionExplanation:
+    """Explain evaluation of a permission of a workflow.
+
+    :param workflow: workflow whose permission policy is evaluated
+    :param identity: identity the permission is evaluated for
+    :param action:   action, for example "read"
+    :param context:  context of the evaluation, usually contains the record
+    """
+    policy = workflow.permissions(action, **context)
+    start = time.perf_counter()
+    allowed = policy.allows(identity)
+    duration = time.perf_counter() - start
+
+    # fresh policy, so that the nodes are not affected by the caches of the evaluated one
+    policy = workflow.permissions(action, **context)
+    over = policy.over
+    return PermissionExplanation(
+        action=action,
+        workflow=workflow.code,
+        policy=type(policy).__name__,
+        allowed=allowed,
+        duration=duration,
+        generators=[explain_generator(g, identity, over) for g in getattr(policy, f"can_{action}", ())],
+    )
+
+
+def explain_generator(generator: Generator, identity: Identity, context: dict[str, Any]) -> ExplainNode:
+    """Evaluate the generator and its children and return the explanation."""
+    node = ExplainNode(generator=_label(generator))
+    start = time.perf_counter()
+    try:
+        node.needs = list(generator.needs(**context))
+        node.excludes = list(generator.excludes(**context))
+    except Exception as e:  # noqa: BLE001 - explanation must show the error instead of raising it
+        node.error = f"{type(e).__name__}: {e}"
+    node.duration = time.perf_counter() - start
+    node.matched = bool(identity.provides.intersection(node.needs))
+    node.excluded = bool(identity.provides.intersection(node.excludes))
+
+    if isinstance(generator, RequireAll):
+        node.children = [explain_generator(g, identity, context) for g in generator.generators]
+        node.satisfied = all(c.matched and not c.excluded for c in node.children)
+        node.matched = node.satisfied
+        return node
+
+    if hasattr(generator, "then_") and hasattr(generator, "else_"):
+        try:
+            condition = generator._condition(**context)  # noqa: SLF001
+        except Exception as e:  # noqa: BLE001
+            node.error = node.error or f"{type(e).__name__}: {e}"
+            return node
+        node.branch = "then" if condition else "else"
+        node.children = [explain_generator(g, identity, context) for g in _branch(generator, condition)]
+        return node
+
+    children = _children(generator, context)
+    if children:
+        node.children = [explain_generator(g, identity, context) for g in children]
+    return node
+
+
+def _branch(generator: Any, condition: bool) -> Sequence[Generator]:
+    return generator.then_ if condition else generator.else_  # type: ignore[no-any-return]
+
+
+def _children(generator: Any, context: dict[str, Any]) -> Sequence[Generator]:
+    """Return nested generators of composite and delegating generators."""
+    if isinstance(getattr(generator, "generators", None), list | tuple):
+        return generator.generators  # type: ignore[no-any-return]
+    permission_name = getattr(generator, "permission_name", None)
+    policy = context.get("permission_policy")
+    if isinstance(permission_name, str) and policy is not None:
+        return getattr(policy, permission_name, ())  # type: ignore[no-any-return]
+    return ()
+
+
+def _label(generator: Any) -> str:
+    """Return representation of the generator without its nested generators."""
+    if hasattr(generator, "then_") or isinstance(generator, RequireAll):
+        state = getattr(generator, "state", None)
+        return f"{type(generator).__name__}({state})" if state is not None else type(generator).__name__
+    return repr(generator)
+
+
+def _need_to_str(need: Need) -> str:
+    if need.method == "composite":
+        return "composite"
+    return f"{need.method}:{need.value}"
+
+
+def _format_node(node: ExplainNode, depth: int) -> Iterator[str]:
+    flags = []
+    if node.branch:
+        flags.append(f"branch={node.branch}")
+    if node.satisfied is not None:
+        flags.append(f"satisfied={node.satisfied}")
+    if node.matched:
+        flags.append("matched")
+    if node.excluded:
+        flags.append("excluded")
+    if node.error:
+        flags.append(f"error={node.error}")
+    needs = ", ".join(_need_to_str(n) for n in node.needs)
+    yield f"{'  ' * depth}{node.generator} [{needs}] {node.duration * 1000:.3f} ms {' '.join(flags)}".rstrip()
+    for child in node.children:
+        yield from _format_node(child, depth + 1)
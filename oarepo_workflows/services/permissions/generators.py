@@ -15,9 +15,10 @@ import warnings
 from functools import reduce
 from typing import TYPE_CHECKING, Any, override
 
-from flask import current_app
+from flask import current_app, has_app_context
 from flask_principal import Identity, RoleNeed
 from invenio_access import ActionNeed
+from invenio_accounts.models import Role
 from invenio_rdm_records.records.api import RDMDraft, RDMRecord
 from invenio_records_permissions.generators import Generator
 from invenio_records_permissions.generators import SameAs as InvenioSameAs
@@ -26,10 +27,13 @@ from oarepo_runtime.services.generators import (
     ConditionalGenerator,
 )
 from opensearch_dsl.query import MatchNone
+from sqlalchemy import event as sa_event
+from sqlalchemy import inspect as sa_inspect
 
 from oarepo_workflows.errors import InvalidWorkflowError, MissingWorkflowError
 from oarepo_workflows.proxies import current_oarepo_workflows
 from oarepo_workflows.requests import RecipientGeneratorMixin
+from oarepo_workflows.requests.generators.multiple_entities import MultipleEntitiesGenerator
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping, Sequence
@@ -49,10 +53,9 @@ def query_filters_from_all_workflows(action: str, **context: Any) -> list[dsl.qu
     """Get query filters to match records depending on the records' workflow."""
     workflows = current_oarepo_workflows.record_workflows
     queries = []
+    workflow_query_filters = current_oarepo_workflows.workflow_query_filters
     for workflow in workflows:
-        q_in_workflow = dsl.Q("term", **{"parent.workflow": workflow.code})
-        if workflow.code == current_oarepo_workflows.default_workflow.code:
-            q_in_workflow = q_in_workflow | ~dsl.Q("exists", field="parent.workflow")
+        q_in_workflow = workflow_query_filters[workflow.code]
         workflow_filters = workflow.permissions(action, **context).query_filters
         if not workflow_filters:
             workflow_filters = [dsl.Q("match_none")]
@@ -258,14 +261,19 @@ class IfInState(RecipientGeneratorMixin, ConditionalGenerator):
         if not isinstance(state, list | tuple):
             raise TypeError(f"State must be a string, list or tuple. Got {type(state)}.")
         self.state = state
+        # set for constant-time membership test in _condition
+        self.states = frozenset(state)
         super().__init__(then_, else_ or [])
+        self._then_recipients = MultipleEntitiesGenerator(self.then_)
+        self._else_recipients = MultipleEntitiesGenerator(self.else_)
 
     @override
     def _condition(self, record: Record, **context: Any) -> bool:  # type: ignore[reportIncompatibleMethodOverride]
         """Check if the record is in the state."""
         try:
-            return record.state in self.state  # type: ignore[reportAttributeAccessIssue]
-        except AttributeError:
+            return record.state in self.states  # type: ignore[reportAttributeAccessIssue]
+        except (AttributeError, TypeError):
+            # TypeError for unhashable state values
             return False
 
     # TODO: 1. ConditionalGenerator is basically AggregateGenerator with _generators based on condition
@@ -278,12 +286,7 @@ class IfInState(RecipientGeneratorMixin, ConditionalGenerator):
         request_type: RequestType | None = None,
         **context: Any,
     ) -> list[Mapping[str, str]]:
-        from oarepo_workflows.requests.generators.multiple_entities import (
-            MultipleEntitiesGenerator,
-        )
-
-        recipients = self.then_ if self._condition(record, **context) else self.else_  # type: ignore[reportArgumentType]
-        generator = MultipleEntitiesGenerator(recipients)
+        generator = self._then_recipients if self._condition(record, **context) else self._else_recipients  # type: ignore[reportArgumentType]
         return generator.reference_receivers(record=record, request_type=request_type, **context)
 
     @override
@@ -302,6 +305,16 @@ class IfInState(RecipientGeneratorMixin, ConditionalGenerator):
 class IfRDMRecordPassed(RecipientGeneratorMixin, ConditionalGenerator):
     """Conditional generator that checks if the record is a RDM record."""
 
+    def __init__(
+        self,
+        then_: Sequence[InvenioGenerator],
+        else_: Sequence[InvenioGenerator] | None = None,
+    ) -> None:
+        """Initialize the generator."""
+        super().__init__(then_, else_ or [])
+        self._then_recipients = MultipleEntitiesGenerator(self.then_)
+        self._else_recipients = MultipleEntitiesGenerator(self.else_)
+
     @override
     def _condition(self, record: Record, **context: Any) -> bool:  # type: ignore[reportIncompatibleMethodOverride]
         """Check if the record is in the state."""
@@ -314,12 +327,7 @@ class IfRDMRecordPassed(RecipientGeneratorMixin, ConditionalGenerator):
         request_type: RequestType | None = None,
         **context: Any,
     ) -> list[Mapping[str, str]]:
-        from oarepo_workflows.requests.generators.multiple_entities import (
-            MultipleEntitiesGenerator,
-        )
-
-        recipients = self.then_ if self._condition(record, **context) else self.else_  # type: ignore[reportArgumentType]
-        generator = MultipleEntitiesGenerator(recipients)
+        generator = self._then_recipients if self._condition(record, **context) else self._else_recipients  # type: ignore[reportArgumentType]
         return generator.reference_receivers(record=record, request_type=request_type, **context)
 
     @override
@@ -355,6 +363,58 @@ class SameAs(InvenioSameAs):
         super().__init__(permission_name)
 
 
+ROLE_ID_CACHE_KEY_PREFIX = "oarepo_workflows:role_id:"
+"""Prefix of invenio-cache keys holding ids of roles, followed by the role name."""
+
+
+def _role_id_cache() -> Any:
+    """Return cache shared by all processes or None if invenio-cache is not installed."""
+    cache_ext = current_app.extensions.get("invenio-cache")
+    return cache_ext.cache if cache_ext is not None else None
+
+
+def get_role_id(role_name: str) -> Any | None:
+    """Return id of the role with the given name, None if the role does not exist.
+
+    Ids of existing roles are cached in invenio-cache for ``WORKFLOWS_ROLE_ID_CACHE_TTL`` seconds,
+    so that all processes share them. Without invenio-cache, the role is looked up every time.
+    """
+    cache = _role_id_cache()
+    key = f"{ROLE_ID_CACHE_KEY_PREFIX}{role_name}"
+    if cache is not None:
+        role_id = cache.get(key)
+        if role_id is not None:
+            return role_id
+    role = current_app.extensions["security"].datastore.find_role(role_name)
+    if role is None:
+        return None
+    if cache is not None:
+        cache.set(key, role.id, timeout=current_app.config["WORKFLOWS_ROLE_ID_CACHE_TTL"])
+    return role.id
+
+
+def clear_role_id_cache(mapper: Any, connection: Any, target: Role) -> None:
+    """Remove the cached id of an updated or deleted role, used as an SQLAlchemy event listener.
+
+    Only changes made through the ORM trigger the listener, cached ids of roles changed
+    by bulk updates expire after ``WORKFLOWS_ROLE_ID_CACHE_TTL`` seconds.
+    """
+    if not has_app_context():
+        return
+    cache = _role_id_cache()
+    if cache is None:
+        return
+    names = {target.name}
+    # a renamed role must be removed under its previous name as well
+    history = sa_inspect(target).attrs.name.history
+    names.update(name for name in history.deleted or () if name)
+    cache.delete_many(*(f"{ROLE_ID_CACHE_KEY_PREFIX}{name}" for name in names if name))
+
+
+sa_event.listen(Role, "after_update", clear_role_id_cache)
+sa_event.listen(Role, "after_delete", clear_role_id_cache)
+
+
 class UserWithRole(RecipientGeneratorMixin, Generator):
     """Generator that checks if the user has a specific role."""
 
@@ -364,20 +424,19 @@ class UserWithRole(RecipientGeneratorMixin, Generator):
 
     @override
     def needs(self, **context: Any) -> Sequence[Need]:
-        role = current_app.extensions["security"].datastore.find_role(self.role_name)
-        if role is None:
+        role_id = get_role_id(self.role_name)
+        if role_id is None:
             return []
-        return [RoleNeed(role.id)]
+        return [RoleNeed(role_id)]
 
     @override
     def query_filter(self, identity: Identity | None = None, **kwargs: Any) -> dsl.query.Query:
         if not identity:
             return dsl.Q("match_none")
-        role = current_app.extensions["security"].datastore.find_role(self.role_name)
-        if role is None:
+        role_id = get_role_id(self.role_name)
+        if role_id is None:
             return dsl.Q("match_none")
 
-        role_id = role.id
         for provide in identity.provides:
             if provide.method == "role" and provide.value == role_id:
                 return dsl.Q("match_all")
@@ -398,10 +457,10 @@ class UserWithRole(RecipientGeneratorMixin, Generator):
         request_type: RequestType | None = None,
         **context: Any,
     ) -> list[Mapping[str, str]]:  # pragma: no cover
-        role = current_app.extensions["security"].datastore.find_role(self.role_name)
-        if role is None:
+        role_id = get_role_id(self.role_name)
+        if role_id is None:
             return []
-        return [{"group": role.id}]
+        return [{"group": role_id}]
 
 
 class HasActionNeed(RecipientGeneratorMixin, Generator):
@@ -0,0 +1,231 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Opt-in timing of permission generators.
+
+If ``WORKFLOWS_METRICS_ENABLED`` is set, ``needs``, ``excludes`` and ``query_filter``
+of the generators from this package and ``allows`` of ``BooleanPermissionPolicyMixin``
+are replaced with timing wrappers when the application is initialized. Cached
+``needs`` and ``excludes`` of the policy are wrapped as well to count cache hits.
+
+The wrappers are installed on the classes, that is once per process, but each measurement
+is recorded to the metrics of the current application and only if the application
+has the option set. Applications without the option pay only for the check of the option.
+If no application sets the option, nothing is wrapped and the permission evaluation
+runs the original code.
+
+The measured times are inclusive, that is time of a conditional generator includes
+the time of the generators in its branches.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import time
+from typing import TYPE_CHECKING, Any
+
+from flask import current_app, has_app_context
+
+from .composite import BooleanPermissionPolicyMixin, RequireAll
+from .generators import FromRecordWorkflow, IfInState, IfRDMRecordPassed, InAnyWorkflow, SameAs
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from oarepo_workflows.metrics import WorkflowMetrics
+
+INSTRUMENTED_GENERATORS: tuple[type, ...] = (
+    FromRecordWorkflow,
+    InAnyWorkflow,
+    IfInState,
+    IfRDMRecordPassed,
+    SameAs,
+    RequireAll,
+)
+"""Generator classes whose calls are timed."""
+
+INSTRUMENTED_METHODS = ("needs", "excludes", "query_filter")
+
+_current_action: contextvars.ContextVar[str] = contextvars.ContextVar("oarepo_workflows_action", default="")
+
+_MISSING = object()
+
+_installed: list[tuple[type, str, Any]] = []
+"""Original class attributes replaced by the instrumentation, used to uninstall it."""
+
+
+_metrics_override: WorkflowMetrics | None = None
+"""Metrics passed explicitly to ``install_instrumentation``, used instead of the application's metrics."""
+
+
+def describe_instrumentation_metrics(metrics: WorkflowMetrics) -> None:
+    """Register help texts of the metrics recorded by the instrumentation."""
+    metrics.describe("generator_calls_total", "Number of permission generator calls.")
+    metrics.describe("generator_seconds_total", "Cumulative time spent in permission generator calls.")
+    metrics.describe("policy_cache_hits_total", "Number of cached needs/excludes reused by a permission policy.")
+    metrics.describe("policy_cache_misses_total", "Number of needs/excludes computed by a permission policy.")
+
+
+def install_instrumentation(metrics: WorkflowMetrics | None = None) -> None:
+    """Wrap the permission generators and policies with timing wrappers.
+
+    The wrappers are installed only once, calling this function repeatedly
+    only changes the explicitly passed metrics.
+
+    :param metrics: metrics collection all the measurements are recorded to, regardless
+                    of the application (used in tests and benchmarks). If not given,
+                    the measurements are recorded to the metrics of the current application
+                    if it has ``WORKFLOWS_METRICS_ENABLED`` set.
+    """
+    global _metrics_override  # noqa: PLW0603
+    if metrics is not None:
+        describe_instrumentation_metrics(metrics)
+        _metrics_override = metrics
+    if _installed:
+        return
+
+    for cls in INSTRUMENTED_GENERATORS:
+        for method_name in INSTRUMENTED_METHODS:
+            _replace(cls, method_name, _timed_generator_method(getattr(cls, method_name), method_name))
+
+    _replace(
+        BooleanPermissionPolicyMixin,
+        "allows",
+        _timed_allows(BooleanPermissionPolicyMixin.allows),
+    )
+    for property_name in ("needs", "excludes"):
+        _replace(
+            BooleanPermissionPolicyMixin,
+            property_name,
+            _CountedCachedProperty(BooleanPermissionPolicyMixin.__dict__[property_name], property_name),
+        )
+
+
+def uninstall_instrumentation() -> None:
+    """Restore the original generators and policies."""
+    global _metrics_override  # noqa: PLW0603
+    _metrics_override = None
+    while _installed:
+        cls, name, original = _installed.pop()
+        if original is _MISSING:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+
+
+def is_instrumentation_installed() -> bool:
+    """Return True if the timing wrappers are in place."""
+    return bool(_installed)
+
+
+def _current_metrics() -> WorkflowMetrics | None:
+    """Return the metrics the measurements should be recorded to, None if they should not be recorded."""
+    if _metrics_override is not None:
+        return _metrics_override
+    if not has_app_context() or not current_app.config.get("WORKFLOWS_METRICS_ENABLED"):
+        return None
+    ext = current_app.extensions.get("oarepo-workflows")
+    return ext.metrics if ext is not None else None
+
+
+def _replace(cls: type, name: str, value: Any) -> None:
+    _installed.append((cls, name, cls.__dict__.get(name, _MISSING)))
+    setattr(cls, name, value)
+
+
+def _action_of(generator: Any, kwargs: dict[str, Any]) -> str | None:
+    """Return the action a workflow-delegating generator evaluates, None for other generators."""
+    if isinstance(generator, FromRecordWorkflow):
+        return generator._action_name(**kwargs)  # noqa: SLF001
+    if isinstance(generator, InAnyWorkflow):
+        return generator._action  # noqa: SLF001
+    return None
+
+
+def _timed_generator_method(method: Callable[..., Any], method_name: str) -> Any:
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        metrics = _current_metrics()
+        if metrics is None:
+            return method(self, *args, **kwargs)
+        action = _action_of(self, kwargs)
+        token = _current_action.set(action) if action is not None else None
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if token is not None:
+                _current_action.reset(token)
+            labels = {
+                "generator": type(self).__name__,
+                "method": method_name,
+                "action": action or _current_action.get(),
+            }
+            metrics.inc("generator_calls_total", **labels)
+            metrics.inc("generator_seconds_total", elapsed, **labels)
+
+    return wrapper
+
+
+def _timed_allows(method: Callable[..., bool]) -> Any:
+    @functools.wraps(method)
+    def wrapper(self: Any, identity: Any) -> bool:
+        metrics = _current_metrics()
+        if metrics is None:
+            return method(self, identity)
+        token = _current_action.set(self.action)
+        start = time.perf_counter()
+        try:
+            return method(self, identity)
+        finally:
+            elapsed = time.perf_counter() - start
+            _current_action.reset(token)
+            labels = {"generator": type(self).__name__, "method": "allows", "action": self.action}
+            metrics.inc("generator_calls_total", **labels)
+            metrics.inc("generator_seconds_total", elapsed, **labels)
+
+    return wrapper
+
+
+class _CountedCachedProperty:
+    """Data descriptor around a cached_property counting its cache hits and misses.
+
+    Being a data descriptor, it is consulted before the instance dictionary,
+    so it sees the cached value and can count the hit.
+    """
+
+    def __init__(self, cached: Any, name: str) -> None:
+        self._cached = cached
+        self._name = name
+        self.__doc__ = cached.__doc__
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        metrics = _current_metrics()
+        if metrics is None:
+            return self._cached.__get__(instance, owner)
+        labels = {"policy": type(instance).__name__, "property": self._name, "action": instance.action}
+        try:
+            value = instance.__dict__[self._name]
+        except KeyError:
+            pass
+        else:
+            metrics.inc("policy_cache_hits_total", **labels)
+            return value
+        metrics.inc("policy_cache_misses_total", **labels)
+        token = _current_action.set(instance.action)
+        try:
+            return self._cached.__get__(instance, owner)
+        finally:
+            _current_action.reset(token)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self._name] = value
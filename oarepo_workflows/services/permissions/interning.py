@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Interning of needs into bit positions.
+
+Every distinct need gets a small integer, a set of needs is then represented
+as an integer with the corresponding bits set and testing whether two sets
+intersect is a single ``&``.
+
+The provides of an identity are converted once and the result is kept on the
+identity as its :class:`IdentityFingerprint`, together with a snapshot of the
+provides it was computed from.
+
+The number of interned needs is bounded. When the limit is reached, the interner
+starts a new generation with no needs and all masks of the previous generation
+(including fingerprints) are recomputed on their next use.
+
+Example:
+    .. code-block:: python
+
+        fingerprint = identity_fingerprint(identity)
+        needs_mask, generation = need_interner.intern(policy.needs)
+        if generation == fingerprint.generation:
+            allowed = bool(needs_mask & fingerprint.mask)
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from flask_principal import Identity, Need
+
+DEFAULT_MAX_SIZE = 4096
+"""Maximum number of interned needs in one generation, keeps the bitsets at most 512 bytes long."""
+
+_FINGERPRINT_ATTRIBUTE = "_oarepo_workflows_fingerprint"
+
+
+class NeedInterner:
+    """Thread-safe mapping of needs to bit positions."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Create an empty interner.
+
+        :param max_size: number of needs after which a new generation is started
+        """
+        self.max_size = max_size
+        self.generation = 0
+        self._bits: dict[Need, int] = {}
+        self._lock = threading.Lock()
+
+    def bit(self, need: Need) -> int:
+        """Return the bit (a power of two) of the need, interning it if it is seen for the first time."""
+        try:
+            return self._bits[need]
+        except KeyError:
+            pass
+        with self._lock:
+            bit = self._bits.get(need)
+            if bit is None:
+                if len(self._bits) >= self.max_size:
+                    self._bits = {}
+                    self.generation += 1
+                bit = self._bits[need] = 1 << len(self._bits)
+            return bit
+
+    def intern(self, needs: Iterable[Need]) -> tuple[int, int]:
+        """Return the bitset of the needs and the generation it belongs to.
+
+        Only bitsets of the same generation can be compared. Composite needs
+        (``RequireAll``) are never provided by an identity, they are skipped.
+        """
+        needs = tuple(needs)
+        while True:
+            generation = self.generation
+            mask = 0
+            bits = self._bits
+            for need in needs:
+                if need.method == "composite":
+                    continue
+                bit = bits.get(need)
+                mask |= bit if bit is not None else self.bit(need)
+            if self.generation == generation:
+                return mask, generation
+
+    def __len__(self) -> int:
+        """Return the number of needs interned in the current generation."""
+        return len(self._bits)
+
+
+need_interner = NeedInterner()
+"""Process-wide interner used by the permission policies."""
+
+
+@dataclasses.dataclass(frozen=True)
+class IdentityFingerprint:
+    """Interned provides of an identity."""
+
+    mask: int
+    """Bitset of the identity's provides."""
+
+    generation: int
+    """Generation of the interner the mask belongs to."""
+
+    provides: frozenset[Need]
+    """Provides the mask was computed from, used to detect later changes of the identity's needs."""
+
+
+def identity_fingerprint(identity: Identity, interner: NeedInterner = need_interner) -> IdentityFingerprint:
+    """Return the fingerprint of the identity, computing it on the first call.
+
+    The fingerprint is stored on the identity, so it is computed once per request.
+    It is recomputed if the needs of the identity have changed since then
+    (added, removed or replaced) or if the interner has started a new generation.
+    """
+    provides = identity.provides
+    fingerprint: IdentityFingerprint | None = getattr(identity, _FINGERPRINT_ATTRIBUTE, None)
+    if fingerprint is None or fingerprint.generation != interner.generation or fingerprint.provides != provides:
+        snapshot = frozenset(provides)
+        mask, generation = interner.intern(snapshot)
+        fingerprint = IdentityFingerprint(mask=mask, generation=generation, provides=snapshot)
+        setattr(identity, _FINGERPRINT_ATTRIBUTE, fingerprint)
+    return fingerprint
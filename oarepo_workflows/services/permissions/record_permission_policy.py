@@ -17,6 +17,7 @@ from invenio_records_permissions.generators import (
     SystemProcess,
 )
 
+from .access import is_access_denormalized, workflow_access_query_filter
 from .composite import BooleanPermissionPolicyMixin
 from .generators import (
     FromRecordWorkflow,
@@ -135,4 +136,6 @@ class WorkflowRecordPermissionPolicyMixin(BooleanPermissionPolicyMixin, InvenioR
             "read_all_records",
         ):
             return super().query_filters  # type: ignore[no-any-return]
+        if is_access_denormalized(self.action):
+            return [workflow_access_query_filter(self.action, self.over.get("identity"))]
         return query_filters_from_all_workflows(self.action, **self.over)
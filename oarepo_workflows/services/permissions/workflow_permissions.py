@@ -9,7 +9,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from invenio_administration.generators import Administration
 from invenio_rdm_records.services.generators import IfRecordDeleted, RecordOwners
@@ -23,11 +23,71 @@ from invenio_records_permissions.generators import (
 )
 from invenio_users_resources.services.permissions import UserManager
 
+from .compiler import get_decision_table
 from .generators import IfInState
 
+if TYPE_CHECKING:
+    from invenio_records_permissions.generators import Generator
+
 
 class BaseWorkflowPermissionPolicy(RecordPermissionPolicy):
-    """Base class for workflow permissions (non-rdm and rdm)."""
+    """Base class for workflow permissions (non-rdm and rdm).
+
+    Needs and excludes are evaluated from a decision table compiled from the policy
+    on the first use (see :mod:`oarepo_workflows.services.permissions.compiler`).
+    Set ``compile_permissions`` to False to always evaluate the generators directly.
+    """
+
+    compile_permissions = True
+
+    _compiling = True
+    """False while the original generators are evaluated, see ``query_filters``."""
+
+    system_process: Generator | None = None
+    """If set, the generator is appended to all ``can_*`` permissions of the class and its subclasses."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Append the system_process generator to all permissions of the new class.
+
+        This is done once, when the class is created, so that instantiating
+        the policy does not need to inspect or modify the class.
+        """
+        super().__init_subclass__(**kwargs)
+        system_process = cls.system_process
+        if system_process is None:
+            return
+        for attr_name in dir(cls):
+            if not attr_name.startswith("can_"):
+                continue
+            can = getattr(cls, attr_name)
+            if isinstance(can, list | tuple) and system_process not in can:
+                setattr(cls, attr_name, (*can, system_process))
+
+    @property
+    def generators(self) -> Any:
+        """Return generators of the action compiled for the state of the record.
+
+        The static generators are replaced by their precomputed needs and excludes
+        and the branches of ``IfInState`` not matching the state are dropped, so
+        ``needs`` and ``excludes`` evaluate only the dynamic generators.
+        """
+        if self._compiling:
+            table = get_decision_table(type(self), self.action) if self.compile_permissions else None
+            if table is not None:
+                return table.lookup(self.over.get("record")).generators
+        return super().generators
+
+    @property
+    def query_filters(self) -> Any:
+        """Return query filters of the action.
+
+        The filters select records in any state, so they are built from the original generators.
+        """
+        self._compiling = False
+        try:
+            return super().query_filters
+        finally:
+            del self._compiling
 
 
 class DefaultWorkflowPermissions(BaseWorkflowPermissionPolicy):
@@ -52,17 +112,6 @@ class DefaultWorkflowPermissions(BaseWorkflowPermissionPolicy):
 
     system_process = SystemProcess()
 
-    def __init__(self, action_name: str, **over: Any) -> None:
-        """Initialize the workflow permissions."""
-        if hasattr(
-            self, f"can_{action_name}"
-        ):  # edge case in FromRecordWorkflow; request action doesn't have to be defined if it's not in workflow
-            can = getattr(self, f"can_{action_name}")
-            if self.system_process not in can:
-                can = (*can, self.system_process)
-                setattr(self.__class__, f"can_{action_name}", can)
-        super().__init__(action_name, **over)
-
     can_read = (
         IfInState("draft", [RecordOwners()]),
         IfInState("published", [AnyUser()]),
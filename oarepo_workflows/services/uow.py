@@ -8,22 +8,56 @@
 """Unit of Work operations module for workflows.
 
 Provides operation class for changing the workflow state.
+
+In compare-and-swap mode, the state change asserts at commit time that the record
+has not been changed since it was read. This is done with a conditional UPDATE
+on the ``version_id`` of the record's row, so no lock is taken when the record is read.
+Every change of the state bumps the revision, so checking the revision
+checks the previous state as well.
+
+Example:
+    .. code-block:: python
+
+        try:
+            current_oarepo_workflows.set_state(
+                identity, record, "published", expected_state="submitted", uow=uow
+            )
+            uow.commit()
+        except StateChangeConflictError:
+            # another transition won, reload the record and decide again
+            ...
+
+Notifiers are called through the notifier guard of the extension, which records their
+latency and errors. A notifier that has repeatedly exceeded its time budget (or failed)
+is either deferred after the commit of the state change, where it runs in its own
+unit of work (``WORKFLOWS_NOTIFIER_OVERRUN_ACTION = "defer"``), or skipped (``"disable"``).
+Errors of deferred notifiers are always logged and recorded, as the state change
+they were deferred from has already been committed.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, cast, override
 
+from flask import current_app
+from invenio_db import db
 from invenio_db.uow import Operation, UnitOfWork
-from invenio_records_resources.services.uow import RecordCommitOp
+from invenio_records_resources.services.uow import RecordCommitOp, RecordIndexOp
 from oarepo_runtime.proxies import current_runtime
+from sqlalchemy import update
+from sqlalchemy.orm.exc import StaleDataError
 
+from oarepo_workflows.errors import InvalidWorkflowError, MissingWorkflowError, StateChangeConflictError
+from oarepo_workflows.notifiers import notifier_name
 from oarepo_workflows.proxies import current_oarepo_workflows
 
 if TYPE_CHECKING:
     from flask_principal import Identity
     from invenio_records_resources.records.api import Record
 
+    from oarepo_workflows.base import StateChangedNotifier
+    from oarepo_workflows.notifiers import NotifierGuard
+
 
 class StateChangeOperation(Operation):
     """Unit of Work operation for changing the state of a record."""
@@ -36,32 +70,119 @@ class StateChangeOperation(Operation):
         *extra_args: Any,
         commit_record: bool = True,
         notify_later: bool = False,
+        compare_and_swap: bool | None = None,
+        expected_state: str | None = None,
+        expected_revision: int | None = None,
         **extra_kwargs: Any,
     ):
-        """Initialize the operation with the record and the new state."""
+        """Initialize the operation with the record and the new state.
+
+        :param compare_and_swap:  fail with ``StateChangeConflictError`` if the record has been changed
+                                  concurrently. Defaults to ``WORKFLOWS_STATE_CHANGE_COMPARE_AND_SWAP``,
+                                  implied if an expected state or revision is given
+        :param expected_state:    state the record must be in, defaults to its current state
+        :param expected_revision: revision the record must have, defaults to its current revision
+        """
         self.identity = identity
         self.record = record
         self.previous_value = cast("str", getattr(record, "state", ""))
         self.new_state = new_state
         self.commit = commit_record
         self.notify_later = notify_later
+        if compare_and_swap is None:
+            compare_and_swap = (
+                expected_state is not None
+                or expected_revision is not None
+                or bool(current_app.config.get("WORKFLOWS_STATE_CHANGE_COMPARE_AND_SWAP"))
+            )
+        self.compare_and_swap = compare_and_swap
+        self.expected_state = expected_state
+        self.expected_revision = expected_revision
+        model = getattr(record, "model", None)
+        self.read_revision = model.version_id - 1 if model is not None and model.version_id is not None else None
         self.extra_args = extra_args
         self.extra_kwargs = extra_kwargs
+        self._deferred: list[StateChangedNotifier] = []
         super().__init__()
 
     @override
     def on_register(self, uow: UnitOfWork) -> None:
         """Change the state of the record and commit the changes."""
+        if self.compare_and_swap:
+            self._check_expected()
+
         self.record.state = self.new_state  # type: ignore[assignment]
 
-        if self.commit:
+        if self.compare_and_swap:
+            # the record is indexed in on_commit, only after the revision has been checked
+            if self.commit:
+                try:
+                    uow.register(RecordCommitOp(self.record, indexer=None))
+                except StaleDataError as e:
+                    # the versioned UPDATE of the record has been flushed and found a newer revision
+                    raise self._conflict() from e
+        elif self.commit:
             service = current_runtime.get_record_service_for_record(self.record)
             uow.register(RecordCommitOp(self.record, indexer=service.indexer))
+        elif self._reindex_on_change():
+            # permissions stored in the index depend on the state, so the record must be reindexed
+            service = current_runtime.get_record_service_for_record(self.record)
+            uow.register(RecordIndexOp(self.record, indexer=service.indexer))
 
         # If we do not notify later, run the notifications immediately
         if not self.notify_later:
             self.run_notifications(uow)
 
+    @override
+    def on_commit(self, uow: UnitOfWork) -> None:
+        """Check that the record has not been changed concurrently and index it."""
+        if not self.compare_and_swap:
+            return
+        self._swap()
+        if self.commit or self._reindex_on_change():
+            service = current_runtime.get_record_service_for_record(self.record)
+            service.indexer.index(self.record)
+
+    def _reindex_on_change(self) -> bool:
+        """Return True if the record must be reindexed even if it is not committed by this operation."""
+        return bool(current_app.config.get("WORKFLOWS_ACCESS_DENORMALIZATION"))
+
+    def _check_expected(self) -> None:
+        """Fail fast if the record in memory does not match the expectations of the caller."""
+        if (self.expected_state is not None and self.expected_state != self.previous_value) or (
+            self.expected_revision is not None and self.expected_revision != self.read_revision
+        ):
+            raise self._conflict()
+
+    def _conflict(self) -> StateChangeConflictError:
+        return StateChangeConflictError(
+            self.record,
+            self.expected_state if self.expected_state is not None else self.previous_value,
+            self.expected_revision if self.expected_revision is not None else self.read_revision,
+            self.new_state,
+        )
+
+    def _swap(self) -> None:
+        """Assert with a conditional UPDATE that the row still has the revision the record was read at.
+
+        The version of the model is the one read from the database or, if the record
+        has already been flushed, the one written by this transaction. The UPDATE
+        does not change the row, but keeps it locked until the transaction ends, so that
+        no other transaction can change it between the check and the commit.
+        """
+        model = self.record.model
+        if model is None or model.version_id is None:
+            # the record has not been stored yet, nobody else could have changed it
+            return
+        table = type(model).__table__
+        result = db.session.connection().execute(
+            update(table)
+            .where(table.c.id == model.id, table.c.version_id == model.version_id)
+            .values(version_id=table.c.version_id)
+        )
+        if result.rowcount != 1:
+            raise self._conflict()
+
     @override
     def on_post_commit(self, uow: UnitOfWork) -> None:
         """Run notifications after the commit."""
@@ -70,18 +191,59 @@ class StateChangeOperation(Operation):
             # handlers might register a commit operation and as we are already in
             # post commit in this uow, it would never get executed.
             with UnitOfWork() as uow1:
-                self.run_notifications(uow1)
+                self.run_notifications(uow1, post_commit=True)
+                uow1.commit()
+        if self._deferred:
+            guard = current_oarepo_workflows.notifier_guard
+            deferred, self._deferred = self._deferred, []
+            with UnitOfWork() as uow1:
+                for state_changed_notifier in deferred:
+                    # the state change is already committed, an error can not abort it
+                    self._notify(guard, state_changed_notifier, uow1, isolate_errors=True)
                 uow1.commit()
 
-    def run_notifications(self, uow: UnitOfWork) -> None:
-        """Run state change notification actions after the commit."""
-        for state_changed_notifier in current_oarepo_workflows.state_changed_notifiers:
-            state_changed_notifier(
-                self.identity,
-                self.record,
-                self.previous_value,
-                self.new_state,
-                *self.extra_args,
-                uow=uow,
-                **self.extra_kwargs,
-            )
+    def run_notifications(self, uow: UnitOfWork, *, post_commit: bool = False) -> None:
+        """Run state change notification actions subscribed to this state change.
+
+        :param post_commit: the state change has already been committed, so tripped notifiers
+                            that would be deferred are run now
+        """
+        dispatch = current_oarepo_workflows.notifier_dispatch
+        guard = current_oarepo_workflows.notifier_guard
+        defer = guard.overrun_action == "defer"
+        workflow_code = self._workflow_code() if dispatch.needs_workflow else None
+        for state_changed_notifier in dispatch.notifiers_for(workflow_code, self.previous_value, self.new_state):
+            name = notifier_name(state_changed_notifier)
+            if guard.is_tripped(name) and not (post_commit and defer):
+                guard.skip(name)
+                if defer:
+                    self._deferred.append(state_changed_notifier)
+                continue
+            self._notify(guard, state_changed_notifier, uow)
+
+    def _notify(
+        self,
+        guard: NotifierGuard,
+        state_changed_notifier: StateChangedNotifier,
+        uow: UnitOfWork,
+        *,
+        isolate_errors: bool | None = None,
+    ) -> None:
+        guard.call(
+            state_changed_notifier,
+            self.identity,
+            self.record,
+            self.previous_value,
+            self.new_state,
+            *self.extra_args,
+            uow=uow,
+            isolate_errors=isolate_errors,
+            **self.extra_kwargs,
+        )
+
+    def _workflow_code(self) -> str | None:
+        """Return code of the workflow of the record, None if it has no valid workflow."""
+        try:
+            return current_oarepo_workflows.get_workflow(self.record).code
+        except (MissingWorkflowError, InvalidWorkflowError):
+            return None
@@ -0,0 +1,126 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Bulk change of the workflow of existing records.
+
+Parents are selected in batches ordered by their id. Each batch is updated by
+a single UPDATE statement (the revisions of the parents are not changed),
+committed and the records and drafts of the batch are sent to the bulk
+indexing queue of the service.
+
+The progress reports the id of the last processed parent. Passing it as
+``resume_after`` continues an interrupted change. As the interrupted batch
+might have been committed but not queued for indexing, its parents are
+queued again before the change continues.
+
+Example:
+    .. code-block:: python
+
+        change_workflow_many(service, "new_workflow", source_workflow="old_workflow")
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Any
+
+from invenio_db import db
+from sqlalchemy import and_, or_, select, update
+
+from oarepo_workflows.errors import InvalidWorkflowError
+from oarepo_workflows.proxies import current_oarepo_workflows
+from oarepo_workflows.records.backfill import interrupted_batch, reindex_children
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+@dataclasses.dataclass
+class WorkflowChangeProgress:
+    """Progress of a bulk workflow change."""
+
+    processed: int = 0
+    """Number of selected parents."""
+
+    changed: int = 0
+    """Number of parents whose workflow has been changed."""
+
+    queued: int = 0
+    """Number of records and drafts sent to the bulk indexing queue."""
+
+    last_id: Any = None
+    """Id of the last processed parent, pass it as ``resume_after`` to continue."""
+
+
+def change_workflow_many(  # noqa: PLR0913
+    service: Any,
+    target_workflow: str,
+    *,
+    source_workflow: str | None = None,
+    parent_ids: Iterable[Any] | None = None,
+    batch_size: int = 1000,
+    resume_after: Any = None,
+    progress: Callable[[WorkflowChangeProgress], None] | None = None,
+) -> WorkflowChangeProgress:
+    """Change the workflow of many parent records of a service.
+
+    :param service:          record service whose parents are changed
+    :param target_workflow:  code of the new workflow
+    :param source_workflow:  change only parents in this workflow. Parents without
+                             a workflow are considered to be in the default workflow
+    :param parent_ids:       change only these parents
+    :param batch_size:       number of parents updated in one transaction
+    :param resume_after:     id of the last parent processed by an interrupted run
+    :param progress:         called after each batch
+    :raises InvalidWorkflowError: if the target workflow does not exist
+    :raises ValueError:      if neither source workflow nor parent ids are given
+    :return: the final progress
+    """
+    if target_workflow not in current_oarepo_workflows.workflow_by_code:
+        raise InvalidWorkflowError(f"Workflow {target_workflow} does not exist in the configuration.")
+    if source_workflow is None and parent_ids is None:
+        raise ValueError("Either source_workflow or parent_ids must be given.")
+
+    table = service.config.record_cls.parent_record_cls.model_cls.__table__
+    needs_change = or_(table.c.workflow != target_workflow, table.c.workflow.is_(None))
+
+    criteria = []
+    if parent_ids is not None:
+        criteria.append(table.c.id.in_(list(parent_ids)))
+    if source_workflow is not None:
+        in_source = table.c.workflow == source_workflow
+        if source_workflow == current_oarepo_workflows.default_workflow.code:
+            in_source = or_(in_source, table.c.workflow.is_(None))
+        criteria.append(in_source)
+
+    result = WorkflowChangeProgress(last_id=resume_after)
+    if resume_after is not None and source_workflow is not None:
+        # parents selected by ids are selected again, the changed ones of the source workflow are not
+        done = and_(*criteria[:-1], table.c.workflow == target_workflow)
+        requeue = interrupted_batch(table, resume_after, and_(*criteria), done)
+        for start in range(0, len(requeue), batch_size):
+            result.queued += reindex_children(service, requeue[start : start + batch_size])
+    while True:
+        query = select(table.c.id).where(*criteria).order_by(table.c.id).limit(batch_size)
+        if result.last_id is not None:
+            query = query.where(table.c.id > result.last_id)
+        ids = db.session.execute(query).scalars().all()
+        if not ids:
+            break
+        changed = db.session.execute(
+            update(table).where(table.c.id.in_(ids), needs_change).values(workflow=target_workflow)
+        ).rowcount
+        db.session.commit()
+
+        result.queued += reindex_children(service, ids)
+        result.processed += len(ids)
+        result.changed += changed
+        result.last_id = ids[-1]
+        if progress is not None:
+            progress(result)
+    return result
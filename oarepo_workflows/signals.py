@@ -0,0 +1,29 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Signals of oarepo-workflows."""
+
+from __future__ import annotations
+
+from blinker import Namespace
+
+_signals = Namespace()
+
+workflows_reloaded = _signals.signal("oarepo-workflows-reloaded")
+"""Sent after the workflow configuration has been reloaded.
+
+The sender is the Flask application, the ``generation`` keyword argument
+is the generation of the new configuration.
+
+Example:
+    .. code-block:: python
+
+        @workflows_reloaded.connect
+        def on_reload(app, generation):
+            my_cache.clear()
+"""
@@ -0,0 +1,58 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""API views of oarepo-workflows."""
+
+from __future__ import annotations
+
+import hmac
+from typing import TYPE_CHECKING
+
+from flask import Blueprint, Response, abort, current_app, g, request
+from invenio_access.permissions import Permission, superuser_access
+
+from oarepo_workflows.proxies import current_oarepo_workflows
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+
+def can_read_metrics() -> bool:
+    """Return True if the current request may read the metrics.
+
+    Allowed are superusers and, if ``WORKFLOWS_METRICS_TOKEN`` is set, requests
+    sending the token in the ``Authorization: Bearer <token>`` header (for example a Prometheus scraper).
+    """
+    token = current_app.config.get("WORKFLOWS_METRICS_TOKEN")
+    if token and hmac.compare_digest(request.headers.get("Authorization", "").encode(), f"Bearer {token}".encode()):
+        return True
+    identity = getattr(g, "identity", None)
+    return identity is not None and Permission(superuser_access).allows(identity)
+
+
+def metrics_view() -> Response:
+    """Return the metrics in the Prometheus text exposition format.
+
+    Responds with 404 if metrics are not enabled and with 403 if the caller
+    is neither a superuser nor presents the metrics token.
+    """
+    if not current_app.config.get("WORKFLOWS_METRICS_ENABLED"):
+        abort(404)
+    if not can_read_metrics():
+        abort(403)
+    return Response(
+        current_oarepo_workflows.metrics.render_prometheus(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+def create_api_blueprint(app: Flask) -> Blueprint:
+    """Create the blueprint serving workflow metrics."""
+    blueprint = Blueprint("oarepo_workflows", __name__, url_prefix="/workflows")
+    blueprint.add_url_rule("/metrics", "metrics", metrics_view, methods=["GET"])
+    return blueprint
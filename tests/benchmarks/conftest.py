@@ -0,0 +1,78 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Fixtures for permission benchmarks.
+
+The benchmarks run on the ``base_app`` fixture, so neither the search cluster
+nor database tables are needed. Run them with:
+
+.. code-block:: bash
+
+    pytest tests/benchmarks --benchmark-json=benchmarks.json
+
+and compare the JSON files of different releases with ``pytest-benchmark compare``.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from flask_principal import Identity, UserNeed
+from invenio_access.permissions import any_user, authenticated_user
+
+from oarepo_workflows.proxies import current_oarepo_workflows
+
+from .synthetic import STATES, WORKFLOW_COUNTS, make_workflows
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(params=WORKFLOW_COUNTS, ids=lambda count: f"{count}-workflows")
+def benchmark_workflows(request, appctx):
+    """Replace the configured workflows with the synthetic ones for the duration of the test."""
+    app = appctx
+    workflows = make_workflows(request.param)
+    original = app.config["WORKFLOWS"], app.config["WORKFLOWS_DEFAULT_WORKFLOW"]
+
+    app.config["WORKFLOWS"] = workflows
+    app.config["WORKFLOWS_DEFAULT_WORKFLOW"] = workflows[0].code
+    current_oarepo_workflows.invalidate()
+    try:
+        yield workflows
+    finally:
+        app.config["WORKFLOWS"], app.config["WORKFLOWS_DEFAULT_WORKFLOW"] = original
+        current_oarepo_workflows.invalidate()
+
+
+@pytest.fixture
+def benchmark_record(benchmark_workflows):
+    """Record in the deepest state of the last workflow, owned by user 1."""
+    return SimpleNamespace(
+        state=STATES[-1],
+        parent=SimpleNamespace(
+            workflow=benchmark_workflows[-1].code,
+            access=SimpleNamespace(owner=SimpleNamespace(owner_id=1)),
+        ),
+    )
+
+
+@pytest.fixture
+def benchmark_identity():
+    """Authenticated identity of user 1."""
+    identity = Identity(1)
+    identity.provides.update({UserNeed(1), any_user, authenticated_user})
+    return identity
+
+
+@pytest.fixture
+def stranger_identity():
+    """Authenticated identity of a user that does not own the benchmark record."""
+    identity = Identity(2)
+    identity.provides.update({UserNeed(2), any_user, authenticated_user})
+    return identity
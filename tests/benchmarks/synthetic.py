@@ -0,0 +1,131 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Synthetic workflow configurations used in permission benchmarks."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, override
+
+from flask_principal import Identity, UserNeed
+from invenio_records_permissions.generators import AuthenticatedUser, Generator
+from invenio_search.engine import dsl
+
+from oarepo_workflows.base import Workflow
+from oarepo_workflows.requests import (
+    WorkflowRequest,
+    WorkflowRequestEscalation,
+    WorkflowRequestPolicy,
+    WorkflowTransitions,
+)
+from oarepo_workflows.requests.events import WorkflowEvent
+from oarepo_workflows.services.permissions import DefaultWorkflowPermissions, IfInState
+from oarepo_workflows.services.permissions.composite import BooleanPermissionPolicyMixin, RequireAll
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from flask_principal import Need
+
+WORKFLOW_COUNTS = (1, 10, 100)
+TREE_DEPTH = 8
+STATES = tuple(f"state_{i}" for i in range(TREE_DEPTH))
+
+
+class OwnerGenerator(Generator):
+    """Record owner generator working on plain objects, without the database."""
+
+    @override
+    def needs(self, record: Any = None, **context: Any) -> Sequence[Need]:
+        if record is None:
+            return []
+        return [UserNeed(record.parent.access.owner.owner_id)]
+
+    @override
+    def query_filter(self, identity: Identity | None = None, **context: Any) -> dsl.query.Query:
+        if identity is None:
+            return dsl.Q("match_none")
+        return dsl.Q("term", **{"parent.access.owned_by.user": identity.id})
+
+
+def state_tree(depth: int, leaf: Sequence[Generator]) -> Generator:
+    """Return a chain of nested IfInState generators, the deepest one yielding the leaf generators.
+
+    Every level matches its own and all the deeper states and has an else branch,
+    so a record in the last state walks the whole tree.
+    """
+    generator: Generator = IfInState(STATES[depth - 1], leaf, [OwnerGenerator()])
+    for level in range(depth - 2, -1, -1):
+        generator = IfInState(STATES[level:depth], [generator], [OwnerGenerator()])
+    return generator
+
+
+def make_workflows(count: int, depth: int = TREE_DEPTH) -> list[Workflow]:
+    """Create synthetic workflows, each with its own permission policy class."""
+    workflows = []
+    for idx in range(count):
+        policy_cls = type(
+            f"BenchmarkPermissions{idx}",
+            (DefaultWorkflowPermissions,),
+            {
+                "can_read": (state_tree(depth, [AuthenticatedUser()]),),
+                "can_update": (state_tree(depth, [OwnerGenerator()]),),
+                "can_create": (AuthenticatedUser(),),
+            },
+        )
+        workflows.append(
+            Workflow(
+                code=f"benchmark_{idx}",
+                label=f"Benchmark workflow {idx}",
+                permission_policy_cls=policy_cls,
+            )
+        )
+    return workflows
+
+
+def make_request_policy(idx: int, count: int = TREE_DEPTH) -> type[WorkflowRequestPolicy]:
+    """Create a request policy class with requests moving the record through the states.
+
+    The request types are not registered, the policy can only be instantiated, not evaluated.
+    """
+    requests = {}
+    for level in range(count - 1):
+        requests[f"benchmark_{idx}_request_{level}"] = WorkflowRequest(
+            requesters=[IfInState(STATES[level], [OwnerGenerator()])],
+            recipients=[AuthenticatedUser()],
+            transitions=WorkflowTransitions(
+                submitted=STATES[level + 1],
+                accepted=STATES[level + 1],
+                declined=STATES[level],
+                cancelled=STATES[level],
+            ),
+            events={"comment": WorkflowEvent(submitters=[OwnerGenerator()])},
+            escalations=[WorkflowRequestEscalation(after=timedelta(days=7), recipients=[AuthenticatedUser()])],
+        )
+    return type(f"BenchmarkRequests{idx}", (WorkflowRequestPolicy,), requests)
+
+
+def make_workflows_with_requests(count: int, depth: int = TREE_DEPTH) -> list[Workflow]:
+    """Create synthetic workflows with both permission and request policies."""
+    workflows = make_workflows(count, depth)
+    for idx, workflow in enumerate(workflows):
+        workflow.request_policy_cls = make_request_policy(idx, depth)
+    return workflows
+
+
+class RequireAllPolicy(BooleanPermissionPolicyMixin, DefaultWorkflowPermissions):
+    """Policy with RequireAll composites nested in a deep state tree.
+
+    The first composites are never satisfied, so allows() has to evaluate all of them.
+    """
+
+    can_read = (
+        *(RequireAll(OwnerGenerator(), AuthenticatedUser(), IfInState(STATES[-1], [])) for _ in range(5)),
+        state_tree(TREE_DEPTH, [RequireAll(OwnerGenerator(), AuthenticatedUser())]),
+    )
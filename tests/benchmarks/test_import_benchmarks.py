@@ -0,0 +1,30 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Benchmarks of the package import time, each import runs in a fresh interpreter."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import oarepo_workflows",
+        "from oarepo_workflows import current_oarepo_workflows",
+        "from oarepo_workflows import Workflow, IfInState, WorkflowRequest",
+    ],
+    ids=["package", "proxy", "full-surface"],
+)
+def test_import_time(benchmark, code):
+    benchmark.group = "import-time"
+    benchmark.pedantic(subprocess.check_call, args=([sys.executable, "-c", code],), rounds=5, iterations=1)
@@ -0,0 +1,44 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Benchmarks of the memory footprint of workflow configurations.
+
+The number of bytes allocated per configured workflow is stored in the
+``extra_info`` of the benchmark, so it is part of the benchmark JSON.
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+import pytest
+
+from .synthetic import WORKFLOW_COUNTS, make_workflows_with_requests
+
+
+def allocated_bytes(count: int) -> int:
+    """Return the number of bytes held by ``count`` synthetic workflows."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        workflows = make_workflows_with_requests(count)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(workflows) == count
+    return current
+
+
+@pytest.mark.parametrize("count", WORKFLOW_COUNTS, ids=lambda count: f"{count}-workflows")
+def test_workflow_memory_footprint(benchmark, count):
+    benchmark.group = "workflow-memory-footprint"
+    benchmark.extra_info["bytes_per_workflow"] = allocated_bytes(count) / count
+
+    workflows = benchmark.pedantic(make_workflows_with_requests, args=(count,), rounds=3, iterations=1)
+    assert len(workflows) == count
@@ -0,0 +1,84 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Benchmarks of permission evaluation in workflow policies."""
+
+from __future__ import annotations
+
+from flask_principal import UserNeed
+from invenio_access.permissions import authenticated_user
+
+from oarepo_workflows.services.permissions import FromRecordWorkflow
+from oarepo_workflows.services.permissions.generators import InAnyWorkflow, query_filters_from_all_workflows
+
+from .synthetic import RequireAllPolicy
+
+
+def test_workflow_permissions(benchmark, benchmark_workflows, benchmark_record):
+    benchmark.group = "workflow-permissions"
+    workflow = benchmark_workflows[-1]
+
+    def run():
+        return workflow.permissions("read", record=benchmark_record).needs
+
+    assert authenticated_user in benchmark(run)
+
+
+def test_from_record_workflow(benchmark, benchmark_workflows, benchmark_record):
+    benchmark.group = "from-record-workflow"
+    generator = FromRecordWorkflow("update")
+
+    def run():
+        return generator.needs(record=benchmark_record), generator.excludes(record=benchmark_record)
+
+    needs, excludes = benchmark(run)
+    assert UserNeed(1) in needs
+    assert not excludes
+
+
+def test_allows_require_all(benchmark, benchmark_workflows, benchmark_record, benchmark_identity, stranger_identity):
+    benchmark.group = "allows-require-all"
+
+    def run():
+        return (
+            RequireAllPolicy("read", record=benchmark_record).allows(benchmark_identity),
+            RequireAllPolicy("read", record=benchmark_record).allows(stranger_identity),
+        )
+
+    assert benchmark(run) == (True, False)
+
+
+def test_in_any_workflow(benchmark, benchmark_workflows, benchmark_record):
+    benchmark.group = "in-any-workflow"
+    generator = InAnyWorkflow("read")
+
+    def run():
+        return generator.needs(record=benchmark_record), generator.excludes(record=benchmark_record)
+
+    needs, _ = benchmark(run)
+    assert authenticated_user in needs
+
+
+def test_query_filters_from_all_workflows(benchmark, benchmark_workflows, benchmark_identity):
+    benchmark.group = "query-filters-from-all-workflows"
+
+    def run():
+        return query_filters_from_all_workflows("read", identity=benchmark_identity)
+
+    assert len(benchmark(run)) == len(benchmark_workflows)
+
+
+def test_allows_many_records(benchmark, benchmark_workflows, benchmark_record, benchmark_identity):
+    benchmark.group = "allows-many-records"
+
+    def run():
+        # the identity's provides are interned once and reused by all the policies,
+        # as when permissions of search hits are evaluated
+        return [RequireAllPolicy("read", record=benchmark_record).allows(benchmark_identity) for _ in range(10)]
+
+    assert all(benchmark(run))
@@ -42,7 +42,11 @@ from sqlalchemy.exc import IntegrityError
 
 from oarepo_workflows import WorkflowRequestPolicy, WorkflowTransitions
 from oarepo_workflows.base import Workflow
-from oarepo_workflows.model.presets import workflows_preset
+from oarepo_workflows.model.presets import (
+    workflows_access_preset,
+    workflows_preset,
+    workflows_state_columns_preset,
+)
 from oarepo_workflows.proxies import current_oarepo_workflows
 from oarepo_workflows.requests import WorkflowRequest
 from oarepo_workflows.requests.events import WorkflowEvent
@@ -377,6 +381,8 @@ def workflow_model():
         presets=[
             rdm_minimal_preset,
             workflows_preset,
+            workflows_state_columns_preset,
+            workflows_access_preset,
         ],
         types=[model_types],
         metadata_type="Metadata",
@@ -9,13 +9,20 @@ from __future__ import annotations
 
 import pytest
 from invenio_access.permissions import system_identity
+from invenio_db.uow import UnitOfWork
+from invenio_requests.customizations.actions import AcceptAction
+from invenio_requests.proxies import current_request_type_registry
+from invenio_requests.records.api import Request
 from invenio_requests.resolvers.registry import ResolverRegistry
 
+from oarepo_workflows.proxies import current_oarepo_workflows
 from oarepo_workflows.requests import AutoApprove as AutoApproveGenerator
+from oarepo_workflows.requests.actions import auto_approve, is_auto_approved
 from oarepo_workflows.resolvers.auto_approve import (
     AutoApprove,
     AutoApproveProxy,
     AutoApproveResolver,
+    auto_approve_entity,
 )
 
 
@@ -58,6 +65,19 @@ def test_auto_approve_service(auto_approve_service):
     assert sorted(read_list.hits, key=str) == sorted(expected_list, key=str)
 
 
+def test_auto_approve_service_precomputed_data(auto_approve_service):
+    read_item = auto_approve_service.read(system_identity, "true")
+    assert read_item.data == dict(AutoApprove.serialized)
+    assert read_item._record is auto_approve_entity  # noqa SLF001
+
+    # callers get a copy, so modifying the serialized data does not leak to other reads
+    read_item.data["links"] = {}
+    assert auto_approve_service.read(system_identity, "true").data == {"id": "true", "type": "auto_approve"}
+
+    with pytest.raises(TypeError):
+        AutoApprove.serialized["id"] = "false"  # type: ignore[index]
+
+
 def test_auto_approve_resolver(app, search_clear):
     resolved = ResolverRegistry.resolve_entity({"auto_approve": "true"})
     assert isinstance(resolved, AutoApprove)
@@ -70,3 +90,94 @@ def test_auto_approve_resolver(app, search_clear):
 
     entity_reference = ResolverRegistry.reference_entity(AutoApprove())
     assert entity_reference == {"auto_approve": "true"}
+
+
+def test_auto_approve_resolver_shared_proxy(app, search_clear):
+    resolver = AutoApproveResolver()
+    proxy = resolver.get_entity_proxy({"auto_approve": "true"})
+    assert proxy is resolver.get_entity_proxy({"auto_approve": "true"})
+    assert proxy.resolve() is auto_approve_entity
+
+
+def _submitted_request(record, receiver):
+    request = Request.create({}, type=current_request_type_registry.lookup("req"))
+    request.topic = record
+    request.receiver = receiver
+    request.status = "submitted"
+    return request
+
+
+class TransitionAcceptAction(AcceptAction):
+    """Accept action applying the accepted transition itself, as oarepo-requests actions do."""
+
+    def execute(self, identity, uow):
+        super().execute(identity, uow)
+        current_oarepo_workflows.set_state(identity, self.request.topic.resolve(), "deleted", uow=uow)
+
+
+@pytest.fixture
+def state_changes(monkeypatch):
+    changes = []
+    set_state = current_oarepo_workflows.set_state
+
+    def recording_set_state(identity, record, new_state, *args, **kwargs):
+        changes.append((identity, new_state))
+        return set_state(identity, record, new_state, *args, **kwargs)
+
+    monkeypatch.setattr(current_oarepo_workflows._get_current_object(), "set_state", recording_set_state)  # noqa SLF001
+    return changes
+
+
+def test_is_auto_approved(users, record_service, default_workflow_json, location, search_clear):
+    record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
+    assert is_auto_approved(_submitted_request(record, auto_approve_entity))
+    assert not is_auto_approved(_submitted_request(record, users[0].user))
+
+
+def test_auto_approve_pipeline(users, record_service, default_workflow_json, location, search_clear, state_changes):
+    record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
+
+    with UnitOfWork() as uow:
+        request = _submitted_request(record, users[0].user)
+        assert not auto_approve(users[0].identity, request, uow)
+        assert request.status == "submitted"
+        assert state_changes == []
+
+        request = _submitted_request(record, auto_approve_entity)
+        assert auto_approve(users[0].identity, request, uow)
+        assert request.status == "accepted"
+        # accepted transition of the "req" request in "my_workflow", applied as the accepting identity
+        assert state_changes == [(system_identity, "deleted")]
+        assert request.topic.resolve().state == "deleted"
+
+
+def test_auto_approve_transition_applied_by_accept_action(
+    users, record_service, default_workflow_json, location, search_clear, state_changes, monkeypatch
+):
+    record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
+    request = _submitted_request(record, auto_approve_entity)
+    monkeypatch.setattr(
+        type(request.type),
+        "available_actions",
+        {**request.type.available_actions, "accept": TransitionAcceptAction},
+    )
+
+    with UnitOfWork() as uow:
+        assert auto_approve(users[0].identity, request, uow)
+
+    # the state has been changed only once, by the accept action
+    assert state_changes == [(system_identity, "deleted")]
+
+
+def test_auto_approve_transition_applied_in_accepted_state(
+    users, record_service, default_workflow_json, location, search_clear, state_changes
+):
+    record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
+    record.state = "deleted"
+    request = _submitted_request(record, auto_approve_entity)
+
+    with UnitOfWork() as uow:
+        assert auto_approve(users[0].identity, request, uow)
+
+    # the record was already in the accepted state, the transition (and its notifiers) still runs
+    assert state_changes == [(system_identity, "deleted")]
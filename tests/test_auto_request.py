@@ -13,3 +13,95 @@ from oarepo_workflows.requests.generators.auto import auto_request_need
 
 def test_auto_request_needs(app, search_clear):
     assert AutoRequest().needs() == [auto_request_need]
+
+
+def test_reachable_states():
+    from oarepo_workflows.services.permissions import IfInState
+    from oarepo_workflows.services.permissions.analysis import reachable_states
+
+    def is_auto(g):
+        return isinstance(g, AutoRequest)
+
+    assert reachable_states([], is_auto) == frozenset()
+    assert reachable_states([AutoRequest()], is_auto) is None
+    assert reachable_states([IfInState("published", [AutoRequest()])], is_auto) == {"published"}
+    assert reachable_states(
+        [IfInState(["draft", "published"], [IfInState("published", [AutoRequest()])])], is_auto
+    ) == {"published"}
+    assert reachable_states([IfInState("published", [], [AutoRequest()])], is_auto) is None
+    assert reachable_states([IfInState("published", [])], is_auto) == frozenset()
+
+
+def test_auto_request_index():
+    from types import SimpleNamespace
+
+    from oarepo_workflows.requests import WorkflowRequest, WorkflowRequestPolicy
+    from oarepo_workflows.requests.auto_request import AutoRequestIndex
+    from oarepo_workflows.services.permissions import IfInState
+
+    class Requests(WorkflowRequestPolicy):
+        static = WorkflowRequest(requesters=[IfInState("published", [AutoRequest()])], recipients=[])
+        never = WorkflowRequest(requesters=[], recipients=[])
+
+    workflow = SimpleNamespace(code="wf", requests=Requests)
+    index = AutoRequestIndex.from_workflows([workflow])
+
+    assert [r._request_type for r in index.by_state[("wf", "published")]] == ["static"]
+    assert not index.dynamic
+    assert [r._request_type for r in index.auto_requests("wf", "published", None)] == ["static"]
+    assert index.auto_requests("wf", "draft", None) == []
+
+
+def test_auto_requests_only_on_entry(app, search_clear):
+    from types import SimpleNamespace
+
+    from oarepo_workflows.requests import WorkflowRequest, WorkflowRequestPolicy
+    from oarepo_workflows.requests.auto_request import AutoRequestIndex
+    from oarepo_workflows.services.permissions import IfInState
+
+    class Requests(WorkflowRequestPolicy):
+        req = WorkflowRequest(requesters=[IfInState("published", [AutoRequest()])], recipients=[])
+        req1 = WorkflowRequest(requesters=[AutoRequest()], recipients=[])
+        req2 = WorkflowRequest(requesters=[IfInState("draft", [], [AutoRequest()])], recipients=[])
+
+    index = AutoRequestIndex.from_workflows([SimpleNamespace(code="wf", requests=Requests)])
+    assert [r._request_type for r in index.dynamic["wf"]] == ["req1", "req2"]
+
+    def auto_requests(previous_state):
+        return sorted(
+            r._request_type
+            for r in index.auto_requests("wf", "published", SimpleNamespace(state="published"), previous_state)
+        )
+
+    # the unconditional auto request is requested in the previous state as well, so it is not entered
+    assert auto_requests("draft") == ["req", "req2"]
+    assert auto_requests("retracted") == ["req"]
+    assert auto_requests("published") == []
+    assert auto_requests(None) == ["req", "req1", "req2"]
+
+
+def test_create_auto_requests_skips_open_requests(
+    users, record_service, default_workflow_json, location, search_clear
+):
+    from invenio_db.uow import UnitOfWork
+    from invenio_requests.records.models import RequestMetadata
+    from invenio_requests.resolvers.registry import ResolverRegistry
+
+    from oarepo_workflows.proxies import current_oarepo_workflows
+    from oarepo_workflows.requests.auto_request import create_auto_requests, existing_request_types
+
+    record = record_service.create(
+        users[0].identity, {**default_workflow_json, "parent": {"workflow": "is_applicable_workflow"}}
+    )._record  # noqa SLF001
+    workflow_request = current_oarepo_workflows.get_workflow_request("is_applicable_workflow", "req")
+    assert existing_request_types(record, [workflow_request]) == set()
+
+    with UnitOfWork() as uow:
+        create_auto_requests(record, [workflow_request, workflow_request], uow)
+        assert existing_request_types(record, [workflow_request]) == {"req"}
+        create_auto_requests(record, [workflow_request], uow)
+        uow.commit()
+
+    topic = ResolverRegistry.reference_entity(record)
+    requests = [r for r in RequestMetadata.query.all() if r.json.get("topic") == topic]
+    assert [(r.json["type"], r.json["status"]) for r in requests] == [("req", "submitted")]
@@ -0,0 +1,188 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for the caches of the workflows extension."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from flask import Flask, current_app
+
+from oarepo_workflows.caches import CacheManager, cached_in_manager
+from oarepo_workflows.proxies import current_oarepo_workflows
+
+
+class Holder:
+    def __init__(self):
+        self.caches = CacheManager()
+        self.calls = 0
+
+    @cached_in_manager
+    def value(self) -> int:
+        self.calls += 1
+        time.sleep(0.01)
+        return self.calls
+
+
+def test_cache_manager_computes_once_across_threads():
+    holder = Holder()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(holder.value)) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [1] * 10
+    assert holder.calls == 1
+
+
+def test_cache_manager_invalidate():
+    holder = Holder()
+    callbacks = []
+    holder.caches.on_invalidate(lambda: callbacks.append(True))
+
+    assert holder.value == 1
+    holder.caches.invalidate("value")
+    assert not holder.caches.is_cached("value")
+    assert holder.value == 2
+    # invalidation of named values does not call the callbacks
+    assert callbacks == []
+
+    holder.caches.invalidate()
+    assert holder.value == 3
+    assert callbacks == [True]
+
+
+def test_extension_invalidate(app):
+    from oarepo_workflows.services.permissions.compiler import get_decision_table
+
+    workflows = current_oarepo_workflows.workflow_by_code
+    assert current_oarepo_workflows.workflow_by_code is workflows
+    policy_cls = workflows["my_workflow"].permission_policy_with_requests_cls
+    get_decision_table(policy_cls, "read")
+
+    assert policy_cls in current_oarepo_workflows.decision_tables
+
+    current_oarepo_workflows.invalidate()
+    assert policy_cls not in current_oarepo_workflows.decision_tables
+    assert workflows["my_workflow"].permission_policy_with_requests_cls is not policy_cls
+    assert current_oarepo_workflows.workflow_by_code is not workflows
+    assert current_oarepo_workflows.workflow_by_code == workflows
+
+
+def test_caches_are_per_app(app):
+    from oarepo_workflows.ext import OARepoWorkflows
+
+    other = OARepoWorkflows()
+    other.init_app(Flask("other"))
+    other.app.config["WORKFLOWS"] = []
+
+    assert current_oarepo_workflows.workflow_by_code
+    assert other.workflow_by_code == {}
+    assert current_oarepo_workflows.caches is not other.caches
+
+
+def test_reload_workflows(app):
+    from oarepo_workflows.signals import workflows_reloaded
+
+    received = []
+
+    def on_reload(sender, generation):
+        received.append(generation)
+
+    original = app.config["WORKFLOWS"]
+    generation = current_oarepo_workflows.generation
+    old_by_code = current_oarepo_workflows.workflow_by_code
+    try:
+        with workflows_reloaded.connected_to(on_reload, app):
+            new_generation = current_oarepo_workflows.reload_workflows(original[:1], publish=False)
+        assert new_generation == generation + 1
+        assert received == [new_generation]
+        assert current_oarepo_workflows.generation == new_generation
+        assert list(current_oarepo_workflows.workflow_by_code) == [original[0].code]
+        assert old_by_code is not current_oarepo_workflows.workflow_by_code
+        # the new generation has been warmed up before it was swapped in
+        assert current_oarepo_workflows.caches.is_cached("workflow_requests_by_type")
+    finally:
+        current_oarepo_workflows.reload_workflows(original, publish=False)
+    assert set(current_oarepo_workflows.workflow_by_code) == set(old_by_code)
+
+
+def test_reload_keeps_generations_apart(app):
+    old_caches = current_oarepo_workflows.caches
+    workflow = current_oarepo_workflows.workflow_by_code["my_workflow"]
+    old_policy_cls = workflow.permission_policy_with_requests_cls
+    old_tables = current_oarepo_workflows.decision_tables
+    old_tables.get(old_policy_cls, "read")
+    old_values = dict(old_caches._values)  # noqa: SLF001
+
+    current_oarepo_workflows.reload_workflows(publish=False)
+
+    # the warm-up of the new generation has not touched the caches of the old one
+    assert old_caches._values == old_values  # noqa: SLF001
+    assert old_policy_cls in old_tables
+    new_policy_cls = workflow.permission_policy_with_requests_cls
+    assert new_policy_cls is not old_policy_cls
+    assert current_oarepo_workflows.decision_tables is not old_tables
+    assert "read" in current_oarepo_workflows.decision_tables[new_policy_cls]
+    assert old_policy_cls not in current_oarepo_workflows.decision_tables
+
+
+def test_check_reload(app):
+    class SharedCache(dict):
+        def set(self, key, value, timeout=None):
+            self[key] = value
+
+    shared = SharedCache()
+    ext = current_oarepo_workflows._get_current_object()
+    ext._shared_cache = lambda: shared
+    try:
+        generation = ext.generation
+        ext.check_reload()
+        assert ext.generation == generation
+
+        shared["oarepo_workflows:reload_token"] = "announced"
+        ext._last_reload_check = 0.0
+        ext.check_reload()
+        assert ext.generation == generation + 1
+
+        # the same token does not reload again
+        ext._last_reload_check = 0.0
+        ext.check_reload()
+        assert ext.generation == generation + 1
+    finally:
+        del ext._shared_cache
+
+
+def test_reload_command_requires_loader(app):
+    from oarepo_workflows.cli import reload
+
+    generation = current_oarepo_workflows.generation
+    result = app.test_cli_runner().invoke(reload)
+    assert result.exit_code == 2
+    assert "WORKFLOWS_LOADER is not set" in result.output
+    assert current_oarepo_workflows.generation == generation
+
+
+def test_reload_checked_before_celery_tasks(app, monkeypatch):
+    from celery.signals import task_prerun
+
+    from oarepo_workflows.ext import OARepoWorkflows
+
+    other_app = Flask("other")
+    other_app.config.update(WORKFLOWS_RELOAD_CHECK_INTERVAL=10, WORKFLOWS_LOADER=lambda: [])
+    other = OARepoWorkflows()
+    other.init_app(other_app)
+
+    checked = []
+    monkeypatch.setattr(other, "check_reload", lambda: checked.append(current_app._get_current_object()))
+    task_prerun.send(sender=None, task_id="1", task=None, args=(), kwargs={})
+    assert checked == [other_app]
+    task_prerun.disconnect(other._check_reload_before_task)
@@ -0,0 +1,64 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for the immutable workflow definition objects."""
+
+from __future__ import annotations
+
+import dataclasses
+from datetime import timedelta
+
+import pytest
+from invenio_records_permissions.generators import AuthenticatedUser
+
+from oarepo_workflows import WorkflowRequestEscalation, WorkflowTransitions
+from oarepo_workflows.requests.events import WorkflowEvent
+from oarepo_workflows.requests.generators.multiple_entities import MultipleEntitiesGenerator
+
+
+def test_transitions_are_immutable():
+    transitions = WorkflowTransitions(submitted="submitted", accepted="published")
+    assert not hasattr(transitions, "__dict__")
+    assert transitions["accepted"] == "published"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        transitions.accepted = "draft"  # type: ignore[misc]
+    assert transitions == WorkflowTransitions(submitted="submitted", accepted="published")
+
+
+def test_escalation_recipients_are_frozen():
+    recipients = [AuthenticatedUser()]
+    escalation = WorkflowRequestEscalation(after=timedelta(days=1), recipients=recipients)
+    recipients.append(AuthenticatedUser())
+
+    assert not hasattr(escalation, "__dict__")
+    assert escalation.recipients == (recipients[0],)
+    assert escalation.escalation_id == "86400.0"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        escalation.after = timedelta(days=2)  # type: ignore[misc]
+
+
+def test_event_submitter_generator():
+    submitter = AuthenticatedUser()
+    event = WorkflowEvent(submitters=[submitter])
+
+    assert not hasattr(event, "__dict__")
+    assert event.submitters == (submitter,)
+    assert isinstance(event.submitter_generator, MultipleEntitiesGenerator)
+    assert event.submitter_generator.generators == (submitter,)
+    assert event == WorkflowEvent(submitters=(submitter,))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        event.submitters = ()  # type: ignore[misc]
+
+
+def test_multiple_entities_generator_is_frozen():
+    generator = MultipleEntitiesGenerator([AuthenticatedUser()])
+    assert isinstance(generator.generators, tuple)
+    assert hash(generator) == hash(MultipleEntitiesGenerator(generator.generators))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        generator.generators = ()  # type: ignore[misc]
+
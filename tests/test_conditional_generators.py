@@ -9,10 +9,14 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 from invenio_records_permissions.generators import AuthenticatedUser
 from invenio_requests.customizations.event_types import CommentEventType, LogEventType
 
 from oarepo_workflows.requests.generators.conditionals import IfEventType
+from oarepo_workflows.requests.generators.multiple_entities import MultipleEntitiesGenerator
+from oarepo_workflows.services.permissions import IfInState, IfRDMRecordPassed
 
 
 def test_if_event_type_condition_matches():
@@ -64,3 +68,24 @@ def test_if_event_type_query_instate():
     query = generator._query_instate()  # NOQA: SLF001
 
     assert query.to_dict() == {"term": {"type_id": CommentEventType.type_id}}
+
+
+def test_if_in_state_condition():
+    """Test that IfInState matches any of its states using the precompiled set."""
+    generator = IfInState(["draft", "published"], [AuthenticatedUser()])
+
+    assert generator.state == ["draft", "published"]
+    assert generator.states == frozenset({"draft", "published"})
+    assert generator._condition(record=SimpleNamespace(state="published")) is True  # NOQA: SLF001
+    assert generator._condition(record=SimpleNamespace(state="deleted")) is False  # NOQA: SLF001
+    assert generator._condition(record=SimpleNamespace()) is False  # NOQA: SLF001
+    assert generator._condition(record=None) is False  # NOQA: SLF001
+
+
+def test_conditional_recipients_are_prebuilt():
+    """Test that recipient generators of the branches are created only once."""
+    then_ = [AuthenticatedUser()]
+    for generator in (IfInState("draft", then_), IfRDMRecordPassed(then_)):
+        assert isinstance(generator._then_recipients, MultipleEntitiesGenerator)  # NOQA: SLF001
+        assert list(generator._then_recipients.generators) == then_  # NOQA: SLF001
+        assert list(generator._else_recipients.generators) == []  # NOQA: SLF001
@@ -0,0 +1,42 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for the lazy import surface of the package."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import oarepo_workflows
+
+
+def _imported_modules(code: str) -> set[str]:
+    """Run the code in a fresh interpreter and return names of the imported modules."""
+    output = subprocess.check_output(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        text=True,
+    )
+    return set(output.split())
+
+
+def test_package_import_is_lazy():
+    modules = _imported_modules("from oarepo_workflows import current_oarepo_workflows")
+    assert "oarepo_workflows.proxies" in modules
+    assert "oarepo_workflows.services.permissions" not in modules
+    assert "oarepo_workflows.requests" not in modules
+    assert "invenio_rdm_records" not in modules
+
+
+def test_lazy_names():
+    from oarepo_workflows.base import Workflow
+    from oarepo_workflows.services.permissions import IfInState
+
+    assert oarepo_workflows.Workflow is Workflow
+    assert oarepo_workflows.IfInState is IfInState
+    assert set(oarepo_workflows.__all__) <= set(dir(oarepo_workflows))
@@ -0,0 +1,84 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for interning of needs and identity fingerprints."""
+
+from __future__ import annotations
+
+from flask_principal import Identity, Need, RoleNeed, UserNeed
+
+from oarepo_workflows.services.permissions.composite import HashableList, RequireAll
+from oarepo_workflows.services.permissions.interning import NeedInterner, identity_fingerprint
+
+from .test_composite import FixedNeedsGenerator, _CompositeTestPolicy, _identity
+
+
+def test_intern_needs():
+    interner = NeedInterner()
+    mask, generation = interner.intern([UserNeed(1), RoleNeed("curator")])
+    assert generation == 0
+    assert mask == interner.bit(UserNeed(1)) | interner.bit(RoleNeed("curator"))
+    assert interner.bit(UserNeed(1)) != interner.bit(RoleNeed("curator"))
+
+    other, _ = interner.intern([UserNeed(2)])
+    assert not mask & other
+    assert interner.intern([Need("composite", HashableList())]) == (0, 0)
+    assert len(interner) == 3
+
+
+def test_interner_generations():
+    interner = NeedInterner(max_size=2)
+    interner.intern([UserNeed(1), UserNeed(2)])
+    mask, generation = interner.intern([UserNeed(3)])
+    assert generation == 1
+    assert len(interner) == 1
+    assert mask == interner.bit(UserNeed(3))
+
+
+def test_identity_fingerprint():
+    interner = NeedInterner()
+    identity = Identity(1)
+    identity.provides.update({UserNeed(1), RoleNeed("curator")})
+
+    fingerprint = identity_fingerprint(identity, interner)
+    assert identity_fingerprint(identity, interner) is fingerprint
+
+    # needs added after the fingerprint was computed are picked up
+    identity.provides.add(RoleNeed("admin"))
+    updated = identity_fingerprint(identity, interner)
+    assert updated.mask & interner.bit(RoleNeed("admin"))
+    assert updated.provides == {UserNeed(1), RoleNeed("curator"), RoleNeed("admin")}
+
+
+def test_identity_fingerprint_swapped_need():
+    interner = NeedInterner()
+    identity = Identity(1)
+    identity.provides.update({UserNeed(1), RoleNeed("admin")})
+    fingerprint = identity_fingerprint(identity, interner)
+    assert fingerprint.mask & interner.bit(RoleNeed("admin"))
+
+    # the same number of needs, but a different one
+    identity.provides.discard(RoleNeed("admin"))
+    identity.provides.add(RoleNeed("curator"))
+    swapped = identity_fingerprint(identity, interner)
+    assert swapped is not fingerprint
+    assert not swapped.mask & interner.bit(RoleNeed("admin"))
+    assert swapped.mask & interner.bit(RoleNeed("curator"))
+
+
+def test_allows_uses_interned_needs():
+    class Policy(_CompositeTestPolicy):
+        can_read = (
+            FixedNeedsGenerator(UserNeed(1)),
+            RequireAll(FixedNeedsGenerator(UserNeed(2)), FixedNeedsGenerator(RoleNeed("curator"))),
+        )
+
+    assert Policy("read").allows(_identity(1))
+    assert not Policy("read").allows(_identity(2))
+    assert Policy("read").allows(_identity(2, RoleNeed("curator")))
+    assert not Policy("read").allows(_identity(3, RoleNeed("curator")))
@@ -0,0 +1,140 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for metrics and permission instrumentation."""
+
+from __future__ import annotations
+
+import pytest
+from flask import g
+from flask_principal import Identity, UserNeed
+from invenio_access.permissions import superuser_access
+from invenio_records_permissions import RecordPermissionPolicy
+from werkzeug.exceptions import Forbidden, NotFound
+
+from oarepo_workflows.metrics import WorkflowMetrics
+from oarepo_workflows.proxies import current_oarepo_workflows
+from oarepo_workflows.services.permissions.composite import BooleanPermissionPolicyMixin, RequireAll
+from oarepo_workflows.services.permissions.instrumentation import (
+    install_instrumentation,
+    is_instrumentation_installed,
+    uninstall_instrumentation,
+)
+from oarepo_workflows.views import metrics_view
+
+from .test_composite import FixedNeedsGenerator
+
+
+class _InstrumentedPolicy(BooleanPermissionPolicyMixin, RecordPermissionPolicy):
+    can_read = (RequireAll(FixedNeedsGenerator(UserNeed(1)), FixedNeedsGenerator(UserNeed(1))),)
+
+
+def test_metrics_prometheus_rendering():
+    metrics = WorkflowMetrics()
+    metrics.describe("calls_total", "Number of calls.")
+    metrics.inc("calls_total", generator="IfInState", action="read")
+    metrics.inc("calls_total", 2, generator="IfInState", action="read")
+    metrics.inc("calls_total", generator='Weird"Name', action="read")
+
+    assert metrics.get("calls_total", action="read", generator="IfInState") == 3
+    assert metrics.render_prometheus() == (
+        "# HELP oarepo_workflows_calls_total Number of calls.\n"
+        "# TYPE oarepo_workflows_calls_total counter\n"
+        'oarepo_workflows_calls_total{action="read",generator="IfInState"} 3\n'
+        'oarepo_workflows_calls_total{action="read",generator="Weird\\"Name"} 1\n'
+    )
+    metrics.reset()
+    assert metrics.render_prometheus() == ""
+
+
+def test_instrumentation_is_opt_in():
+    original_allows = BooleanPermissionPolicyMixin.allows
+    original_needs = RequireAll.needs
+    assert not is_instrumentation_installed()
+
+    metrics = WorkflowMetrics()
+    install_instrumentation(metrics)
+    try:
+        assert BooleanPermissionPolicyMixin.allows is not original_allows
+        identity = Identity(1)
+        identity.provides.add(UserNeed(1))
+
+        policy = _InstrumentedPolicy("read")
+        assert policy.allows(identity)
+        assert policy.allows(identity)
+    finally:
+        uninstall_instrumentation()
+
+    assert BooleanPermissionPolicyMixin.allows is original_allows
+    assert RequireAll.needs is original_needs
+
+    allows_labels = {"generator": "_InstrumentedPolicy", "method": "allows", "action": "read"}
+    assert metrics.get("generator_calls_total", **allows_labels) == 2
+    assert metrics.get("generator_seconds_total", **allows_labels) > 0
+    # needs of the policy are computed once, RequireAll is evaluated only on the first call
+    assert metrics.get("generator_calls_total", generator="RequireAll", method="needs", action="read") == 1
+    cache_labels = {"policy": "_InstrumentedPolicy", "property": "needs", "action": "read"}
+    assert metrics.get("policy_cache_misses_total", **cache_labels) == 1
+    assert metrics.get("policy_cache_hits_total", **cache_labels) >= 1
+
+
+def test_instrumentation_records_to_current_app(app):
+    identity = Identity(1)
+    identity.provides.add(UserNeed(1))
+    install_instrumentation()
+    try:
+        labels = {"generator": "_InstrumentedPolicy", "method": "allows", "action": "read"}
+        with app.app_context():
+            # metrics are not enabled in the application, nothing is recorded
+            assert _InstrumentedPolicy("read").allows(identity)
+            assert current_oarepo_workflows.metrics.get("generator_calls_total", **labels) == 0
+
+            app.config["WORKFLOWS_METRICS_ENABLED"] = True
+            assert _InstrumentedPolicy("read").allows(identity)
+            assert current_oarepo_workflows.metrics.get("generator_calls_total", **labels) == 1
+    finally:
+        uninstall_instrumentation()
+        app.config["WORKFLOWS_METRICS_ENABLED"] = False
+        current_oarepo_workflows.metrics.reset()
+
+
+def test_metrics_view(app):
+    with app.test_request_context("/workflows/metrics"):
+        with pytest.raises(NotFound):
+            metrics_view()
+
+        app.config["WORKFLOWS_METRICS_ENABLED"] = True
+        try:
+            with pytest.raises(Forbidden):
+                metrics_view()
+            g.identity = Identity(1)
+            with pytest.raises(Forbidden):
+                metrics_view()
+            g.identity.provides.add(superuser_access)
+
+            current_oarepo_workflows.metrics.inc("test_total", kind="view")
+            response = metrics_view()
+            assert response.status_code == 200
+            assert 'oarepo_workflows_test_total{kind="view"} 1' in response.get_data(as_text=True)
+        finally:
+            app.config["WORKFLOWS_METRICS_ENABLED"] = False
+            current_oarepo_workflows.metrics.reset()
+
+
+def test_metrics_view_token(app):
+    app.config["WORKFLOWS_METRICS_ENABLED"] = True
+    app.config["WORKFLOWS_METRICS_TOKEN"] = "secret"  # noqa: S105
+    try:
+        with app.test_request_context("/workflows/metrics", headers={"Authorization": "Bearer wrong"}):
+            with pytest.raises(Forbidden):
+                metrics_view()
+        with app.test_request_context("/workflows/metrics", headers={"Authorization": "Bearer secret"}):
+            assert metrics_view().status_code == 200
+    finally:
+        app.config["WORKFLOWS_METRICS_ENABLED"] = False
+        app.config["WORKFLOWS_METRICS_TOKEN"] = None
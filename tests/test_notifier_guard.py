@@ -0,0 +1,189 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for timing, budgets and error isolation of state changed notifiers."""
+
+from __future__ import annotations
+
+import pytest
+
+from oarepo_workflows.metrics import WorkflowMetrics
+from oarepo_workflows.notifiers import NotifierDispatch, NotifierGuard, notifier_name
+from oarepo_workflows.proxies import current_oarepo_workflows
+
+
+def make_notifier(calls, name, error=None):
+    def notifier(identity, record, previous_state, new_state, *args, uow, **kwargs):
+        calls.append((name, uow))
+        if error is not None:
+            raise error
+
+    notifier.__qualname__ = name
+    return notifier
+
+
+def call(guard, notifier):
+    guard.call(notifier, None, None, "draft", "published", uow=None)
+
+
+def test_calls_are_recorded():
+    metrics = WorkflowMetrics()
+    guard = NotifierGuard(metrics)
+    calls: list = []
+    notifier = make_notifier(calls, "fast")
+    name = notifier_name(notifier)
+    assert name == f"{__name__}:fast"
+
+    call(guard, notifier)
+    call(guard, notifier)
+
+    assert len(calls) == 2
+    assert metrics.get("notifier_calls_total", notifier=name) == 2
+    assert metrics.get("notifier_seconds_total", notifier=name) > 0
+    assert metrics.get("notifier_over_budget_total", notifier=name) == 0
+    assert "notifier_calls_total" in metrics.render_prometheus()
+
+
+def test_over_budget_trips_notifier():
+    metrics = WorkflowMetrics()
+    calls: list = []
+    slow = make_notifier(calls, "slow")
+    name = notifier_name(slow)
+    guard = NotifierGuard(metrics, budgets={name: 0.0}, max_strikes=2)
+
+    call(guard, slow)
+    assert not guard.is_tripped(name)
+    call(guard, slow)
+    assert guard.is_tripped(name)
+    assert guard.health(name).strikes == 2
+    assert metrics.get("notifier_over_budget_total", notifier=name) == 2
+    assert metrics.get("notifier_tripped_total", notifier=name, action="defer") == 1
+
+    # notifiers without a budget are never tripped
+    other = make_notifier(calls, "other")
+    for _ in range(3):
+        call(guard, other)
+    assert not guard.is_tripped(notifier_name(other))
+
+
+def test_tripped_notifier_is_tried_after_cooldown():
+    metrics = WorkflowMetrics()
+    calls: list = []
+    slow = make_notifier(calls, "slow")
+    name = notifier_name(slow)
+    guard = NotifierGuard(metrics, default_budget=0.0, max_strikes=1, cooldown=0.0)
+
+    call(guard, slow)
+    # cooldown is over, the notifier is tried again, but a single strike trips it again
+    assert not guard.is_tripped(name)
+    call(guard, slow)
+    assert guard.health(name).open_until is not None
+    assert metrics.get("notifier_tripped_total", notifier=name, action="defer") == 2
+
+
+def test_errors_are_isolated():
+    metrics = WorkflowMetrics()
+    calls: list = []
+    failing = make_notifier(calls, "failing", error=RuntimeError("boom"))
+    name = notifier_name(failing)
+
+    not_isolated = NotifierGuard(metrics, max_strikes=1)
+    with pytest.raises(RuntimeError):
+        call(not_isolated, failing)
+    # errors that abort the state change are not strikes
+    assert not not_isolated.is_tripped(name)
+    assert not_isolated.health(name).strikes == 0
+
+    guard = NotifierGuard(metrics, isolate_errors=True, max_strikes=2, overrun_action="disable", cooldown=None)
+    call(guard, failing)
+    call(guard, failing)
+    assert metrics.get("notifier_errors_total", notifier=name) == 3
+    assert guard.is_tripped(name)
+    assert guard.health(name).open_until == float("inf")
+
+    with pytest.raises(ValueError, match="Unknown notifier overrun action"):
+        NotifierGuard(metrics, overrun_action="ignore")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("action", ["defer", "disable"])
+def test_state_change_defers_tripped_notifiers(
+    action, users, record_service, default_workflow_json, location, search_clear
+):
+    calls: list = []
+    healthy = make_notifier(calls, "healthy")
+    tripped = make_notifier(calls, "tripped")
+    guard = NotifierGuard(current_oarepo_workflows.metrics, overrun_action=action, max_strikes=1)
+    guard.budgets[notifier_name(tripped)] = 0.0
+    call(guard, tripped)
+    calls.clear()
+
+    current_oarepo_workflows.caches.set("notifier_dispatch", NotifierDispatch([healthy, tripped]))
+    current_oarepo_workflows.caches.set("notifier_guard", guard)
+    try:
+        record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
+        current_oarepo_workflows.set_state(users[0].identity, record, "approving", notify_later=False)
+    finally:
+        current_oarepo_workflows.invalidate("notifier_dispatch", "notifier_guard")
+
+    names = [name for name, _ in calls]
+    if action == "defer":
+        assert names == ["healthy", "tripped"]
+        # deferred notifier runs after the commit, in its own unit of work
+        assert calls[0][1] is not calls[1][1]
+    else:
+        assert names == ["healthy"]
+    assert current_oarepo_workflows.metrics.get(
+        "notifier_skipped_total", notifier=notifier_name(tripped), action=action
+    ) >= 1
+
+
+def test_failing_notifier_keeps_aborting_state_changes(
+    users, record_service, default_workflow_json, location, search_clear
+):
+    calls: list = []
+    failing = make_notifier(calls, "failing", error=RuntimeError("boom"))
+    guard = NotifierGuard(current_oarepo_workflows.metrics, default_budget=0.0, max_strikes=3)
+
+    current_oarepo_workflows.caches.set("notifier_dispatch", NotifierDispatch([failing]))
+    current_oarepo_workflows.caches.set("notifier_guard", guard)
+    try:
+        record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
+        for state in ("approving", "published", "retracting", "deleted"):
+            with pytest.raises(RuntimeError, match="boom"):
+                current_oarepo_workflows.set_state(users[0].identity, record, state, commit=False, notify_later=False)
+    finally:
+        current_oarepo_workflows.invalidate("notifier_dispatch", "notifier_guard")
+
+    # the fourth state change has been aborted as well, the notifier was neither deferred nor disabled
+    assert len(calls) == 4
+    assert not guard.is_tripped(notifier_name(failing))
+
+
+def test_deferred_notifier_errors_are_isolated(users, record_service, default_workflow_json, location, search_clear):
+    calls: list = []
+    failing = make_notifier(calls, "deferred", error=RuntimeError("boom"))
+    name = notifier_name(failing)
+    metrics = current_oarepo_workflows.metrics
+    guard = NotifierGuard(metrics, budgets={name: 0.0}, max_strikes=1)
+    # trip the notifier by a call over its budget
+    call(guard, make_notifier(calls, "deferred"))
+    calls.clear()
+    errors = metrics.get("notifier_errors_total", notifier=name)
+
+    current_oarepo_workflows.caches.set("notifier_dispatch", NotifierDispatch([failing]))
+    current_oarepo_workflows.caches.set("notifier_guard", guard)
+    try:
+        record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
+        # the state change is committed before the deferred notifier runs, its error is not raised
+        current_oarepo_workflows.set_state(users[0].identity, record, "approving", notify_later=False)
+    finally:
+        current_oarepo_workflows.invalidate("notifier_dispatch", "notifier_guard")
+
+    assert [name for name, _ in calls] == ["deferred"]
+    assert metrics.get("notifier_errors_total", notifier=name) == errors + 1
+    assert type(record).get_record(record.id).state == "approving"
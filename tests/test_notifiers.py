@@ -0,0 +1,72 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for the dispatch of state changes to subscribed notifiers."""
+
+from __future__ import annotations
+
+from oarepo_workflows import StateChangeSubscription, subscribe
+from oarepo_workflows.notifiers import NotifierDispatch
+from oarepo_workflows.proxies import current_oarepo_workflows
+
+
+def make_notifier(calls, name):
+    def notifier(identity, record, previous_state, new_state, *args, uow, **kwargs):
+        calls.append((name, previous_state, new_state))
+
+    return notifier
+
+
+def test_dispatch_index():
+    calls: list = []
+    everything = make_notifier(calls, "everything")
+    published = subscribe(StateChangeSubscription(to_state="published"))(make_notifier(calls, "published"))
+    retracted = subscribe(
+        StateChangeSubscription(workflow="default", from_state="published"),
+        StateChangeSubscription(to_state="retracted"),
+    )(make_notifier(calls, "retracted"))
+
+    dispatch = NotifierDispatch([published, everything, retracted])
+    assert dispatch.needs_workflow
+
+    assert dispatch.notifiers_for("default", "draft", "published") == (published, everything)
+    assert dispatch.notifiers_for("other", "draft", "submitted") == (everything,)
+    assert dispatch.notifiers_for("default", "published", "deleted") == (everything, retracted)
+    assert dispatch.notifiers_for("other", "published", "deleted") == (everything,)
+    assert dispatch.notifiers_for(None, "published", "retracted") == (everything, retracted)
+    # memoized
+    assert dispatch.notifiers_for("default", "draft", "published") is dispatch.notifiers_for(
+        "default", "draft", "published"
+    )
+
+    assert not NotifierDispatch([everything, published]).needs_workflow
+
+
+def test_subscription_matches():
+    subscription = StateChangeSubscription(workflow="default", to_state="published")
+    assert subscription.matches("default", "draft", "published")
+    assert not subscription.matches("other", "draft", "published")
+    assert not subscription.matches("default", "draft", "submitted")
+
+
+def test_state_change_runs_subscribed_notifiers(
+    users, record_service, default_workflow_json, location, search_clear
+):
+    calls: list = []
+    approving = subscribe(StateChangeSubscription(to_state="approving"))(make_notifier(calls, "approving"))
+    published = subscribe(StateChangeSubscription(to_state="published"))(make_notifier(calls, "published"))
+    current_oarepo_workflows.caches.set("notifier_dispatch", NotifierDispatch([approving, published]))
+    try:
+        record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
+        current_oarepo_workflows.set_state(
+            users[0].identity, record, "approving", commit=False, notify_later=False
+        )
+    finally:
+        current_oarepo_workflows.invalidate("notifier_dispatch")
+
+    assert calls == [("approving", "draft", "approving")]
@@ -0,0 +1,135 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for compilation of workflow permission policies."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from flask_principal import UserNeed
+from invenio_access.permissions import any_user, system_process
+from invenio_records_permissions.generators import AnyUser, Disable, Generator, SameAs, SystemProcess
+
+from oarepo_workflows.services.permissions import BaseWorkflowPermissionPolicy, IfInState
+from oarepo_workflows.services.permissions.compiler import compile_permission, get_decision_table
+
+
+class OwnerGenerator(Generator):
+    """Dynamic generator depending on the record."""
+
+    def needs(self, record: Any = None, **context: Any):
+        return [UserNeed(record.owner)] if record is not None else []
+
+
+owner = OwnerGenerator()
+
+
+class CompiledPolicy(BaseWorkflowPermissionPolicy):
+    can_read = (
+        IfInState("draft", [owner]),
+        IfInState(["published", "retracted"], [AnyUser()], [Disable()]),
+        SystemProcess(),
+    )
+    can_read_draft = (SameAs("can_read"),)
+    can_update = (owner,)
+
+
+class NotCompiledPolicy(CompiledPolicy):
+    compile_permissions = False
+
+
+def test_compile_permission():
+    table = compile_permission(CompiledPolicy, "read")
+    assert set(table.by_state) == {"draft", "published", "retracted"}
+
+    published = table.by_state["published"]
+    assert published.needs == {any_user, system_process}
+    assert published.excludes == frozenset()
+    assert published.dynamic == ()
+
+    draft = table.by_state["draft"]
+    assert draft.needs == {system_process}
+    assert draft.excludes == {any_user}
+    assert draft.dynamic == (owner,)
+
+    assert table.default.dynamic == ()
+    assert table.default.excludes == {any_user}
+    assert table.lookup(SimpleNamespace(state="unknown")) is table.default
+    assert table.lookup(None) is table.default
+
+    # SameAs is inlined
+    assert compile_permission(CompiledPolicy, "read_draft").by_state["draft"].dynamic == (owner,)
+    # nothing to precompute
+    assert compile_permission(CompiledPolicy, "update") is None
+    assert compile_permission(CompiledPolicy, "unknown") is None
+
+
+def test_decision_table_is_cached():
+    assert get_decision_table(CompiledPolicy, "read") is get_decision_table(CompiledPolicy, "read")
+
+
+def test_compiled_policy_matches_generators():
+    for state in ("draft", "published", "retracted", "deleted"):
+        record = SimpleNamespace(state=state, owner=1)
+        for action in ("read", "read_draft", "update"):
+            compiled = CompiledPolicy(action, record=record)
+            direct = NotCompiledPolicy(action, record=record)
+            assert set(compiled.needs) == set(direct.needs), (state, action)
+            assert set(compiled.excludes) == set(direct.excludes), (state, action)
+
+
+def test_compiled_policy_skips_static_generators(monkeypatch):
+    calls = []
+    original_needs = AnyUser.needs
+
+    def counting_needs(self, **context):
+        calls.append(context.get("record"))
+        return original_needs(self, **context)
+
+    monkeypatch.setattr(AnyUser, "needs", counting_needs)
+    # compile the table (this evaluates the static generators once)
+    get_decision_table(CompiledPolicy, "read")
+    calls.clear()
+
+    draft = SimpleNamespace(state="draft", owner=1)
+    published = SimpleNamespace(state="published", owner=1)
+    policy = CompiledPolicy("read", record=draft)
+    assert policy.generators == get_decision_table(CompiledPolicy, "read").by_state["draft"].generators
+    assert set(policy.needs) == {UserNeed(1), system_process}
+    assert any_user in set(CompiledPolicy("read", record=published).needs)
+    # AnyUser is not evaluated, neither in the non-matching branch (draft) nor in the matching one
+    assert calls == []
+
+    # without compilation the generator is evaluated
+    assert any_user in set(NotCompiledPolicy("read", record=published).needs)
+    assert calls == [published]
+
+
+def test_query_filters_use_original_generators(app):
+    policy = CompiledPolicy("read", identity=SimpleNamespace(provides=set()))
+    # IfInState contributes filters on the state of the records, which no compiled entry has
+    assert any("state" in str(query.to_dict()) for query in policy.query_filters)
+    assert policy.generators is not CompiledPolicy.can_read
+
+
+def test_system_process_added_at_class_creation():
+    from oarepo_workflows.services.permissions import DefaultWorkflowPermissions
+
+    class Permissions(DefaultWorkflowPermissions):
+        can_read = (AnyUser(),)
+
+    assert Permissions.can_read == (Permissions.can_read[0], DefaultWorkflowPermissions.system_process)
+    assert DefaultWorkflowPermissions.system_process in DefaultWorkflowPermissions.can_update
+    # the generator is not appended again in subclasses
+    assert Permissions.can_update is DefaultWorkflowPermissions.can_update
+
+    can_read = Permissions.can_read
+    Permissions("read")
+    assert Permissions.can_read is can_read
@@ -173,6 +173,40 @@ def test_user_with_role_needs_returns_empty_when_role_not_found(app, db):
     assert gen.needs() == []
 
 
+class _SharedCache(dict):
+    def set(self, key, value, timeout=None):
+        self[key] = (value, timeout)
+
+    def get(self, key):
+        value = super().get(key)
+        return value[0] if value is not None else None
+
+    def delete_many(self, *keys):
+        for key in keys:
+            self.pop(key, None)
+
+
+def test_user_with_role_ids_are_shared_with_ttl(app, db, role, monkeypatch):
+    """Role ids are cached in the shared cache with a TTL and removed when the role changes."""
+    from oarepo_workflows.services.permissions import generators
+
+    shared = _SharedCache()
+    monkeypatch.setattr(generators, "_role_id_cache", lambda: shared)
+    key = f"{generators.ROLE_ID_CACHE_KEY_PREFIX}it-dep"
+
+    assert UserWithRole("it-dep").needs() == [RoleNeed("it-dep")]
+    assert shared[key] == ("it-dep", app.config["WORKFLOWS_ROLE_ID_CACHE_TTL"])
+
+    # another process would read the id from the shared cache
+    shared[key] = ("shared-id", None)
+    assert UserWithRole("it-dep").needs() == [RoleNeed("shared-id")]
+
+    role.name = "it-department"
+    db.session.commit()
+    assert key not in shared
+    assert UserWithRole("it-dep").needs() == []
+
+
 # ===========================================================================
 # UserWithRole — query_filter() tests (require Flask app + DB)
 # ===========================================================================
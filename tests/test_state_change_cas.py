@@ -0,0 +1,70 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for compare-and-swap state changes."""
+
+from __future__ import annotations
+
+import pytest
+from invenio_db import db
+from sqlalchemy import update
+
+from oarepo_workflows.errors import StateChangeConflictError
+from oarepo_workflows.proxies import current_oarepo_workflows
+
+
+def test_compare_and_swap(users, record_service, default_workflow_json, location, search_clear):
+    record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
+    revision = record.revision_id
+
+    current_oarepo_workflows.set_state(
+        users[0].identity, record, "approving", expected_state=record.state, expected_revision=revision
+    )
+    assert record.state == "approving"
+    assert record.revision_id == revision + 1
+
+
+def test_unexpected_state_fails_fast(users, record_service, default_workflow_json, location, search_clear):
+    record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
+
+    with pytest.raises(StateChangeConflictError) as e:
+        current_oarepo_workflows.set_state(users[0].identity, record, "approving", expected_state="published")
+    assert e.value.expected_state == "published"
+    assert e.value.new_state == "approving"
+
+    with pytest.raises(StateChangeConflictError):
+        current_oarepo_workflows.set_state(
+            users[0].identity, record, "approving", expected_revision=record.revision_id + 1, commit=False
+        )
+
+
+def bump_revision(record):
+    """Change the row of the record as another transaction would, after the record has been read."""
+    assert record.revision_id is not None
+    table = type(record.model).__table__
+    db.session.execute(
+        update(table).where(table.c.id == record.model.id).values(version_id=table.c.version_id + 1)
+    )
+
+
+def test_concurrent_change_conflicts(users, record_service, default_workflow_json, location, search_clear):
+    record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
+    bump_revision(record)
+
+    with pytest.raises(StateChangeConflictError):
+        current_oarepo_workflows.set_state(users[0].identity, record, "approving", compare_and_swap=True)
+
+
+def test_concurrent_change_conflicts_without_commit(
+    users, record_service, default_workflow_json, location, search_clear
+):
+    record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
+    bump_revision(record)
+
+    with pytest.raises(StateChangeConflictError):
+        current_oarepo_workflows.set_state(users[0].identity, record, "approving", compare_and_swap=True, commit=False)
@@ -0,0 +1,157 @@
+#
+# Copyright (c) 2026 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-workflows (see https://github.com/oarepo/oarepo-workflows).
+#
+# oarepo-workflows is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for the precomputed workflow state graph."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from flask_principal import Identity, UserNeed
+from invenio_access.permissions import superuser_access, system_identity
+from invenio_records_permissions.generators import AuthenticatedUser
+from invenio_requests.customizations.request_types import RequestType
+
+from oarepo_workflows import Workflow, WorkflowRequest, WorkflowTransitions
+from oarepo_workflows.errors import InvalidWorkflowError
+from oarepo_workflows.proxies import current_oarepo_workflows
+from oarepo_workflows.requests.policy import decides_applicability
+from oarepo_workflows.requests import AutoRequest
+from oarepo_workflows.requests.state_graph import StateGraph, StateTransition
+from oarepo_workflows.services.permissions import DefaultWorkflowPermissions, IfInState
+
+
+class GraphPermissions(DefaultWorkflowPermissions):
+    """Permissions mentioning a state not used by any request."""
+
+    can_read = (IfInState("retracted", [AuthenticatedUser()]),)
+
+
+def graph_workflow() -> tuple[Workflow, dict[str, WorkflowRequest]]:
+    workflow = Workflow(code="graph", label="Graph", permission_policy_cls=GraphPermissions)
+    requests = {
+        "publish": WorkflowRequest(
+            requesters=[IfInState("draft", [AuthenticatedUser()])],
+            recipients=[],
+            transitions=WorkflowTransitions(submitted="submitted", accepted="published", declined="draft"),
+        ),
+        "review": WorkflowRequest(
+            requesters=[IfInState("submitted", [AutoRequest()])],
+            recipients=[],
+            transitions=WorkflowTransitions(accepted="reviewed"),
+        ),
+        "delete": WorkflowRequest(
+            requesters=[AuthenticatedUser()],
+            recipients=[],
+            transitions=WorkflowTransitions(accepted="deleted"),
+        ),
+        "never": WorkflowRequest(requesters=[], recipients=[]),
+    }
+    return workflow, requests
+
+
+def test_state_graph():
+    graph = StateGraph.from_workflow(*graph_workflow())
+
+    assert graph.states == {"draft", "submitted", "published", "reviewed", "deleted", "retracted"}
+    assert graph.anywhere == {"delete"}
+    assert graph.available_request_types("draft") == {"publish", "delete"}
+    assert graph.available_request_types("unknown") == {"delete"}
+
+    assert set(graph.outgoing("draft")) == {
+        StateTransition("publish", "submitted", "draft", "submitted"),
+        StateTransition("delete", "accepted", None, "deleted"),
+    }
+    assert graph.request_types_leaving("submitted") == {"publish", "review", "delete"}
+    assert graph.request_types_leaving("deleted") == frozenset()
+    assert graph.successors("submitted") == {"published", "draft", "reviewed", "deleted"}
+    assert graph.successors("unknown") == {"deleted"}
+
+    assert StateTransition("review", "accepted", "submitted", "reviewed", auto=True) in graph.incoming("reviewed")
+    assert graph.auto_requests("submitted") == {"review"}
+    assert graph.auto_requests("draft") == frozenset()
+    assert graph.dynamic_auto_requests == frozenset()
+
+
+def test_state_graphs_of_configured_workflows(app, search_clear):
+    graph = current_oarepo_workflows.get_state_graph("my_workflow")
+    assert graph.request_types_leaving("published") == {"req"}
+    assert graph.successors("considered_for_deletion") == {"deleted", "published"}
+    assert set(current_oarepo_workflows.state_graphs) == set(current_oarepo_workflows.workflow_by_code)
+
+    with pytest.raises(InvalidWorkflowError):
+        current_oarepo_workflows.get_state_graph("unknown")
+
+
+def test_applicable_requests_use_state_graph(app, search_clear):
+    requests = current_oarepo_workflows.workflow_by_code["my_workflow"].requests()
+    owner = Identity(id=1)
+    owner.provides.add(UserNeed(1))
+
+    def record(state):
+        return SimpleNamespace(
+            state=state,
+            parent=SimpleNamespace(
+                access=SimpleNamespace(owner=SimpleNamespace(owner_id=1)),
+                workflow="my_workflow",
+            ),
+        )
+
+    assert current_oarepo_workflows.get_state_graph("my_workflow").available_request_types("draft") == frozenset()
+    assert requests.applicable_workflow_requests(owner, record=record("draft")) == []
+    assert requests._available_request_types(system_identity, record("draft")) is None  # noqa: SLF001
+
+    superuser = Identity(id=2)
+    superuser.provides.add(UserNeed(2))
+    superuser.provides.add(superuser_access)
+    assert requests._available_request_types(superuser, record("draft")) is None  # noqa: SLF001
+
+
+def test_applicable_requests_keep_request_types_deciding_applicability(app, search_clear, monkeypatch):
+    requests = current_oarepo_workflows.workflow_by_code["my_workflow"].requests()
+    request_type = requests["req"].request_type
+    identity = Identity(id=1)
+    identity.provides.add(UserNeed(1))
+    record = SimpleNamespace(state="draft", parent=SimpleNamespace(workflow="my_workflow"))
+    assert "req" not in current_oarepo_workflows.get_state_graph("my_workflow").available_request_types("draft")
+
+    checked = []
+
+    def is_applicable_to(self, identity, topic, **context):
+        checked.append(topic)
+        return True
+
+    monkeypatch.setattr(type(request_type), "is_applicable_to", is_applicable_to, raising=False)
+    assert [name for name, _ in requests.applicable_workflow_requests(identity, record=record)] == ["req"]
+    assert checked == [record]
+
+
+def test_applicable_requests_skip_base_applicability_check(app, search_clear, monkeypatch):
+    requests = current_oarepo_workflows.workflow_by_code["my_workflow"].requests()
+    request_type = requests["req"].request_type
+    identity = Identity(id=1)
+    identity.provides.add(UserNeed(1))
+    record = SimpleNamespace(state="draft", parent=SimpleNamespace(workflow="my_workflow"))
+
+    checked = []
+
+    def is_applicable_to(cls, identity, topic, **context):
+        checked.append(topic)
+        return True
+
+    # the request type inherits is_applicable_to of oarepo-requests without overriding it
+    base = type(
+        "OARepoRequestType",
+        (RequestType,),
+        {"__module__": "oarepo_requests.types.generic", "is_applicable_to": classmethod(is_applicable_to)},
+    )
+    monkeypatch.setattr(type(request_type), "__bases__", (base,))
+    assert not decides_applicability(request_type)
+    assert requests.applicable_workflow_requests(identity, record=record) == []
+    assert checked == []
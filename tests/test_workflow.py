@@ -196,3 +196,17 @@ def test_state_change_entrypoint_hookup(
     record = record_service.create(users[0].identity, default_workflow_json)._record  # noqa SLF001
     current_oarepo_workflows.set_state(users[0].identity, record, "approving", commit=False)
     assert entrypoints.state_change_notifier_called
+
+
+def test_warm_up(app, search_clear):
+    report = current_oarepo_workflows.warm_up()
+    assert set(report) == {w.code for w in current_oarepo_workflows.record_workflows}
+    assert current_oarepo_workflows.warmup_report == report
+
+    workflow = current_oarepo_workflows.workflow_by_code["my_workflow"]
+    # the policy class is created once and its permissions are compiled
+    policy_cls = workflow.permission_policy_with_requests_cls
+    assert policy_cls is workflow.permission_policy_with_requests_cls
+    assert "read" in current_oarepo_workflows.decision_tables[policy_cls]
+
+    assert set(current_oarepo_workflows.workflow_query_filters) == set(report)
@@ -7,6 +7,8 @@
 #
 from __future__ import annotations
 
+import uuid
+
 import pytest
 from invenio_access.permissions import system_identity
 
@@ -26,3 +28,205 @@ def test_workflow_read(default_workflow_json, record_service, location, search_c
     data = record_service.create(system_identity, default_workflow_json)
     assert data._record.parent.workflow == "my_workflow"  # noqa SLF001
     assert data._record.state == "draft"  # noqa SLF001
+
+
+def test_state_columns(default_workflow_json, record_service, location, search_clear):
+    from invenio_db import db
+    from sqlalchemy import update
+
+    from oarepo_workflows.records.backfill import (
+        STATE_COLUMNS,
+        backfill_columns,
+        models_with_columns,
+        state_column_values,
+    )
+
+    data = record_service.create(system_identity, default_workflow_json)
+    draft = data._record  # noqa SLF001
+    model_cls = type(draft.model)
+    assert draft.model.state == "draft"
+    assert draft.model.state_timestamp is not None
+
+    draft.state = "submitted"
+    draft.commit()
+    db.session.commit()
+    assert db.session.get(model_cls, draft.id).state == "submitted"
+
+    # drop the column values and fill them again from the json
+    db.session.execute(update(model_cls.__table__).values(state=None, state_timestamp=None))
+    db.session.commit()
+    version_id = db.session.get(model_cls, draft.id).version_id
+    db.session.expire_all()
+
+    assert model_cls in models_with_columns(*STATE_COLUMNS)
+    assert backfill_columns(model_cls, state_column_values, batch_size=1) >= 1
+    db.session.expire_all()
+    row = db.session.get(model_cls, draft.id)
+    assert row.state == "submitted"
+    assert row.state_timestamp is not None
+    # the backfill does not create a new revision of the record
+    assert row.version_id == version_id
+
+
+def test_backfill_parent_workflow(app, default_workflow_json, record_service, location, search_clear):
+    from invenio_db import db
+    from sqlalchemy import update
+
+    from oarepo_workflows.proxies import current_oarepo_workflows
+    from oarepo_workflows.records.backfill import backfill_parent_workflow, workflow_services
+
+    draft = record_service.create(system_identity, default_workflow_json)._record  # noqa SLF001
+    parent_table = type(draft.parent.model).__table__
+    db.session.execute(update(parent_table).where(parent_table.c.id == draft.parent.id).values(workflow=None))
+    db.session.commit()
+
+    assert record_service in workflow_services()
+    progress = []
+    updated = backfill_parent_workflow(
+        record_service,
+        current_oarepo_workflows.default_workflow.code,
+        batch_size=1,
+        progress=lambda updated, queued, last_id: progress.append((updated, queued, last_id)),
+    )
+    assert updated == 1
+    assert progress == [(1, 1, draft.parent.id)]
+    db.session.expire_all()
+    parent = db.session.get(type(draft.parent.model), draft.parent.id)
+    assert parent.workflow == current_oarepo_workflows.default_workflow.code
+
+    # nothing left to backfill
+    progress.clear()
+    assert backfill_parent_workflow(record_service, current_oarepo_workflows.default_workflow.code) == 0
+    assert progress == []
+
+    # a resumed run queues the parents of the interrupted batch for reindexing again
+    updated = backfill_parent_workflow(
+        record_service,
+        current_oarepo_workflows.default_workflow.code,
+        batch_size=1,
+        resume_after=uuid.UUID(int=draft.parent.id.int - 1),
+        progress=lambda updated, queued, last_id: progress.append((updated, queued, last_id)),
+    )
+    assert updated == 0
+    assert progress == [(0, 1, uuid.UUID(int=draft.parent.id.int - 1))]
+
+
+def test_backfill_requeues_only_interrupted_batch(
+    app, default_workflow_json, record_service, location, search_clear, monkeypatch
+):
+    from invenio_db import db
+    from sqlalchemy import update
+
+    from oarepo_workflows.proxies import current_oarepo_workflows
+    from oarepo_workflows.records import backfill
+
+    code = current_oarepo_workflows.default_workflow.code
+    drafts = [record_service.create(system_identity, default_workflow_json)._record for _ in range(3)]  # noqa SLF001
+    parent_table = type(drafts[0].parent.model).__table__
+    first, second, third = sorted(draft.parent.id for draft in drafts)
+    # the run was interrupted after committing the batch of the first parent, before queueing it
+    db.session.execute(update(parent_table).where(parent_table.c.id.in_([second, third])).values(workflow=None))
+    db.session.commit()
+
+    reindexed = []
+    monkeypatch.setattr(backfill, "reindex_children", lambda service, ids: reindexed.append(list(ids)) or len(ids))
+    updated = backfill.backfill_parent_workflow(
+        record_service, code, batch_size=1, resume_after=uuid.UUID(int=first.int - 1)
+    )
+    assert updated == 2
+    assert reindexed == [[first], [second], [third]]
+
+
+def test_query_filters_without_exists(app):
+    from oarepo_workflows.proxies import current_oarepo_workflows
+
+    default_code = app.config["WORKFLOWS_DEFAULT_WORKFLOW"]
+    assert "exists" in str(current_oarepo_workflows.workflow_query_filters[default_code].to_dict())
+
+    app.config["WORKFLOWS_ALL_PARENTS_HAVE_WORKFLOW"] = True
+    current_oarepo_workflows.invalidate("workflow_query_filters")
+    try:
+        assert current_oarepo_workflows.workflow_query_filters[default_code].to_dict() == {
+            "term": {"parent.workflow": default_code}
+        }
+    finally:
+        app.config["WORKFLOWS_ALL_PARENTS_HAVE_WORKFLOW"] = False
+        current_oarepo_workflows.invalidate("workflow_query_filters")
+
+
+def test_change_workflow_many(default_workflow_json, record_service, location, search_clear):
+    from invenio_db import db
+
+    from oarepo_workflows.services.workflow_change import change_workflow_many
+
+    drafts = [record_service.create(system_identity, default_workflow_json)._record for _ in range(3)]  # noqa SLF001
+    parent_model = type(drafts[0].parent.model)
+
+    with pytest.raises(InvalidWorkflowError):
+        change_workflow_many(record_service, "non_existing_workflow", source_workflow="my_workflow")
+
+    reported = []
+    result = change_workflow_many(
+        record_service,
+        "record_owners_can_read",
+        source_workflow="my_workflow",
+        batch_size=2,
+        progress=lambda progress: reported.append(progress.processed),
+    )
+    assert result.changed == result.processed >= 3
+    assert reported[-1] == result.processed
+    db.session.expire_all()
+    for draft in drafts:
+        assert db.session.get(parent_model, draft.parent.id).workflow == "record_owners_can_read"
+
+    # resuming after the last parent has nothing to do
+    resumed = change_workflow_many(
+        record_service,
+        "record_owners_can_read",
+        source_workflow="my_workflow",
+        resume_after=result.last_id,
+    )
+    assert resumed.processed == 0
+
+
+def test_change_workflow_many_requeues_only_interrupted_batch(
+    default_workflow_json, record_service, location, search_clear, monkeypatch
+):
+    from invenio_db import db
+    from sqlalchemy import update
+
+    from oarepo_workflows.services import workflow_change
+
+    drafts = [record_service.create(system_identity, default_workflow_json)._record for _ in range(3)]  # noqa SLF001
+    parent_table = type(drafts[0].parent.model).__table__
+    first, second, third = sorted(draft.parent.id for draft in drafts)
+    # the run was interrupted after committing the batch of the first parent, before queueing it
+    db.session.execute(
+        update(parent_table).where(parent_table.c.id == first).values(workflow="record_owners_can_read")
+    )
+    db.session.commit()
+
+    reindexed = []
+    monkeypatch.setattr(
+        workflow_change, "reindex_children", lambda service, ids: reindexed.append(list(ids)) or len(ids)
+    )
+    result = workflow_change.change_workflow_many(
+        record_service,
+        "record_owners_can_read",
+        parent_ids=[first, second, third],
+        source_workflow="my_workflow",
+        batch_size=1,
+        resume_after=uuid.UUID(int=first.int - 1),
+    )
+    assert result.processed == result.changed == 2
+    assert reindexed == [[first], [second], [third]]
+
+
+def test_change_workflow_resume_requires_service(app):
+    from oarepo_workflows.cli import change_workflow
+
+    result = app.test_cli_runner().invoke(
+        change_workflow, ["record_owners_can_read", "--from", "my_workflow", "--resume-after", "1"]
+    )
+    assert result.exit_code == 2
+    assert "--service must be given" in result.output
@@ -126,3 +126,69 @@ def test_in_any_workflow_allows_with_excludes(
 
     # user4 is denied: excluded by different_read_2, no matching needs in different_read_1
     assert not policy.allows(users[3].identity)
+
+
+def test_explain(app, identity_simple, search_clear):
+    record = SimpleNamespace(state="published", parent=SimpleNamespace(workflow="my_workflow"))
+    explanation = current_oarepo_workflows.explain(identity_simple, "read", record)
+
+    assert explanation.workflow == "my_workflow"
+    assert explanation.policy == "TestPermissionPolicyWithRequests"
+    assert explanation.allowed
+
+    draft_node, published_node = explanation.generators[:2]
+    assert draft_node.generator == "IfInState(['draft'])"
+    assert draft_node.branch == "else"
+    assert not draft_node.children
+    assert published_node.branch == "then"
+    assert published_node.matched
+    assert published_node.children[0].needs == [Need(method="system_role", value="any_user")]
+
+    serialized = explanation.to_dict()
+    assert serialized["generators"][1]["branch"] == "then"
+    assert "allowed" in explanation.format()
+
+
+def test_explain_require_all():
+    from oarepo_workflows.services.permissions.composite import RequireAll
+    from oarepo_workflows.services.permissions.explain import explain_generator
+
+    from .test_composite import FixedExcludesGenerator, FixedNeedsGenerator, _CompositeTestPolicy
+
+    identity = Identity(1)
+    identity.provides.add(UserNeed(1))
+    policy = _CompositeTestPolicy("read")
+
+    node = explain_generator(
+        RequireAll(FixedNeedsGenerator(UserNeed(1)), FixedExcludesGenerator(needs=[UserNeed(2)])),
+        identity,
+        policy.over,
+    )
+    assert node.satisfied is False
+    assert [c.matched for c in node.children] == [True, False]
+
+
+def test_workflow_access_denormalization(app, users, record_service, default_workflow_json, location, search_clear):
+    from oarepo_workflows.services.permissions.access import need_tokens, workflow_access_query_filter
+
+    owner, other = users[0], users[1]
+    draft = record_service.create(owner.identity, default_workflow_json)._record  # noqa SLF001
+
+    access = draft.workflow_access
+    assert f"id:{owner.id}" in access["read_draft"]["grant"]
+    assert "_workflow_access" in draft.dumps()
+    assert need_tokens([UserNeed(1), Need("composite", "x")]) == ["id:1"]
+
+    query = workflow_access_query_filter("read_draft", owner.identity).to_dict()
+    assert f"id:{owner.id}" in query["bool"]["filter"][0]["terms"]["_workflow_access.read_draft.grant"]
+
+    workflow_model_draft = type(draft)
+    workflow_model_draft.index.refresh()
+    app.config["WORKFLOWS_ACCESS_DENORMALIZATION"] = True
+    try:
+        assert record_service.search_drafts(owner.identity).total == 1
+        assert record_service.search_drafts(other.identity).total == 0
+        hit = next(iter(record_service.search_drafts(owner.identity).hits))
+        assert "_workflow_access" not in hit
+    finally:
+        app.config["WORKFLOWS_ACCESS_DENORMALIZATION"] = False
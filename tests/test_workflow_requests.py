@@ -7,11 +7,12 @@
 #
 from __future__ import annotations
 
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 from flask_principal import Identity, UserNeed
 from invenio_rdm_records.services.generators import RecordOwners
+from invenio_records_permissions.generators import AuthenticatedUser
 from invenio_search.engine import dsl
 from opensearch_dsl.query import Terms
 
@@ -19,6 +20,8 @@ from oarepo_workflows import FromRecordWorkflow
 from oarepo_workflows.errors import EventTypeNotInWorkflowError, RequestTypeNotInWorkflowError
 from oarepo_workflows.proxies import current_oarepo_workflows
 from oarepo_workflows.requests import WorkflowRequest
+from oarepo_workflows.requests.events import WorkflowEvent
+from oarepo_workflows.requests.permissions import RequestCreatorsFromWorkflow
 from tests.conftest import NullRecipient, TestRecipient, TestRecipient2
 
 
@@ -208,3 +211,97 @@ def test_from_record_workflow_invalid_workflow_in_data(app, search_clear):
     assert generator.needs(identity=id1, data=data) == []
     assert generator.excludes(identity=id1, data=data) == []
     assert generator.query_filter(identity=id1, data=data) == dsl.Q("match_none")
+
+
+def test_workflow_requests_index(app, search_clear):
+    index = current_oarepo_workflows.workflow_requests_by_type
+
+    assert set(index["req"].keys()) == set(current_oarepo_workflows.workflow_by_code.keys())
+    assert set(index["req1"].keys()) == {"is_applicable_workflow"}
+
+    workflow_request = current_oarepo_workflows.get_workflow_request("is_applicable_workflow", "req")
+    assert workflow_request is current_oarepo_workflows.workflow_by_code["is_applicable_workflow"].requests()["req"]
+
+    with pytest.raises(TypeError):
+        index["new"] = {}  # type: ignore[index]
+    with pytest.raises(TypeError):
+        index["req"]["new"] = workflow_request  # type: ignore[index]
+
+    with pytest.raises(RequestTypeNotInWorkflowError) as exc_info:
+        current_oarepo_workflows.get_workflow_request("my_workflow", "req1")
+    assert exc_info.value.workflow == "my_workflow"
+
+
+def test_workflow_events_index(app, search_clear):
+    event = current_oarepo_workflows.get_workflow_event("is_applicable_workflow", "req", "T")
+    assert event is current_oarepo_workflows.workflow_by_code["is_applicable_workflow"].requests()["req"].events["T"]
+
+    assert ("is_applicable_workflow", "req", "T") in current_oarepo_workflows.workflow_events_by_key
+
+    with pytest.raises(EventTypeNotInWorkflowError):
+        current_oarepo_workflows.get_workflow_event("my_workflow", "req", "T")
+
+
+def test_workflow_events_index_uses_allowed_events(app, search_clear):
+    index = current_oarepo_workflows.workflow_events_by_key
+    for request_type_id, by_workflow in current_oarepo_workflows.workflow_requests_by_type.items():
+        for workflow_code, workflow_request in by_workflow.items():
+            for event_type_id in workflow_request.allowed_events:
+                assert (workflow_code, request_type_id, event_type_id) in index
+
+
+def test_request_creators_from_workflow(users, logged_client, search_clear, record_service):
+    generator = RequestCreatorsFromWorkflow()
+    record = SimpleNamespace(
+        parent=SimpleNamespace(
+            access=(SimpleNamespace(owner=SimpleNamespace(owner_id=1))),
+            workflow="is_applicable_workflow",
+        )
+    )
+
+    assert generator.needs(record=record, request_type=SimpleNamespace(type_id="req")) == [UserNeed(1)]
+    assert generator._action_name(request_type=SimpleNamespace(type_id="req")) == "req_create"  # noqa: SLF001
+    # request type not defined in the workflow of the record
+    assert generator.needs(record=record, request_type=SimpleNamespace(type_id="unknown")) == []
+    assert generator.query_filter(record=record, request_type=SimpleNamespace(type_id="unknown")) == dsl.Q(
+        "match_none"
+    )
+
+
+def test_allowed_events(app, search_clear):
+    workflow_request = current_oarepo_workflows.get_workflow_request("is_applicable_workflow", "req")
+
+    allowed_events = current_oarepo_workflows.get_allowed_events("is_applicable_workflow", "req")
+    assert "T" in allowed_events
+    assert allowed_events is current_oarepo_workflows.get_allowed_events("is_applicable_workflow", "req")
+    # the merged events are cached by the extension, not rebuilt on each access
+    assert workflow_request.allowed_events is allowed_events
+
+    with pytest.raises(TypeError):
+        allowed_events["new"] = allowed_events["T"]  # type: ignore[index]
+    with pytest.raises(EventTypeNotInWorkflowError):
+        allowed_events["nonexistent_event"]
+    with pytest.raises(RequestTypeNotInWorkflowError):
+        current_oarepo_workflows.get_allowed_events("my_workflow", "req1")
+
+
+def test_allowed_events_follow_default_events(app, search_clear):
+    default_event = WorkflowEvent(submitters=[AuthenticatedUser()])
+    current_oarepo_workflows.caches.set("default_workflow_events", MappingProxyType({"D": default_event}))
+    current_oarepo_workflows.invalidate(
+        "workflow_allowed_events", "workflow_request_allowed_events", "workflow_events_by_key"
+    )
+    try:
+        assert current_oarepo_workflows.get_allowed_events("my_workflow", "req")["D"] is default_event
+        assert current_oarepo_workflows.get_workflow_event("my_workflow", "req", "D") is default_event
+        assert current_oarepo_workflows.get_workflow_request("my_workflow", "req").allowed_events["D"] is default_event
+    finally:
+        current_oarepo_workflows.invalidate(
+            "default_workflow_events",
+            "workflow_allowed_events",
+            "workflow_request_allowed_events",
+            "workflow_events_by_key",
+        )
+    # nothing has been left on the shared workflow request definition
+    assert "D" not in current_oarepo_workflows.get_allowed_events("my_workflow", "req")
+    assert "D" not in current_oarepo_workflows.get_workflow_request("my_workflow", "req").allowed_events